@@ -11,14 +11,14 @@ from discord.ext import commands
 from discord import app_commands
 from utils.utils import Utils
 from logger.logger import logger
-from database.service import DatabaseService
+from database.service import AsyncDatabaseService
 from utils.utils import DiscordUtils
 
 
 class ContributorCommandsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = DatabaseService()
+        self.db = AsyncDatabaseService()
 
     @app_commands.command(
         name="add_contributor", description="Add a contributor with their emoji"
@@ -28,20 +28,21 @@ class ContributorCommandsCog(commands.Cog):
     ):
         """Add a contributor with their emoji"""
         try:
-            await interaction.response.defer()
-
             if not await DiscordUtils.get_guild_member_check_role(interaction):
                 return
 
+            await interaction.response.defer()
+
             guild_id = interaction.guild_id
 
             logger.info(
                 f"Adding contributor {member.name} (ID: {member.id}) to guild {interaction.guild.name} (ID: {guild_id})"
             )
 
-            self.db.update_contributor_in_db(
+            await self.db.update_contributor_in_db(
                 guild_id=guild_id, uid=str(member.id), note=member.name, emoji_id=emoji
             )
+            self.bot.contributor_index.add(guild_id, str(member.id), emoji)
 
             await interaction.followup.send(
                 f"Contributor {member.mention} added successfully!"
@@ -57,23 +58,26 @@ class ContributorCommandsCog(commands.Cog):
     ):
         """Remove a contributor"""
         try:
-            await interaction.response.defer()
             if not await DiscordUtils.get_guild_member_check_role(interaction):
                 return
+            await interaction.response.defer()
 
             guild_id = interaction.guild_id
             logger.info(
                 f"Removing contributor {member.name} (ID: {member.id}) from guild {interaction.guild.name} (ID: {guild_id})"
             )
 
-            contributors = self.db.get_contributors_from_db(guild_id)
+            contributors = await self.db.get_contributors_from_db(guild_id)
             if not any(c.uid == str(member.id) for c in contributors):
                 await interaction.followup.send(
                     f"{member.mention} is not a contributor.", ephemeral=True
                 )
                 return
 
-            self.db.remove_contributor_from_db(guild_id=guild_id, uid=str(member.id))
+            await self.db.remove_contributor_from_db(
+                guild_id=guild_id, uid=str(member.id)
+            )
+            self.bot.contributor_index.remove(guild_id, str(member.id))
             await interaction.followup.send(
                 f"Contributor {member.mention} removed successfully!"
             )
@@ -92,7 +96,7 @@ class ContributorCommandsCog(commands.Cog):
                 f"Listing contributors for guild {interaction.guild.name} (ID: {guild_id})"
             )
 
-            contributors = self.db.get_contributors_from_db(guild_id)
+            contributors = await self.db.get_contributors_from_db(guild_id)
 
             if not contributors:
                 await interaction.followup.send("No contributors found.")
@@ -4,9 +4,12 @@ It contains the following commands:
 - list_events: Lists the events associated with this guild when the "list_events" command is invoked.
 - on_scheduled_event_create: Handles the "on_scheduled_event_create" event. This event is triggered when a new scheduled event is created.
 - on_message: Event triggered when a message is sent in a server the bot is in. This happens in the "on_message" event.
-- on_reaction_add: Event triggered when a reaction is added to a message in a sever the bot is in. This happens in the "on_reaction_add" event.
 - on_raw_reaction_add: Event triggered when a raw reaction is added to a message in a server the bot is in. This happens in the "on_raw_reaction_add" event.
+- on_raw_reaction_remove: Event triggered when a raw reaction is removed from a message in a server the bot is in. This happens in the "on_raw_reaction_remove" event.
 - on_member_join: Event triggered when a new member joins a server the bot is in. This happens in the "on_member_join" event.
+- on_guild_channel_create, on_guild_channel_update, on_guild_channel_delete, on_guild_remove: Keep the channel name index current.
+- on_member_update: Forget the cached roles of a member used for permission checks.
+- on_guild_role_create, on_guild_role_update, on_guild_role_delete: Refresh the rules message reaction role mapping and the cached core role.
 """
 
 import discord
@@ -16,8 +19,9 @@ from discord import app_commands
 from utils.utils import Utils
 from logger.logger import logger
 from events.event_operations import EventOperations
-from consts.constants import RULES_MESSAGE_ID
-from database.service import DatabaseService
+from database.service import AsyncDatabaseService
+from utils.channel_index import ChannelIndex
+from utils.permissions import PermissionCache
 
 
 class EventsCog(commands.Cog):
@@ -40,8 +44,8 @@ class EventsCog(commands.Cog):
         """
         logger.info(f"New scheduled event created: {event.name}")
         try:
-            db_service = DatabaseService()
-            db_service.save_event(event.id, event.guild_id, None, time.time())
+            db_service = AsyncDatabaseService()
+            await db_service.save_event(event.id, event.guild_id, None, time.time())
             await self.event_operations.notify_new_event(event, event.guild_id)
             logger.info(f"Successfully processed new event: {event.name}")
         except Exception as e:
@@ -62,32 +66,35 @@ class EventsCog(commands.Cog):
         await self.event_operations.handle_message(message)
 
     @commands.Cog.listener()
-    async def on_reaction_add(self, reaction: discord.Reaction, user: discord.User):
+    async def on_raw_reaction_add(self, payload):
         """
-        Event triggered when a reaction is added to a message in a sever the bot is in.
+        Event triggered when a raw reaction is added to a message in a server the bot is in.
+        Raw events fire whether or not the message is cached, so contributor notifications and rules message roles are handled here.
 
         Parameters:
-        self (EventCommandsCog): An instance of the EventCommandsCog class.
-        reaction (Reaction): The reaction that was added.
-        user (User): The user who added the reaction.
+        payload: The payload for the raw reaction add event.
 
         Returns:
+        None
         """
-        await self.event_operations.handle_reaction(reaction, user)
+        self.bot.vote_tally.apply(payload, 1)
+        self.bot.reaction_roles.handle(payload)
+        await self.event_operations.handle_raw_reaction(payload)
 
     @commands.Cog.listener()
-    async def on_raw_reaction_add(self, payload):
+    async def on_raw_reaction_remove(self, payload):
         """
-        Event triggered when a raw reaction is added to a message in a server the bot is in.
+        Event triggered when a raw reaction is removed from a message in a server the bot is in.
+        Keeps the live tally of ongoing votes current and removes rules message roles.
 
         Parameters:
-        payload: The payload for the raw reaction add event.
+        payload: The payload for the raw reaction remove event.
 
         Returns:
         None
         """
-        if payload.message_id == RULES_MESSAGE_ID:
-            await self.event_operations.process_reaction_add(payload)
+        self.bot.vote_tally.apply(payload, -1)
+        self.bot.reaction_roles.handle(payload)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
@@ -103,6 +110,46 @@ class EventsCog(commands.Cog):
         logger.info(f"New member: {member.name} has joined: {member.guild.name}")
         await self.event_operations.process_new_member(member)
 
+    @commands.Cog.listener()
+    async def on_guild_channel_create(self, channel: discord.abc.GuildChannel):
+        """Add a created channel to the channel name index"""
+        ChannelIndex.add(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_update(
+        self, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ):
+        """Follow renamed channels in the channel name index"""
+        ChannelIndex.update(before, after)
+
+    @commands.Cog.listener()
+    async def on_guild_channel_delete(self, channel: discord.abc.GuildChannel):
+        """Drop a deleted channel from the channel name index"""
+        ChannelIndex.remove(channel)
+
+    @commands.Cog.listener()
+    async def on_guild_role_create(self, role: discord.Role):
+        """Rebuild the reaction role mapping and core role of the guild on their next use"""
+        self.bot.reaction_roles.invalidate(role.guild.id)
+        PermissionCache.invalidate_roles(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        """Rebuild the reaction role mapping and core role of the guild on their next use"""
+        self.bot.reaction_roles.invalidate(after.guild.id)
+        PermissionCache.invalidate_roles(after.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_role_delete(self, role: discord.Role):
+        """Rebuild the reaction role mapping and core role of the guild on their next use"""
+        self.bot.reaction_roles.invalidate(role.guild.id)
+        PermissionCache.invalidate_roles(role.guild.id)
+
+    @commands.Cog.listener()
+    async def on_guild_remove(self, guild: discord.Guild):
+        """Forget the channel name index of a guild the bot left"""
+        ChannelIndex.forget_guild(guild.id)
+
     @app_commands.command(name="list_events")
     async def list_events(self, interaction: discord.Interaction):
         """
@@ -25,5 +25,7 @@ SETTINGS_MEMBERS = config.get(ENV, "SETTINGS_MEMBERS").split(",")
 SETTINGS_ADMINS = config.get(ENV, "SETTINGS_ADMINS").split(",")
 SETTINGS_STRATEGIES = config.get(ENV, "SETTINGS_STRATEGIES")
 SETTINGS_TOKEN_ADDRESSES = config.get(ENV, "SETTINGS_TOKEN_ADDRESSES").split(",")
+SUPPLY_REFRESH_INTERVAL = config.getint(ENV, "SUPPLY_REFRESH_INTERVAL", fallback=600)
+SUPPLY_MAX_AGE = config.getint(ENV, "SUPPLY_MAX_AGE", fallback=3600)
 
 IS_DEV = True if ENV == "DEV" else False
@@ -18,6 +18,9 @@ This is required when !v or !vote_draft command is invoked.
 
 RULES_MESSAGE_ID: The ID of the message that contains the rules/welcome message.
 
+RULES_CHANNEL_ID: The ID of the channel that contains the rules message. Optional; when it is None the channel is learned from
+the first reaction to the rules message and stored in the configs table.
+
 DISCORD_ROLE_TRIGGERS: A list of dictionaries. Each dictionary represents a role that can be assigned to a bloomer.
 Each dictionary contains the following keys:
 - 'name': The name of the role.
@@ -52,14 +55,15 @@ FALLBACK_GOVERNANCE_TALK_CHANNEL = "🌺│home"
 FALLBACK_GOVERNANCE_BUDGET_CHANNEL = "improvement-props"
 FALLBACK_GOVERNANCE_CHANNEL = "budgetary-props"
 
+# The proposal forums have no fallback: their fallback names are each other's forum, so a guild missing
+# one forum would get drafts posted into the other
 CONSTANT_FALLBACK_MAPPING = {
     GENERAL_CHANNEL: FALLBACK_GENERAL_CHANNEL,
-    GOVERNANCE_CHANNEL: FALLBACK_GOVERNANCE_CHANNEL,
-    GOVERNANCE_BUDGET_CHANNEL: FALLBACK_GOVERNANCE_BUDGET_CHANNEL,
     GOVERNANCE_TALK_CHANNEL: FALLBACK_GOVERNANCE_TALK_CHANNEL,
 }
 
 RULES_MESSAGE_ID = 1202059311681904661  # Set to ID of whatever message you want to be used as rules / to welcome a user
+RULES_CHANNEL_ID = None  # Optionally set to the ID of the channel containing RULES_MESSAGE_ID; learned from reactions otherwise
 DISCORD_ROLE_TRIGGERS = [
     {"name": "Client", "emoji_id": 1199583728129802322, "role": "Client Pod"},
     {
@@ -6,6 +6,7 @@ from sqlalchemy import (
     Boolean,
     BigInteger,
     JSON,
+    UniqueConstraint,
     create_engine,
 )
 from sqlalchemy.orm import declarative_base
@@ -91,6 +92,9 @@ class OngoingVote(Base):
     channel_id = Column(String)
     thread_id = Column(String)
     message_id = Column(String)
+    yes_count = Column(Integer, default=0)
+    no_count = Column(Integer, default=0)
+    abstain_count = Column(Integer, default=0)
 
 
 class ConcludedVote(Base):
@@ -109,3 +113,29 @@ class ConcludedVote(Base):
     passed = Column(Boolean)
     concluded_at = Column(BigInteger)
     snapshot_url = Column(String, nullable=True)
+
+
+class ScheduledJob(Base):
+    __tablename__ = "scheduled_jobs"
+
+    id = Column(Integer, primary_key=True)
+    job_key = Column(String, unique=True, nullable=True)
+    job_type = Column(String)
+    payload = Column(JSON)
+    run_at = Column(BigInteger)
+    attempts = Column(Integer, default=0)
+    created_at = Column(BigInteger)
+
+
+class OutboxEntry(Base):
+    __tablename__ = "outbox"
+    __table_args__ = (UniqueConstraint("proposal_id", "step"),)
+
+    id = Column(Integer, primary_key=True)
+    proposal_id = Column(String)
+    step = Column(String)
+    payload = Column(JSON)
+    run_at = Column(BigInteger)
+    attempts = Column(Integer, default=0)
+    last_error = Column(String, nullable=True)
+    created_at = Column(BigInteger)
@@ -1,7 +1,20 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from typing import Generator, List, Dict, Any, Optional
+from typing import Any, Callable, Dict, Generator, List, Optional
 from datetime import datetime
-from .models import SessionLocal, Config, Contributor, Event, OngoingVote, ConcludedVote
+from sqlalchemy import Integer, String, cast, update
+from .models import (
+    SessionLocal,
+    Config,
+    Contributor,
+    Event,
+    OngoingVote,
+    ConcludedVote,
+    ScheduledJob,
+    OutboxEntry,
+)
 from logger.logger import logger
 import time
 
@@ -20,6 +33,7 @@ class DatabaseService:
     def __init__(self, session=None):
         """Initialize with optional session for testing"""
         self._session = session
+        self._in_transaction = False
         logger.info(
             "DatabaseService initialized with %s",
             "test session" if session else "default session",
@@ -33,6 +47,52 @@ class DatabaseService:
         logger.debug("Creating new database session")
         return SessionLocal()
     
+    @contextmanager
+    def transaction(self) -> Generator["DatabaseService", None, None]:
+        """
+        Group several service operations into one session and one commit.
+
+            with db_service.transaction() as tx:
+                tx.save_concluded_vote(...)
+                tx.remove_ongoing_vote(proposal_id)
+
+        The yielded DatabaseService is bound to a single session; its methods flush instead of committing.
+        The transaction commits when the block exits and rolls back if it raises.
+        Inside a transaction, transaction() yields the same service.
+        """
+        if self._in_transaction:
+            yield self
+            return
+
+        session = self._get_session()
+        tx = DatabaseService(session=session)
+        tx._in_transaction = True
+        try:
+            yield tx
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def run_in_transaction(self, work: Callable[["DatabaseService"], Any]) -> Any:
+        """Run work(tx) inside transaction() and return its result"""
+        with self.transaction() as tx:
+            return work(tx)
+
+    def _commit(self, session) -> None:
+        if self._in_transaction:
+            session.flush()
+        else:
+            session.commit()
+
+    def _rollback(self, session) -> None:
+        # Inside a transaction the error propagates and transaction() rolls back everything
+        if not self._in_transaction:
+            session.rollback()
+
     def get_config(self) -> Dict[str, str]:
         """Get all config key-value pairs"""
         logger.info("Retrieving all config entries")
@@ -62,14 +122,60 @@ class DatabaseService:
                 config = Config(key=key, value=value)
                 session.add(config)
                 logger.info(f"Created new config entry for key: {key}")
-            session.commit()
+            self._commit(session)
         except Exception as e:
             logger.error(f"Error setting config {key}: {e}")
-            session.rollback()
+            self._rollback(session)
         finally:
             if self._session is None:
                 session.close()
 
+    def allocate_number(self, key: str) -> int:
+        """
+        Atomically take the next number from an integer config counter, such as "next_budget_id".
+
+        Returns:
+        int: The allocated number; the counter is left at the number after it.
+
+        Raises:
+        ValueError: If the counter is not set.
+        """
+        session = self._get_session()
+        try:
+            number = self._allocate_number(session, key)
+            self._commit(session)
+            return number
+        except Exception as e:
+            logger.error(f"Error allocating {key}: {e}")
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def _allocate_number(self, session, key: str) -> int:
+        """
+        Increment a counter in a single UPDATE and return its previous value.
+        The UPDATE locks the row until the transaction ends, so concurrent allocations get distinct numbers.
+        Dialects without UPDATE ... RETURNING read the value back inside the same transaction.
+        """
+        statement = (
+            update(Config)
+            .where(Config.key == key)
+            .values(value=cast(cast(Config.value, Integer) + 1, String))
+        )
+        if session.get_bind().dialect.update_returning:
+            value = session.execute(statement.returning(Config.value)).scalar()
+        elif session.execute(statement).rowcount:
+            value = session.query(Config.value).filter(Config.key == key).scalar()
+        else:
+            value = None
+
+        if value is None:
+            raise ValueError(f"{key} is not set")
+        logger.info(f"Allocated {key} {int(value) - 1}")
+        return int(value) - 1
+
     def get_ongoing_votes(self) -> Dict[str, Any]:
         """Get all ongoing votes"""
         logger.info("Retrieving all ongoing votes")
@@ -86,9 +192,9 @@ class DatabaseService:
                     "channel_id": vote.channel_id,
                     "thread_id": vote.thread_id,
                     "message_id": vote.message_id,
-                    "yes_count": getattr(vote, "yes_count", 0),
-                    "no_count": getattr(vote, "no_count", 0),
-                    "abstain_count": getattr(vote, "abstain_count", 0),
+                    "yes_count": vote.yes_count or 0,
+                    "no_count": vote.no_count or 0,
+                    "abstain_count": vote.abstain_count or 0,
                 }
             logger.info(f"Found {len(result)} ongoing votes")
             return result
@@ -118,8 +224,22 @@ class DatabaseService:
             "channel_id": vote.channel_id,
             "thread_id": vote.thread_id,
             "message_id": vote.message_id,
+            "yes_count": vote.yes_count or 0,
+            "no_count": vote.no_count or 0,
+            "abstain_count": vote.abstain_count or 0,
         }
 
+    def get_ongoing_vote_deadlines(self) -> Dict[str, int]:
+        """Get the end time of every ongoing vote without loading the drafts"""
+        logger.info("Retrieving ongoing vote deadlines")
+        session = self._get_session()
+        try:
+            rows = session.query(OngoingVote.proposal_id, OngoingVote.end_time).all()
+            return {proposal_id: end_time for proposal_id, end_time in rows}
+        finally:
+            if self._session is None:
+                session.close()
+
     def save_ongoing_vote(self, proposal_data: dict) -> None:
         """Save an ongoing vote to the database"""
         if not proposal_data or "proposal_id" not in proposal_data:
@@ -146,6 +266,9 @@ class DatabaseService:
                 existing_vote.channel_id = proposal_data.get("channel_id", "")
                 existing_vote.thread_id = proposal_data.get("thread_id", "")
                 existing_vote.message_id = proposal_data.get("message_id", "")
+                for count in ("yes_count", "no_count", "abstain_count"):
+                    if count in proposal_data:
+                        setattr(existing_vote, count, proposal_data[count])
                 logger.info("Updated existing ongoing vote")
             else:
                 vote = OngoingVote(
@@ -156,14 +279,40 @@ class DatabaseService:
                     channel_id=proposal_data.get("channel_id", ""),
                     thread_id=proposal_data.get("thread_id", ""),
                     message_id=proposal_data.get("message_id", ""),
+                    yes_count=proposal_data.get("yes_count", 0),
+                    no_count=proposal_data.get("no_count", 0),
+                    abstain_count=proposal_data.get("abstain_count", 0),
                 )
                 session.add(vote)
                 logger.info("Created new ongoing vote")
 
-            session.commit()
+            self._commit(session)
         except Exception as e:
             logger.error(f"Error saving ongoing vote: {e}")
-            session.rollback()
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def update_vote_tallies(self, tallies: Dict[str, Dict[str, int]]) -> None:
+        """Write the live vote counts of several ongoing votes"""
+        logger.info("Updating vote tallies for %d proposals", len(tallies))
+        session = self._get_session()
+        try:
+            for proposal_id, counts in tallies.items():
+                session.query(OngoingVote).filter_by(proposal_id=proposal_id).update(
+                    {
+                        OngoingVote.yes_count: counts["yes_count"],
+                        OngoingVote.no_count: counts["no_count"],
+                        OngoingVote.abstain_count: counts["abstain_count"],
+                    },
+                    synchronize_session=False,
+                )
+            self._commit(session)
+        except Exception as e:
+            logger.error("Error updating vote tallies: %s", str(e))
+            self._rollback(session)
             raise
         finally:
             if self._session is None:
@@ -187,7 +336,7 @@ class DatabaseService:
             event_id=event_id, guild_id=guild_id, posted_at=datetime.now().timestamp()
         )
         session.add(event)
-        session.commit()
+        self._commit(session)
         if self._session is None:
             session.close()
 
@@ -213,7 +362,7 @@ class DatabaseService:
                 event_id=event_id, guild_id=guild_id, notified_at=int(notified_at)
             )
             session.add(event)
-        session.commit()
+        self._commit(session)
         if self._session is None:
             session.close()
 
@@ -262,13 +411,13 @@ class DatabaseService:
                 concluded_at=int(time.time()),
             )
             session.add(concluded_vote)
-            session.commit()
+            self._commit(session)
             logger.info(
                 f"Successfully saved concluded vote for proposal {proposal_data['proposal_id']}"
             )
         except Exception as e:
             logger.error(f"Error saving concluded vote: {e}")
-            session.rollback()
+            self._rollback(session)
             raise
         finally:
             if self._session is None:
@@ -323,11 +472,11 @@ class DatabaseService:
                     server_name=str(guild_id), uid=uid, note=note, emoji_id=emoji_id
                 )
                 session.add(contributor)
-            session.commit()
+            self._commit(session)
             logger.info("Successfully updated contributor")
         except Exception as e:
             logger.error(f"Error updating contributor: {e}")
-            session.rollback()
+            self._rollback(session)
             raise
         finally:
             if self._session is None:
@@ -362,7 +511,7 @@ class DatabaseService:
                 return
 
             session.delete(contributor)
-            session.commit()
+            self._commit(session)
             logger.info(
                 f"Successfully removed contributor with uid={uid} from server={guild_id}"
             )
@@ -379,11 +528,233 @@ class DatabaseService:
         session = self._get_session()
         try:
             session.query(OngoingVote).filter_by(proposal_id=proposal_id).delete()
-            session.commit()
+            self._commit(session)
             logger.info("Successfully removed ongoing vote")
         except Exception as e:
             logger.error("Error removing ongoing vote: %s", str(e))
-            session.rollback()
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def conclude_vote(
+        self,
+        proposal_data: dict,
+        passed: bool,
+        outbox_steps: List[str],
+        outbox_payload: Optional[dict] = None,
+    ) -> None:
+        """
+        Archive an ongoing vote and queue its side effects in a single commit.
+        The concluded vote is saved, the ongoing vote removed and one outbox entry added per step.
+        Steps already queued for the proposal are left as they are.
+
+        Parameters:
+        proposal_data (dict): The ongoing vote, including its final counts.
+        passed (bool): Whether the vote passed.
+        outbox_steps (List[str]): The outbox steps to queue.
+        outbox_payload (Optional[dict]): Payload of the queued outbox entries.
+        """
+        proposal_id = proposal_data["proposal_id"]
+        logger.info("Concluding vote with proposal_id: %s", proposal_id)
+        with self.transaction() as tx:
+            if not tx.get_concluded_vote(proposal_id):
+                tx.save_concluded_vote(
+                    proposal_data=proposal_data,
+                    yes_count=proposal_data.get("yes_count", 0),
+                    no_count=proposal_data.get("no_count", 0),
+                    abstain_count=proposal_data.get("abstain_count", 0),
+                    passed=passed,
+                )
+            tx.remove_ongoing_vote(proposal_id)
+            tx.queue_outbox_steps(proposal_id, outbox_steps, outbox_payload)
+        logger.info(f"Successfully concluded vote for proposal {proposal_id}")
+
+    def queue_outbox_steps(
+        self, proposal_id: str, steps: List[str], payload: Optional[dict] = None
+    ) -> None:
+        """Add an outbox entry per step of a proposal, skipping steps that are already queued"""
+        session = self._get_session()
+        try:
+            now = int(time.time())
+            queued = {
+                entry.step
+                for entry in session.query(OutboxEntry).filter_by(
+                    proposal_id=proposal_id
+                )
+            }
+            for step in steps:
+                if step not in queued:
+                    session.add(
+                        OutboxEntry(
+                            proposal_id=proposal_id,
+                            step=step,
+                            payload=payload or {},
+                            run_at=now,
+                            attempts=0,
+                            created_at=now,
+                        )
+                    )
+            self._commit(session)
+        except Exception as e:
+            logger.error("Error queueing outbox steps: %s", str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def get_concluded_vote(self, proposal_id: str) -> Optional[Dict[str, Any]]:
+        """Get a single concluded vote by proposal ID"""
+        session = self._get_session()
+        try:
+            vote = (
+                session.query(ConcludedVote).filter_by(proposal_id=proposal_id).first()
+            )
+            if vote is None:
+                return None
+            return {
+                "proposal_id": vote.proposal_id,
+                "draft": vote.draft,
+                "title": vote.title,
+                "channel_id": vote.channel_id,
+                "thread_id": vote.thread_id,
+                "message_id": vote.message_id,
+                "yes_count": vote.yes_count,
+                "no_count": vote.no_count,
+                "abstain_count": vote.abstain_count,
+                "passed": vote.passed,
+                "concluded_at": vote.concluded_at,
+                "snapshot_url": vote.snapshot_url,
+            }
+        finally:
+            if self._session is None:
+                session.close()
+
+    def set_concluded_snapshot_url(self, proposal_id: str, snapshot_url: str) -> None:
+        """Record the Snapshot proposal URL of a concluded vote"""
+        session = self._get_session()
+        try:
+            session.query(ConcludedVote).filter_by(proposal_id=proposal_id).update(
+                {"snapshot_url": snapshot_url}
+            )
+            self._commit(session)
+        except Exception as e:
+            logger.error("Error saving snapshot URL: %s", str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def get_outbox_entries(self) -> List[Dict[str, Any]]:
+        """Get all pending outbox entries, earliest first"""
+        session = self._get_session()
+        try:
+            entries = session.query(OutboxEntry).order_by(OutboxEntry.run_at).all()
+            return [
+                {
+                    "proposal_id": entry.proposal_id,
+                    "step": entry.step,
+                    "payload": entry.payload,
+                    "run_at": entry.run_at,
+                    "attempts": entry.attempts,
+                    "last_error": entry.last_error,
+                }
+                for entry in entries
+            ]
+        finally:
+            if self._session is None:
+                session.close()
+
+    def retry_outbox_entry(
+        self, proposal_id: str, step: str, run_at: int, error: str
+    ) -> None:
+        """Record a failed attempt of an outbox entry and move it to run_at"""
+        session = self._get_session()
+        try:
+            entry = (
+                session.query(OutboxEntry)
+                .filter_by(proposal_id=proposal_id, step=step)
+                .first()
+            )
+            if entry:
+                entry.run_at = run_at
+                entry.attempts = (entry.attempts or 0) + 1
+                entry.last_error = error
+                self._commit(session)
+        except Exception as e:
+            logger.error("Error rescheduling outbox entry: %s", str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def allocate_outbox_number(self, proposal_id: str, step: str, key: str) -> int:
+        """
+        Allocate a number from a config counter for an outbox entry, once.
+        The number is stored as "proposal_number" in the entry's payload in the same commit,
+        so retries of the step get the same number.
+
+        Parameters:
+        proposal_id (str): The proposal of the outbox entry.
+        step (str): The step of the outbox entry.
+        key (str): Config key of the counter, e.g. "next_budget_id".
+
+        Returns:
+        int: The number of the entry.
+
+        Raises:
+        ValueError: If the outbox entry does not exist or the counter is not set.
+        """
+        with self.transaction() as tx:
+            session = tx._get_session()
+            entry = (
+                session.query(OutboxEntry)
+                .filter_by(proposal_id=proposal_id, step=step)
+                .first()
+            )
+            if entry is None:
+                raise ValueError(f"No outbox entry {step} for proposal {proposal_id}")
+            payload = dict(entry.payload or {})
+            if payload.get("proposal_number") is None:
+                payload["proposal_number"] = tx.allocate_number(key)
+                entry.payload = payload
+        return payload["proposal_number"]
+
+    def update_outbox_payload(self, proposal_id: str, step: str, payload: dict) -> None:
+        """Replace the payload of an outbox entry, e.g. to record progress of its step"""
+        session = self._get_session()
+        try:
+            entry = (
+                session.query(OutboxEntry)
+                .filter_by(proposal_id=proposal_id, step=step)
+                .first()
+            )
+            if entry:
+                entry.payload = dict(payload)
+                self._commit(session)
+        except Exception as e:
+            logger.error("Error updating outbox payload: %s", str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def remove_outbox_entry(self, proposal_id: str, step: str) -> None:
+        """Remove a completed or abandoned outbox entry"""
+        session = self._get_session()
+        try:
+            session.query(OutboxEntry).filter_by(
+                proposal_id=proposal_id, step=step
+            ).delete()
+            self._commit(session)
+        except Exception as e:
+            logger.error("Error removing outbox entry: %s", str(e))
+            self._rollback(session)
             raise
         finally:
             if self._session is None:
@@ -416,11 +787,104 @@ class DatabaseService:
                     notified_at=notified_at,
                 )
                 session.add(event)
-            session.commit()
+            self._commit(session)
             logger.info("Successfully saved event")
         except Exception as e:
             logger.error("Error saving event: %s", str(e))
-            session.rollback()
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def save_scheduled_job(
+        self,
+        job_type: str,
+        run_at: int,
+        payload: dict,
+        job_key: Optional[str] = None,
+    ) -> int:
+        """Save a delayed job, replacing any pending job with the same key. Returns the job ID"""
+        logger.info("Scheduling %s job to run at %s", job_type, run_at)
+        session = self._get_session()
+        try:
+            job = None
+            if job_key is not None:
+                job = session.query(ScheduledJob).filter_by(job_key=job_key).first()
+            if job:
+                logger.info("Rescheduling existing job %s", job_key)
+                job.job_type = job_type
+                job.payload = payload
+                job.run_at = run_at
+                job.attempts = 0
+            else:
+                job = ScheduledJob(
+                    job_key=job_key,
+                    job_type=job_type,
+                    payload=payload,
+                    run_at=run_at,
+                    attempts=0,
+                    created_at=int(time.time()),
+                )
+                session.add(job)
+            self._commit(session)
+            return job.id
+        except Exception as e:
+            logger.error("Error saving scheduled job: %s", str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def get_scheduled_jobs(self) -> List[Dict[str, Any]]:
+        """Get all pending delayed jobs, earliest first"""
+        logger.info("Getting scheduled jobs")
+        session = self._get_session()
+        try:
+            jobs = session.query(ScheduledJob).order_by(ScheduledJob.run_at).all()
+            return [
+                {
+                    "id": job.id,
+                    "job_key": job.job_key,
+                    "job_type": job.job_type,
+                    "payload": job.payload,
+                    "run_at": job.run_at,
+                    "attempts": job.attempts,
+                }
+                for job in jobs
+            ]
+        finally:
+            if self._session is None:
+                session.close()
+
+    def reschedule_job(self, job_id: int, run_at: int) -> None:
+        """Move a pending job to a new run time after a failed attempt"""
+        session = self._get_session()
+        try:
+            job = session.query(ScheduledJob).filter_by(id=job_id).first()
+            if job:
+                job.run_at = run_at
+                job.attempts = (job.attempts or 0) + 1
+                self._commit(session)
+        except Exception as e:
+            logger.error("Error rescheduling job %s: %s", job_id, str(e))
+            self._rollback(session)
+            raise
+        finally:
+            if self._session is None:
+                session.close()
+
+    def remove_scheduled_job(self, job_id: int) -> None:
+        """Remove a completed or abandoned job"""
+        logger.info("Removing scheduled job %s", job_id)
+        session = self._get_session()
+        try:
+            session.query(ScheduledJob).filter_by(id=job_id).delete()
+            self._commit(session)
+        except Exception as e:
+            logger.error("Error removing scheduled job: %s", str(e))
+            self._rollback(session)
             raise
         finally:
             if self._session is None:
@@ -451,104 +915,120 @@ class DatabaseService:
     def migrate_contributors(self, contributors_data: dict) -> int:
         """Migrate contributors from JSON to database"""
         logger.info("Migrating contributors")
-        session = self._get_session()
         try:
-            session.query(Contributor).delete()
-            session.commit()
+            with self.transaction() as tx:
+                session = tx._get_session()
+                session.query(Contributor).delete()
 
-            total_migrated = 0
-            if not contributors_data.get("servers"):
-                logger.warning("No valid contributors data found")
-                return 0
-
-            for server_id, server_data in contributors_data["servers"].items():
-                emoji_dict = server_data.get("emoji_dictionary", {})
-                for contributor in server_data.get("contributors", []):
-                    emoji_id = None
-                    for emoji, uid in emoji_dict.items():
-                        if uid == contributor["uid"]:
-                            emoji_id = emoji
-                            break
-
-                    new_contributor = Contributor(
-                        uid=contributor["uid"],
-                        note=contributor["note"],
-                        server_name=server_id,
-                        emoji_id=emoji_id,
-                    )
-                    session.add(new_contributor)
-                    total_migrated += 1
+                total_migrated = 0
+                if not contributors_data.get("servers"):
+                    logger.warning("No valid contributors data found")
+                    return 0
+
+                for server_id, server_data in contributors_data["servers"].items():
+                    emoji_dict = server_data.get("emoji_dictionary", {})
+                    for contributor in server_data.get("contributors", []):
+                        emoji_id = None
+                        for emoji, uid in emoji_dict.items():
+                            if uid == contributor["uid"]:
+                                emoji_id = emoji
+                                break
+
+                        new_contributor = Contributor(
+                            uid=contributor["uid"],
+                            note=contributor["note"],
+                            server_name=server_id,
+                            emoji_id=emoji_id,
+                        )
+                        session.add(new_contributor)
+                        total_migrated += 1
 
-            session.commit()
             logger.info(f"Successfully migrated {total_migrated} contributors")
             return total_migrated
         except Exception as e:
             logger.error(f"Error migrating contributors: {e}")
-            session.rollback()
             return 0
-        finally:
-            if self._session is None:
-                session.close()
 
     def migrate_events(self, events_data: dict) -> int:
         """Migrate events from JSON to database"""
         logger.info("Migrating events")
-        session = self._get_session()
         try:
-            session.query(Event).delete()
-            session.commit()
+            with self.transaction() as tx:
+                session = tx._get_session()
+                session.query(Event).delete()
 
-            total_migrated = 0
-            for event_id, event_data in events_data.items():
-                new_event = Event(
-                    event_id=int(event_id),
-                    guild_id=event_data.get("guild_id", 0),
-                    posted_at=event_data.get("posted_at"),
-                    notified_at=event_data.get("notified_at"),
-                )
-                session.add(new_event)
-                total_migrated += 1
+                total_migrated = 0
+                for event_id, event_data in events_data.items():
+                    new_event = Event(
+                        event_id=int(event_id),
+                        guild_id=event_data.get("guild_id", 0),
+                        posted_at=event_data.get("posted_at"),
+                        notified_at=event_data.get("notified_at"),
+                    )
+                    session.add(new_event)
+                    total_migrated += 1
 
-            session.commit()
             logger.info(f"Successfully migrated {total_migrated} events")
             return total_migrated
         except Exception as e:
             logger.error(f"Error migrating events: {e}")
-            session.rollback()
             raise
-        finally:
-            if self._session is None:
-                session.close()
 
     def migrate_ongoing_votes(self, votes_data: dict) -> int:
         """Migrate ongoing votes from JSON to database"""
         logger.info("Migrating ongoing votes")
-        session = self._get_session()
         try:
-            session.query(OngoingVote).delete()
-            session.commit()
+            with self.transaction() as tx:
+                session = tx._get_session()
+                session.query(OngoingVote).delete()
 
-            total_migrated = 0
-            for proposal_id, vote_data in votes_data.items():
-                new_vote = OngoingVote(
-                    proposal_id=proposal_id,
-                    draft=vote_data.get("draft", {}),
-                    end_time=vote_data.get("end_time", 0),
-                    title=vote_data.get("title", ""),
-                    channel_id=vote_data.get("channel_id", ""),
-                    thread_id=vote_data.get("thread_id", ""),
-                    message_id=vote_data.get("message_id", ""),
-                )
-                session.add(new_vote)
-                total_migrated += 1
+                total_migrated = 0
+                for proposal_id, vote_data in votes_data.items():
+                    new_vote = OngoingVote(
+                        proposal_id=proposal_id,
+                        draft=vote_data.get("draft", {}),
+                        end_time=vote_data.get("end_time", 0),
+                        title=vote_data.get("title", ""),
+                        channel_id=vote_data.get("channel_id", ""),
+                        thread_id=vote_data.get("thread_id", ""),
+                        message_id=vote_data.get("message_id", ""),
+                    )
+                    session.add(new_vote)
+                    total_migrated += 1
 
-            session.commit()
             logger.info(f"Successfully migrated {total_migrated} ongoing votes")
             return total_migrated
         except Exception as e:
             logger.error(f"Error migrating ongoing votes: {e}")
-            session.rollback()
             raise
-        finally:
-            if self._session is None:
-                session.close()
+
+
+# Sized to the engine's base connection pool so queued calls wait here rather than on pool checkout
+_db_executor = ThreadPoolExecutor(max_workers=5, thread_name_prefix="db")
+
+
+class AsyncDatabaseService:
+    """
+    Async facade over DatabaseService.
+
+    Exposes the same methods as DatabaseService as coroutines. Each call runs the blocking
+    SQLAlchemy work on a dedicated thread pool so database latency never stalls the event loop.
+    """
+
+    def __init__(self, session=None):
+        """Initialize with optional session for testing"""
+        self._service = DatabaseService(session=session)
+
+    def __getattr__(self, name: str):
+        method = getattr(self._service, name)
+        if name.startswith("_") or not callable(method):
+            raise AttributeError(name)
+
+        @functools.wraps(method)
+        async def run_in_executor(*args, **kwargs):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                _db_executor, functools.partial(method, *args, **kwargs)
+            )
+
+        return run_in_executor
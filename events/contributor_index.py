@@ -0,0 +1,131 @@
+"""
+The ContributorIndex class keeps an in-memory, per-guild index of contributor emojis.
+Each guild's contributors are loaded from the database once, and the index is updated in place
+when contributors are added or removed, so message and reaction handlers never query the database per event.
+"""
+
+import re
+from typing import Dict, Iterable, Optional, Pattern, Set
+
+from database.models import Contributor
+from database.service import AsyncDatabaseService
+from logger.logger import logger
+
+
+class ContributorIndex:
+    def __init__(self):
+        # guild_id -> {emoji_id: {uid, ...}}
+        self._emojis: Dict[int, Dict[str, Set[str]]] = {}
+        # guild_id -> compiled alternation of every emoji in the guild
+        self._patterns: Dict[int, Optional[Pattern]] = {}
+
+    @staticmethod
+    def may_contain_emoji(content: str) -> bool:
+        """
+        Cheap prefilter for message content.
+        Custom emojis are rendered as <:name:id> or <a:name:id>, and unicode emojis are never ASCII,
+        so content without either cannot match any contributor emoji.
+        """
+        return "<" in content or not content.isascii()
+
+    def is_loaded(self, guild_id: int) -> bool:
+        return guild_id in self._emojis
+
+    async def load_guild(
+        self, guild_id: int, contributors: Optional[Iterable[Contributor]] = None
+    ) -> None:
+        """
+        (Re)build the index for a guild.
+
+        Parameters:
+        guild_id (int): The ID of the guild.
+        contributors (Optional[Iterable[Contributor]]): Contributors to index. Read from the database when omitted.
+        """
+        if contributors is None:
+            contributors = await AsyncDatabaseService().get_contributors_from_db(
+                guild_id
+            )
+
+        emojis: Dict[str, Set[str]] = {}
+        for contributor in contributors:
+            if contributor.emoji_id:
+                emojis.setdefault(contributor.emoji_id, set()).add(str(contributor.uid))
+
+        self._emojis[guild_id] = emojis
+        self._compile(guild_id)
+        logger.info(f"Indexed {len(emojis)} contributor emojis for guild {guild_id}")
+
+    def add(self, guild_id: int, uid: str, emoji_id: str) -> None:
+        """Add or replace the emoji of a contributor in an already loaded guild"""
+        if not self.is_loaded(guild_id):
+            return
+        self._discard_uid(guild_id, uid)
+        if emoji_id:
+            self._emojis[guild_id].setdefault(emoji_id, set()).add(str(uid))
+        self._compile(guild_id)
+
+    def remove(self, guild_id: int, uid: str) -> None:
+        """Remove a contributor from an already loaded guild"""
+        if not self.is_loaded(guild_id):
+            return
+        self._discard_uid(guild_id, uid)
+        self._compile(guild_id)
+
+    async def match(self, guild_id: int, content: str) -> Set[str]:
+        """
+        Find the contributors whose emoji appears in the content.
+
+        Parameters:
+        guild_id (int): The ID of the guild the content was posted in.
+        content (str): The message content.
+
+        Returns:
+        Set[str]: The UIDs of the matched contributors.
+        """
+        if not self.may_contain_emoji(content):
+            return set()
+        if not self.is_loaded(guild_id):
+            await self.load_guild(guild_id)
+
+        pattern = self._patterns.get(guild_id)
+        if pattern is None:
+            return set()
+
+        emojis = self._emojis[guild_id]
+        uids: Set[str] = set()
+        for emoji_id in set(pattern.findall(content)):
+            uids.update(emojis.get(emoji_id, ()))
+        return uids
+
+    async def lookup(self, guild_id: int, emoji_id: str) -> Set[str]:
+        """
+        Find the contributors that own an emoji.
+
+        Parameters:
+        guild_id (int): The ID of the guild.
+        emoji_id (str): The emoji, as rendered by str(emoji).
+
+        Returns:
+        Set[str]: The UIDs of the contributors that own the emoji.
+        """
+        if not self.is_loaded(guild_id):
+            await self.load_guild(guild_id)
+        return set(self._emojis[guild_id].get(emoji_id, ()))
+
+    def _discard_uid(self, guild_id: int, uid: str) -> None:
+        emojis = self._emojis[guild_id]
+        for emoji_id in list(emojis):
+            emojis[emoji_id].discard(str(uid))
+            if not emojis[emoji_id]:
+                del emojis[emoji_id]
+
+    def _compile(self, guild_id: int) -> None:
+        emojis = self._emojis[guild_id]
+        if not emojis:
+            self._patterns[guild_id] = None
+            return
+        # Longest first so an emoji never shadows a longer one that contains it
+        alternatives = sorted(emojis, key=len, reverse=True)
+        self._patterns[guild_id] = re.compile(
+            "|".join(re.escape(emoji_id) for emoji_id in alternatives)
+        )
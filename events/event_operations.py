@@ -3,35 +3,30 @@ The "EventOperations" class is responsible for handling event operations.
 Refer to the classes functions for more information on what they do.
 """
 
-import requests
-import asyncio
-import os
+import time
 import discord
-from consts.constants import (
-    GENERAL_CHANNEL,
-    RULES_MESSAGE_ID,
-    DISCORD_ROLE_TRIGGERS,
-    COLLAB_LAND_CHANNEL,
-    START_HERE_CHANNEL,
-)
+from consts.constants import GENERAL_CHANNEL
 from utils.utils import DiscordUtils
+from utils.outbound import Priority
 from datetime import datetime, timezone
-from typing import List, Optional, Any
-from discord import ScheduledEvent, Reaction, User
-from discord.utils import get
+from typing import Any, Dict, List
+from discord import ScheduledEvent
 from discord.ext import commands
 from logger.logger import logger
-from database.service import DatabaseService
+from events.contributor_index import ContributorIndex
 
 
 class EventOperations:
+    ANNOUNCE_NEW_EVENT_JOB = "announce_new_event"
+    NEW_EVENT_ANNOUNCEMENT_DELAY = 30 * 60
+
     def __init__(self, bot: commands.Bot):
         self.bot = bot
 
     def format_event(self, event: ScheduledEvent, guild_id: int) -> str:
         """
         Formats the event message and returns it.
-        Invoked by notify_new_event.
+        Invoked by announce_new_event and check_events.
 
         Parameters:
         event (ScheduledEvent): The event to be formatted.
@@ -51,72 +46,75 @@ class EventOperations:
         )
         return formatted_event
 
-    def get_guild_scheduled_event_users(
+    async def get_guild_scheduled_event_users(
         self,
         guild_id: int,
         scheduled_event_id: int,
-        limit: int = 100,
         with_member: bool = False,
-        before: Optional[str] = None,
-        after: Optional[str] = None,
-    ) -> Optional[List[Any]]:
+    ) -> List[Dict[str, Any]]:
         """
-        Get the users interested in a scheduled event.
+        Get all users interested in a scheduled event.
 
         Parameters:
         guild_id (int): The ID of the guild in which the event was created.
         scheduled_event_id (int): The ID of the event.
-        limit (int): The maximum number of users to be returned.
+        with_member (bool): Whether to include guild member data for each user.
 
         Returns:
-        Optional[List[Any]]: The list of users interested in the event.
+        List[Dict[str, Any]]: The users interested in the event.
         """
-        url = f"https://discord.com/api/v10/guilds/{guild_id}/scheduled-events/{scheduled_event_id}/users"
-        params = {
-            "limit": limit,
-            "with_member": with_member,
-            "before": before,
-            "after": after,
-        }
-        headers = {"Authorization": f'Bot {os.getenv("DISCORD_BOT_TOKEN")}'}
-        response = requests.get(url, params=params, headers=headers)
-
-        if response.status_code == 200:
-            return response.json()
-        else:
-            logger.error(f"Error: {response.status_code} - {response.text}")
-            return None
+        return await self.bot.scheduled_event_users.get_users(
+            guild_id, scheduled_event_id, with_member
+        )
 
     async def notify_new_event(self, event: ScheduledEvent, guild_id: int) -> None:
         """
-        Notify the General channel about the newly created event after a short delay.
+        Schedule an announcement of the newly created event in the General channel after a delay.
+        The announcement is stored as a scheduled job, so it survives restarts and nothing waits in the meantime.
         """
         logger.info(
             f"Starting notify_new_event for event {event.name} in guild {guild_id}"
         )
-        guild = self.bot.get_guild(guild_id)
+        await self.bot.job_scheduler.schedule(
+            self.ANNOUNCE_NEW_EVENT_JOB,
+            time.time() + self.NEW_EVENT_ANNOUNCEMENT_DELAY,
+            {"guild_id": guild_id, "event_id": event.id},
+            job_key=f"{self.ANNOUNCE_NEW_EVENT_JOB}:{event.id}",
+        )
 
-        if guild:
-            logger.info(f"Found guild {guild.name}, waiting 60 seconds...")
-            await asyncio.sleep(30 * 60)
-            event = await guild.fetch_scheduled_event(event.id)
-            formatted_event = self.format_event(event, guild_id)
-            logger.info(f"Formatted event message: {formatted_event}")
+    async def announce_new_event(self, payload: Dict[str, Any]) -> None:
+        """
+        Post a newly created event to the General channel.
+        Invoked by the job scheduler once the announcement delay has passed.
 
-            try:
-                channel = await DiscordUtils.get_channel_by_name(guild, GENERAL_CHANNEL)
-                if channel:
-                    logger.info(f"Found channel {channel.name}, sending message...")
-                    await channel.send(
-                        f"🌺 **__Newly Created Event__** 🌺 \n{formatted_event}"
-                    )
-                    logger.info("Event notification sent successfully")
-                else:
-                    logger.error(f"Channel not found in guild {guild.name}")
-            except Exception as e:
-                logger.error(f"Cannot post newly created event to Discord, Error: {e}")
-        else:
+        Parameters:
+        payload (Dict[str, Any]): The job payload holding the guild_id and event_id.
+        """
+        guild_id = payload["guild_id"]
+        guild = self.bot.get_guild(guild_id)
+        if not guild:
             logger.error(f"Guild not found: {guild_id}")
+            return
+
+        try:
+            event = await guild.fetch_scheduled_event(payload["event_id"])
+        except discord.NotFound:
+            logger.info(
+                f"Event {payload['event_id']} was deleted before it was announced"
+            )
+            return
+
+        formatted_event = self.format_event(event, guild_id)
+        logger.info(f"Formatted event message: {formatted_event}")
+
+        channel = await DiscordUtils.get_channel_by_name(guild, GENERAL_CHANNEL)
+        logger.info(f"Found channel {channel.name}, sending message...")
+        await self.bot.outbound.send(
+            channel,
+            f"🌺 **__Newly Created Event__** 🌺 \n{formatted_event}",
+            Priority.REMINDER,
+        )
+        logger.info("Event notification sent successfully")
 
     async def fetch_upcoming_events(self, guild):
         """
@@ -139,30 +137,10 @@ class EventOperations:
 
     async def process_new_member(self, member: discord.Member) -> None:
         """
-        Sends a welcome message to a new member in the welcome channel.
+        Queues a welcome message for a new member.
+        Members joining within a few seconds of each other are welcomed together in the welcome channel.
         """
-        try:
-            welcome_channel = await DiscordUtils.get_channel_by_name(
-                member.guild, GENERAL_CHANNEL
-            )
-            collab_land_join_channel = await DiscordUtils.get_channel_by_name(
-                member.guild, COLLAB_LAND_CHANNEL
-            )
-            start_here_channel = await DiscordUtils.get_channel_by_name(
-                member.guild, START_HERE_CHANNEL
-            )
-
-            await welcome_channel.send(
-                f" 🌺 Welcome {member.mention}  to {member.guild.name}! We are pleased to have you here 🌺\n"
-                "\n"
-                "Take a moment to read and agree to the rules before you get started!"
-                "\n"
-                f"If you are an existing aXP, bXP, or uXP Hodler, please head over to <#{collab_land_join_channel.id}> to verify your wallet in order to receive your respective role! \n"
-                "\n"
-                f"Refer to <#{start_here_channel.id}> for more details about the studio!"
-            )
-        except Exception as e:
-            logger.error(f"Error sending welcome message: {str(e)}")
+        self.bot.welcome_batcher.add(member)
 
     async def handle_message(self, message: discord.Message) -> None:
         """
@@ -183,78 +161,43 @@ class EventOperations:
         if message.author == self.bot.user:
             return
 
-        contributors = DatabaseService.get_contributors_from_db(message.guild.id)
-        logger.info("Checking message content for contributor emojis")
-
-        for contributor in contributors:
-            if not contributor.emoji_id:
-                continue
+        if not message.guild or not ContributorIndex.may_contain_emoji(message.content):
+            return
 
-            emoji_matches = contributor.emoji_id in message.content and str(
-                contributor.uid
-            ) != str(message.author.id)
+        matched_uids = await self.bot.contributor_index.match(
+            message.guild.id, message.content
+        )
 
-            if not emoji_matches:
+        for uid in matched_uids:
+            if uid == str(message.author.id):
                 continue
 
-            try:
-                logger.info(f"Found match! Messaging user {contributor.uid}")
-                message_link = message.jump_url
-                user = await self.bot.fetch_user(int(contributor.uid))
-                if user:
-                    await DiscordUtils.send_dm_once(self.bot, user, message_link)
-            except discord.errors.NotFound:
-                logger.warning(f"User not found: {contributor.uid}")
-
-    async def handle_reaction(self, reaction: Reaction, user: User) -> None:
+            logger.info(f"Found match! Messaging user {uid}")
+            DiscordUtils.send_dm_once(self.bot, int(uid), message.jump_url)
+
+    async def handle_raw_reaction(
+        self, payload: discord.RawReactionActionEvent
+    ) -> None:
         """
-        Handles a new reaction in the server.
-        If a contributor's emoji is found, a DM is sent to them.
+        Handles a new raw reaction in the server.
+        If a contributor's emoji is used, a DM is sent to them.
+        Raw events fire for uncached messages too, and the jump URL is built from the payload
+        so no message fetch or database query happens per reaction.
 
         Parameters:
-        reaction (Reaction): The new reaction.
-        user (User): The user who added the reaction.
+        payload (RawReactionActionEvent): The payload for the reaction add event.
         """
-        contributors = DatabaseService.get_contributors_from_db(
-            reaction.message.guild.id
+        if payload.guild_id is None or payload.user_id == self.bot.user.id:
+            return
+
+        matched_uids = await self.bot.contributor_index.lookup(
+            payload.guild_id, str(payload.emoji)
         )
 
-        for contributor in contributors:
-            if str(reaction.emoji) != contributor.emoji_id or str(
-                contributor.uid
-            ) == str(user.id):
+        for uid in matched_uids:
+            if uid == str(payload.user_id):
                 continue
 
-            try:
-                logger.info(f"Found match! Messaging user {contributor.uid}")
-                message_link = reaction.message.jump_url
-                contributor_user = await self.bot.fetch_user(int(contributor.uid))
-
-                if contributor_user:
-                    await DiscordUtils.send_dm_once(
-                        self.bot, contributor_user, message_link
-                    )
-            except discord.errors.NotFound:
-                logger.warning(f"User not found: {contributor.uid}")
-
-    async def process_reaction_add(self, payload) -> None:
-        """
-        Process a reaction add event.
-        If the reaction is added to the rules message, assign the corresponding role.
-
-        Parameters:
-        payload: The payload for the reaction add event.
-        """
-        if payload.message_id == RULES_MESSAGE_ID:
-            guild = self.bot.get_guild(payload.guild_id)
-            if guild:
-                member = guild.get_member(payload.user_id)
-                if member:
-                    role_name = DISCORD_ROLE_TRIGGERS.get(str(payload.emoji))
-                    if role_name:
-                        role = get(guild.roles, name=role_name)
-                        if role:
-                            await member.add_roles(role)
-                            logger.info(
-                                f"Added role {role_name} to member {member.name}"
-                            )
+            logger.info(f"Found match! Messaging user {uid}")
+            message_link = f"https://discord.com/channels/{payload.guild_id}/{payload.channel_id}/{payload.message_id}"
+            DiscordUtils.send_dm_once(self.bot, int(uid), message_link)
@@ -0,0 +1,239 @@
+"""
+The ReactionRoles class assigns the roles in DISCORD_ROLE_TRIGGERS when members react to the rules message,
+and removes them when the reaction is removed.
+
+Emoji IDs are mapped to role IDs once per guild, raw reaction events are used so no member cache is needed,
+and role changes are applied by a single background worker that collapses repeated changes for the same
+member and role and spaces out its API calls. reconcile() applies reactions added while the bot was offline,
+skipping members who already have the role. It needs the rules channel: RULES_CHANNEL_ID if set, otherwise the
+channel of the first rules message reaction seen, which is stored in the configs table for later starts.
+"""
+
+import asyncio
+from typing import Dict, Optional, Set, Tuple
+
+import discord
+from discord.ext import commands
+
+from consts.constants import DISCORD_ROLE_TRIGGERS, RULES_CHANNEL_ID, RULES_MESSAGE_ID
+from database.service import AsyncDatabaseService
+from logger.logger import logger
+
+# (guild_id, user_id, role_id)
+RoleChange = Tuple[int, int, int]
+
+
+class ReactionRoles:
+    BATCH_SIZE = 50
+    APPLY_INTERVAL = 0.25
+    RECONCILE_CONCURRENCY = 3
+
+    # emoji_id -> role name
+    ROLE_NAMES: Dict[int, str] = {
+        trigger["emoji_id"]: trigger["role"] for trigger in DISCORD_ROLE_TRIGGERS
+    }
+
+    # Config key under which the rules channel learned from reactions is stored
+    RULES_CHANNEL_CONFIG_KEY = "rules_channel_id"
+
+    def __init__(
+        self, bot: commands.Bot, db_service: Optional[AsyncDatabaseService] = None
+    ):
+        self.bot = bot
+        self.db_service = db_service or AsyncDatabaseService()
+        self._rules_channel_id: Optional[int] = RULES_CHANNEL_ID
+        self._reconciled = False
+        self._learn_task: Optional[asyncio.Task] = None
+        # guild_id -> {emoji_id: role_id}
+        self._role_ids: Dict[int, Dict[int, int]] = {}
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker: Optional[asyncio.Task] = None
+
+    def invalidate(self, guild_id: int) -> None:
+        """Forget the emoji to role mapping of a guild after its roles changed"""
+        self._role_ids.pop(guild_id, None)
+
+    def role_id_for(self, guild: discord.Guild, emoji_id: int) -> Optional[int]:
+        """Return the ID of the role assigned for an emoji in a guild"""
+        if guild.id not in self._role_ids:
+            roles_by_name = {role.name: role.id for role in guild.roles}
+            self._role_ids[guild.id] = {
+                emoji: roles_by_name[name]
+                for emoji, name in self.ROLE_NAMES.items()
+                if name in roles_by_name
+            }
+            missing = set(self.ROLE_NAMES.values()) - set(roles_by_name)
+            if missing:
+                logger.error(f"Roles not found in guild {guild.id}: {missing}")
+        return self._role_ids[guild.id].get(emoji_id)
+
+    def handle(self, payload: discord.RawReactionActionEvent) -> None:
+        """
+        Queue the role change for a raw reaction add or remove event on the rules message.
+
+        Parameters:
+        payload (RawReactionActionEvent): The payload for the reaction event.
+        """
+        if payload.message_id != RULES_MESSAGE_ID or payload.guild_id is None:
+            return
+        if payload.channel_id != self._rules_channel_id:
+            self._rules_channel_id = payload.channel_id
+            self._learn_task = asyncio.create_task(
+                self._learn_rules_channel(payload.channel_id)
+            )
+        if payload.emoji.id not in self.ROLE_NAMES:
+            return
+
+        guild = self.bot.get_guild(payload.guild_id)
+        if guild is None:
+            return
+        role_id = self.role_id_for(guild, payload.emoji.id)
+        if role_id is None:
+            return
+
+        add = payload.event_type == "REACTION_ADD"
+        if add and payload.member is not None:
+            if payload.member.bot or payload.member.get_role(role_id):
+                return
+        self.enqueue((payload.guild_id, payload.user_id, role_id), add)
+
+    def enqueue(self, change: RoleChange, add: bool) -> None:
+        """Queue adding (add=True) or removing a role of a member"""
+        self._queue.put_nowait((change, add))
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            changes: Dict[RoleChange, bool] = {}
+            change, add = await self._queue.get()
+            changes[change] = add
+            while len(changes) < self.BATCH_SIZE and not self._queue.empty():
+                change, add = self._queue.get_nowait()
+                # Only the latest change for a member and role matters
+                changes[change] = add
+
+            for change, add in changes.items():
+                await self._apply(change, add)
+                await asyncio.sleep(self.APPLY_INTERVAL)
+
+    async def _apply(self, change: RoleChange, add: bool) -> None:
+        guild_id, user_id, role_id = change
+        try:
+            if add:
+                await self.bot.http.add_role(
+                    guild_id, user_id, role_id, reason="Rules message reaction"
+                )
+            else:
+                await self.bot.http.remove_role(
+                    guild_id, user_id, role_id, reason="Rules message reaction removed"
+                )
+            logger.info(
+                f"{'Added' if add else 'Removed'} role {role_id} for member {user_id}"
+            )
+        except discord.HTTPException as e:
+            logger.error(
+                f"Error {'adding' if add else 'removing'} role {role_id} for member {user_id}: {e}"
+            )
+
+    async def _learn_rules_channel(self, channel_id: int) -> None:
+        """Store the rules channel seen on a reaction and reconcile, if that could not happen at startup"""
+        await self.db_service.set_config(self.RULES_CHANNEL_CONFIG_KEY, str(channel_id))
+        await self.reconcile()
+
+    async def find_rules_message(self) -> Optional[discord.Message]:
+        """
+        Fetch the rules message from RULES_CHANNEL_ID, or from the rules channel stored from reactions.
+        Returns None while the channel is not known.
+        """
+        if self._rules_channel_id is None:
+            stored = (await self.db_service.get_config()).get(
+                self.RULES_CHANNEL_CONFIG_KEY
+            )
+            self._rules_channel_id = int(stored) if stored else None
+        if self._rules_channel_id is None:
+            logger.info(
+                "The rules channel is not known yet; it is learned from the first reaction to the rules message"
+            )
+            return None
+
+        channel = self.bot.get_channel(self._rules_channel_id)
+        if channel is None:
+            logger.error(f"Rules channel {self._rules_channel_id} not found")
+            return None
+        try:
+            return await channel.fetch_message(RULES_MESSAGE_ID)
+        except discord.HTTPException as e:
+            logger.error(f"Unable to fetch the rules message: {e}")
+            return None
+
+    async def reconcile(self) -> None:
+        """
+        Page through the reactions on the rules message and queue the roles that members
+        who reacted while the bot was offline do not have yet. Runs once per process.
+        """
+        if self._reconciled:
+            return
+        self._reconciled = True
+        message = await self.find_rules_message()
+        if message is None or message.guild is None:
+            self._reconciled = False
+            logger.info(
+                "Rules message not found; skipping reaction role reconciliation"
+            )
+            return
+
+        guild = message.guild
+        semaphore = asyncio.Semaphore(self.RECONCILE_CONCURRENCY)
+        # user_id -> IDs of the roles the user reacted for
+        reactors: Dict[int, Set[int]] = {}
+
+        async def collect_reactors(reaction: discord.Reaction) -> None:
+            role_id = self.role_id_for(guild, getattr(reaction.emoji, "id", None))
+            if role_id is None:
+                return
+            async with semaphore:
+                async for user in reaction.users(limit=None):
+                    if not user.bot:
+                        reactors.setdefault(user.id, set()).add(role_id)
+
+        async def queue_missing_roles(user_id: int, role_ids: Set[int]) -> int:
+            async with semaphore:
+                member = await self._get_member(guild, user_id)
+            if member is None:
+                return 0
+            missing = [role_id for role_id in role_ids if not member.get_role(role_id)]
+            for role_id in missing:
+                self.enqueue((guild.id, user_id, role_id), True)
+            return len(missing)
+
+        results = await asyncio.gather(
+            *(collect_reactors(reaction) for reaction in message.reactions),
+            return_exceptions=True,
+        )
+        results += await asyncio.gather(
+            *(
+                queue_missing_roles(user_id, role_ids)
+                for user_id, role_ids in reactors.items()
+            ),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Error reconciling rules message reactions: {result}")
+        logger.info(
+            f"Queued {sum(r for r in results if isinstance(r, int))} role changes from the rules message"
+        )
+
+    @staticmethod
+    async def _get_member(
+        guild: discord.Guild, user_id: int
+    ) -> Optional[discord.Member]:
+        """Get a member from the cache or the API. Returns None if the user left the guild"""
+        member = guild.get_member(user_id)
+        if member is not None:
+            return member
+        try:
+            return await guild.fetch_member(user_id)
+        except discord.NotFound:
+            return None
@@ -0,0 +1,102 @@
+"""
+The ScheduledEventUsersClient class fetches the users interested in guild scheduled events.
+
+Requests go through the bot's own HTTP client, so they reuse its pooled session and rate limit handling
+instead of blocking the event loop. Every page of interested users is followed, several events can be
+fetched concurrently under a semaphore, and results are cached per event for a short time.
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Tuple
+
+from discord.ext import commands
+
+from logger.logger import logger
+
+
+class ScheduledEventUsersClient:
+    PAGE_SIZE = 100
+
+    def __init__(self, bot: commands.Bot, concurrency: int = 4, ttl: float = 600):
+        """
+        Parameters:
+        bot (commands.Bot): The bot whose HTTP client is used.
+        concurrency (int): Maximum number of events fetched at the same time.
+        ttl (float): Seconds a fetched user list is served from the cache.
+        """
+        self.bot = bot
+        self.ttl = ttl
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._cache: Dict[Tuple[int, int], Tuple[float, List[Dict[str, Any]]]] = {}
+
+    async def get_users(
+        self, guild_id: int, scheduled_event_id: int, with_member: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Get every user interested in a scheduled event.
+
+        Parameters:
+        guild_id (int): The ID of the guild in which the event was created.
+        scheduled_event_id (int): The ID of the event.
+        with_member (bool): Whether to include guild member data for each user.
+
+        Returns:
+        List[Dict[str, Any]]: The interested users, as Discord user objects.
+        """
+        key = (guild_id, scheduled_event_id)
+        cached = self._cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        async with self._semaphore:
+            users = await self._fetch_all(guild_id, scheduled_event_id, with_member)
+
+        self._cache[key] = (time.monotonic() + self.ttl, users)
+        return users
+
+    async def get_users_for_events(
+        self, guild_id: int, scheduled_event_ids: Iterable[int]
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        """
+        Get the interested users of several events concurrently.
+        Events whose users cannot be fetched map to an empty list.
+
+        Parameters:
+        guild_id (int): The ID of the guild in which the events were created.
+        scheduled_event_ids (Iterable[int]): The IDs of the events.
+
+        Returns:
+        Dict[int, List[Dict[str, Any]]]: The interested users of each event.
+        """
+        scheduled_event_ids = list(scheduled_event_ids)
+        results = await asyncio.gather(
+            *(self.get_users(guild_id, event_id) for event_id in scheduled_event_ids),
+            return_exceptions=True,
+        )
+
+        users_by_event = {}
+        for event_id, result in zip(scheduled_event_ids, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching users for event {event_id}: {result}")
+                result = []
+            users_by_event[event_id] = result
+        return users_by_event
+
+    async def _fetch_all(
+        self, guild_id: int, scheduled_event_id: int, with_member: bool
+    ) -> List[Dict[str, Any]]:
+        users = []
+        after = 0
+        while True:
+            page = await self.bot.http.get_scheduled_event_users(
+                guild_id,
+                scheduled_event_id,
+                limit=self.PAGE_SIZE,
+                with_member=with_member,
+                after=after,
+            )
+            users.extend(entry["user"] for entry in page)
+            if len(page) < self.PAGE_SIZE:
+                return users
+            after = page[-1]["user"]["id"]
@@ -0,0 +1,111 @@
+"""
+The WelcomeBatcher class collects members joining a guild for a short window and welcomes them together,
+so a burst of joins results in a few welcome messages instead of one per member.
+"""
+
+import asyncio
+from typing import Dict, List
+
+import discord
+from discord.ext import commands
+
+from consts.constants import COLLAB_LAND_CHANNEL, GENERAL_CHANNEL, START_HERE_CHANNEL
+from logger.logger import logger
+from utils.channel_index import ChannelIndex
+from utils.outbound import Priority
+
+MESSAGE_LIMIT = 2000
+
+
+class WelcomeBatcher:
+    def __init__(self, bot: commands.Bot, window: float = 5.0):
+        """
+        Parameters:
+        bot (commands.Bot): The bot instance.
+        window (float): Seconds to collect joins of a guild before welcoming them.
+        """
+        self.bot = bot
+        self.window = window
+        self._pending: Dict[int, List[discord.Member]] = {}
+        self._timers: Dict[int, asyncio.TimerHandle] = {}
+
+    def add(self, member: discord.Member) -> None:
+        """Queue a new member to be welcomed with the other members joining the same guild"""
+        guild_id = member.guild.id
+        self._pending.setdefault(guild_id, []).append(member)
+        if guild_id not in self._timers:
+            loop = asyncio.get_running_loop()
+            self._timers[guild_id] = loop.call_later(
+                self.window, lambda: asyncio.create_task(self.flush(guild_id))
+            )
+
+    @staticmethod
+    def format_welcomes(
+        guild_name: str,
+        mentions: List[str],
+        collab_land_channel_id: int,
+        start_here_channel_id: int,
+    ) -> List[str]:
+        """
+        Format the welcome messages for a batch of members, splitting the mentions so each message fits
+        in Discord's message length limit.
+
+        Returns:
+        List[str]: The messages to send.
+        """
+        prefix = " 🌺 Welcome "
+        suffix = (
+            f"  to {guild_name}! We are pleased to have you here 🌺\n"
+            "\n"
+            "Take a moment to read and agree to the rules before you get started!"
+            "\n"
+            f"If you are an existing aXP, bXP, or uXP Hodler, please head over to <#{collab_land_channel_id}> to verify your wallet in order to receive your respective role! \n"
+            "\n"
+            f"Refer to <#{start_here_channel_id}> for more details about the studio!"
+        )
+        budget = MESSAGE_LIMIT - len(prefix) - len(suffix)
+
+        messages = []
+        chunk: List[str] = []
+        length = 0
+        for mention in mentions:
+            added = len(mention) + (2 if chunk else 0)
+            if chunk and length + added > budget:
+                messages.append(prefix + ", ".join(chunk) + suffix)
+                chunk, length, added = [], 0, len(mention)
+            chunk.append(mention)
+            length += added
+        if chunk:
+            messages.append(prefix + ", ".join(chunk) + suffix)
+        return messages
+
+    async def flush(self, guild_id: int) -> None:
+        """Welcome the members that joined a guild during the last window"""
+        self._timers.pop(guild_id, None)
+        members = self._pending.pop(guild_id, [])
+        if not members:
+            return
+
+        guild = members[0].guild
+        try:
+            welcome_channel = ChannelIndex.get(guild, GENERAL_CHANNEL)
+            collab_land_join_channel = ChannelIndex.get(guild, COLLAB_LAND_CHANNEL)
+            start_here_channel = ChannelIndex.get(guild, START_HERE_CHANNEL)
+            if not (
+                welcome_channel and collab_land_join_channel and start_here_channel
+            ):
+                raise ValueError(f"Welcome channels not found in guild {guild.name}")
+
+            messages = self.format_welcomes(
+                guild.name,
+                [member.mention for member in members],
+                collab_land_join_channel.id,
+                start_here_channel.id,
+            )
+            for message in messages:
+                await self.bot.outbound.send(welcome_channel, message, Priority.WELCOME)
+            logger.info(
+                f"Welcomed {len(members)} new members to {guild.name} in {len(messages)} messages"
+            )
+        except Exception as e:
+            logger.error(f"Error sending welcome message: {str(e)}")
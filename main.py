@@ -1,5 +1,5 @@
 """
-This module contains the main class for the bot, which sets up the bot with intents, loads the contributors, emoji dicts, 
+This module contains the main class for the bot, which sets up the bot with intents, loads the contributors, emoji dicts,
 and posted events, loads the cogs, sets up commands and events for the bot, and then starts the bot.
 """
 
@@ -8,12 +8,25 @@ import os
 import asyncio
 from discord.ext import commands
 from tasks.tasks import TaskManager
-from utils.utils import Utils
+from tasks.scheduler import JobScheduler
+from tasks.outbox import ConclusionOutbox
+from utils.utils import Utils, SnapshotUtils
+from utils.snapshot_sidecar import SnapshotSidecar
+from utils.supply_cache import SupplyCache
+import config.config as cfg
+from utils.notifications import DMNotifier
+from utils.user_cache import UserCache
+from utils.outbound import OutboundQueue
 from cogs.contributors import ContributorCommandsCog
 from cogs.events import EventsCog
 from cogs.help import HelpCommandCog
 from cogs.gov import GovCommandsCog
 from database.service import DatabaseService
+from events.contributor_index import ContributorIndex
+from events.scheduled_event_users import ScheduledEventUsersClient
+from events.reaction_roles import ReactionRoles
+from events.welcome_batcher import WelcomeBatcher
+from proposals.vote_tally import VoteTally
 from logger.logger import logger
 
 
@@ -27,6 +40,25 @@ class Bot:
 
         db_service = DatabaseService()
         self.bot.ongoing_votes = db_service.get_ongoing_votes()
+        self.bot.contributor_index = ContributorIndex()
+        self.bot.user_cache = UserCache(self.bot)
+        self.bot.dm_notifier = DMNotifier(self.bot)
+        self.bot.scheduled_event_users = ScheduledEventUsersClient(self.bot)
+        self.bot.job_scheduler = JobScheduler(self.bot)
+        self.bot.outbox = ConclusionOutbox()
+        self.bot.vote_tally = VoteTally(self.bot)
+        self.bot.reaction_roles = ReactionRoles(self.bot)
+        self.bot.outbound = OutboundQueue()
+        self.bot.rpc_endpoints = Utils.rpc_endpoints()
+        self.bot.supply_cache = SupplyCache(
+            Utils.fetch_XP_supply_at_block,
+            refresh_interval=cfg.SUPPLY_REFRESH_INTERVAL,
+            max_age=cfg.SUPPLY_MAX_AGE,
+        )
+        self.bot.snapshot = SnapshotSidecar(
+            ["node", "./snapshot/sidecar.js"], env=SnapshotUtils.snapshot_env()
+        )
+        self.bot.welcome_batcher = WelcomeBatcher(self.bot)
 
         @self.bot.event
         async def on_ready():
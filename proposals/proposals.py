@@ -11,7 +11,10 @@ from typing import Any, Dict, List
 
 import consts.constants as constants
 import config.config as cfg
-from database.service import DatabaseService
+from database.service import AsyncDatabaseService
+from tasks.tasks import TaskManager
+from proposals.vote_tally import VoteTally
+from utils.channel_index import ChannelIndex
 from logger.logger import logger
 
 
@@ -34,7 +37,7 @@ class ProposalManager:
             else constants.GOVERNANCE_CHANNEL
         )
 
-        channel = discord.utils.get(guild.channels, name=channel_name)
+        channel = ChannelIndex.get(guild, channel_name)
         if not isinstance(channel, discord.ForumChannel):
             logger.error(f"Channel not found or not a forum channel: {channel_name}")
             return None
@@ -86,7 +89,8 @@ class ProposalManager:
                 await created_thread.message.reply(message)
 
             vote_message = await created_thread.message.reply(
-                f"**{constants.YES_VOTE} Adopt**\n\n**{constants.NO_VOTE} Reassess**\n\n**{constants.ABSTAIN_VOTE} Abstain**\n\nVote will conclude in 48h from now."
+                f"**{constants.YES_VOTE} Adopt**\n\n**{constants.NO_VOTE} Reassess**\n\n**{constants.ABSTAIN_VOTE} Abstain**\n\nVote will conclude in 48h from now.",
+                embed=VoteTally.build_embed(formatted_title, VoteTally.empty_counts()),
             )
 
             proposal_id = str(created_thread.message.id)
@@ -99,9 +103,18 @@ class ProposalManager:
                 "message_id": str(vote_message.id),
             }
 
-            db_service = DatabaseService()
+            db_service = AsyncDatabaseService()
             proposal_data["proposal_id"] = proposal_id
-            db_service.save_ongoing_vote(proposal_data)
+            await db_service.save_ongoing_vote(proposal_data)
+            bot.vote_tally.register(
+                proposal_id,
+                vote_message.id,
+                created_thread.thread.id,
+                formatted_title,
+            )
+            TaskManager.schedule_vote_conclusion(
+                proposal_id, proposal_data["end_time"]
+            )
 
             await ProposalManager.react_to_vote(
                 vote_message.id,
@@ -137,12 +150,12 @@ class ProposalManager:
             logger.error(f"Error: Guild with id {guild_id} not found.")
             return
 
-        channel = discord.utils.get(guild.channels, name=channel_name)
+        channel = ChannelIndex.get(guild, channel_name)
         if not channel:
             logger.error(f"Error: Channel with name {channel_name} not found.")
             return
 
-        thread = discord.utils.get(channel.threads, id=thread_id)
+        thread = channel.get_thread(thread_id)
         if not thread:
             logger.error(f"Error: Thread with id {thread_id} not found.")
             return
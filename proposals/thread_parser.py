@@ -80,14 +80,14 @@ class ThreadParser:
 
     @staticmethod
     async def convert_mentions_to_usernames(bot: commands.Bot, content: str) -> str:
-        """Convert Discord mention IDs to usernames"""
+        """Convert Discord mention IDs to usernames, resolving users through the shared user cache"""
         mention_pattern = r"<@!?(\d+)>"
         mentions = re.finditer(mention_pattern, content)
 
         for mention in mentions:
             user_id = int(mention.group(1))
             try:
-                user = await bot.fetch_user(user_id)
+                user = await bot.user_cache.get_user(user_id)
                 content = content.replace(mention.group(0), user.name)
             except:
                 # If we can't fetch the user, leave the mention as is
@@ -0,0 +1,196 @@
+"""
+The VoteTally class keeps live vote counts for ongoing proposals.
+
+Counts are updated in memory from raw reaction add/remove events on registered vote messages,
+flushed to the ongoing_votes table periodically, and shown in an embed on the vote message whose
+edits are debounced. The tally serves the embed and the periodic flush; when a vote is concluded its counts
+are taken from the vote message once more, so reactions missed while the gateway was disconnected still count.
+"""
+
+import asyncio
+from typing import Dict, Optional, Set
+
+import discord
+from discord.ext import commands
+
+from consts.constants import ABSTAIN_VOTE, NO_VOTE, YES_VOTE
+from database.service import AsyncDatabaseService
+from logger.logger import logger
+
+VOTE_COUNTS = {
+    YES_VOTE: "yes_count",
+    NO_VOTE: "no_count",
+    ABSTAIN_VOTE: "abstain_count",
+}
+
+
+class VoteTally:
+    EDIT_DEBOUNCE = 15.0
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # vote message_id -> proposal_id
+        self._proposals_by_message: Dict[int, str] = {}
+        # proposal_id -> {"thread_id": int, "message_id": int, "title": str}
+        self._votes: Dict[str, Dict] = {}
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._dirty: Set[str] = set()
+        self._pending_edits: Dict[str, asyncio.TimerHandle] = {}
+
+    @staticmethod
+    def empty_counts() -> Dict[str, int]:
+        return {count: 0 for count in VOTE_COUNTS.values()}
+
+    @staticmethod
+    def build_embed(title: str, counts: Dict[str, int]) -> discord.Embed:
+        """Build the live tally embed shown on a vote message"""
+        embed = discord.Embed(title=f"Live tally: {title}")
+        embed.add_field(name=f"{YES_VOTE} Adopt", value=counts["yes_count"])
+        embed.add_field(name=f"{NO_VOTE} Reassess", value=counts["no_count"])
+        embed.add_field(name=f"{ABSTAIN_VOTE} Abstain", value=counts["abstain_count"])
+        return embed
+
+    def register(
+        self,
+        proposal_id: str,
+        message_id: int,
+        thread_id: int,
+        title: str,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> None:
+        """Start tallying reactions on a vote message"""
+        self._proposals_by_message[int(message_id)] = proposal_id
+        self._votes[proposal_id] = {
+            "message_id": int(message_id),
+            "thread_id": int(thread_id),
+            "title": title,
+        }
+        tally = self.empty_counts()
+        tally.update({key: counts.get(key) or 0 for key in tally} if counts else {})
+        self._counts[proposal_id] = tally
+
+    def unregister(self, proposal_id: str) -> None:
+        """Stop tallying a concluded vote"""
+        vote = self._votes.pop(proposal_id, None)
+        if vote:
+            self._proposals_by_message.pop(vote["message_id"], None)
+        self._counts.pop(proposal_id, None)
+        self._dirty.discard(proposal_id)
+        handle = self._pending_edits.pop(proposal_id, None)
+        if handle:
+            handle.cancel()
+
+    def get(self, proposal_id: str) -> Optional[Dict[str, int]]:
+        """Return a copy of the current counts of a vote, if it is being tallied"""
+        counts = self._counts.get(proposal_id)
+        return dict(counts) if counts is not None else None
+
+    async def counts_for(self, proposal_id: str, vote: Dict) -> Dict[str, int]:
+        """
+        Return the final counts of a vote, reconciled with the reactions on its vote message.
+        Votes that are not tallied yet, such as ones inserted by scripts/recreate_vote.py, are registered first.
+        If the message cannot be fetched, the live tally is returned.
+        """
+        if proposal_id not in self._counts:
+            self.register(
+                proposal_id, vote["message_id"], vote["thread_id"], vote["title"], vote
+            )
+        await self._reconcile(proposal_id)
+        return self.get(proposal_id)
+
+    async def load(self) -> None:
+        """
+        Register every ongoing vote, then reconcile the counts with the reactions on each vote message
+        once, so reactions added or removed while the bot was offline are not lost.
+        """
+        ongoing_votes = await AsyncDatabaseService().get_ongoing_votes()
+        for proposal_id, vote in ongoing_votes.items():
+            self.register(
+                proposal_id,
+                vote["message_id"],
+                vote["thread_id"],
+                vote["title"],
+                vote,
+            )
+
+        await asyncio.gather(
+            *(self._reconcile(proposal_id) for proposal_id in ongoing_votes)
+        )
+        logger.info(f"Tallying {len(ongoing_votes)} ongoing votes")
+
+    def apply(self, payload: discord.RawReactionActionEvent, delta: int) -> None:
+        """
+        Apply a raw reaction add (+1) or remove (-1) event to the tally.
+        Events on messages that are not registered votes are ignored.
+        """
+        proposal_id = self._proposals_by_message.get(payload.message_id)
+        if proposal_id is None or payload.user_id == self.bot.user.id:
+            return
+
+        count = VOTE_COUNTS.get(str(payload.emoji))
+        if count is None:
+            return
+
+        counts = self._counts[proposal_id]
+        counts[count] = max(0, counts[count] + delta)
+        self._dirty.add(proposal_id)
+        self._schedule_edit(proposal_id)
+
+    async def flush(self) -> None:
+        """Write the counts of votes that changed since the last flush to the database"""
+        if not self._dirty:
+            return
+        tallies = {
+            proposal_id: dict(self._counts[proposal_id])
+            for proposal_id in self._dirty
+            if proposal_id in self._counts
+        }
+        self._dirty.clear()
+        try:
+            await AsyncDatabaseService().update_vote_tallies(tallies)
+        except Exception:
+            self._dirty.update(tallies)
+            raise
+
+    def _schedule_edit(self, proposal_id: str) -> None:
+        if proposal_id in self._pending_edits:
+            return
+        loop = asyncio.get_running_loop()
+        self._pending_edits[proposal_id] = loop.call_later(
+            self.EDIT_DEBOUNCE,
+            lambda: asyncio.create_task(self._edit(proposal_id)),
+        )
+
+    async def _edit(self, proposal_id: str) -> None:
+        self._pending_edits.pop(proposal_id, None)
+        vote = self._votes.get(proposal_id)
+        if vote is None:
+            return
+        try:
+            channel = self.bot.get_partial_messageable(vote["thread_id"])
+            message = channel.get_partial_message(vote["message_id"])
+            await message.edit(
+                embed=self.build_embed(vote["title"], self._counts[proposal_id])
+            )
+        except discord.HTTPException as e:
+            logger.error(f"Error updating live tally for {proposal_id}: {e}")
+
+    async def _reconcile(self, proposal_id: str) -> None:
+        vote = self._votes[proposal_id]
+        try:
+            channel = self.bot.get_partial_messageable(vote["thread_id"])
+            message = await channel.fetch_message(vote["message_id"])
+        except discord.HTTPException as e:
+            logger.error(f"Unable to reconcile tally for {proposal_id}: {e}")
+            return
+
+        counts = self.empty_counts()
+        for reaction in message.reactions:
+            count = VOTE_COUNTS.get(str(reaction.emoji))
+            if count:
+                counts[count] = reaction.count - (1 if reaction.me else 0)
+
+        if counts != self._counts[proposal_id]:
+            self._counts[proposal_id] = counts
+            self._dirty.add(proposal_id)
+            self._schedule_edit(proposal_id)
@@ -1,12 +1,37 @@
 #!/usr/bin/env python3
+from sqlalchemy import inspect, text
 from database.models import SessionLocal, Base, Config, engine
 from logger.logger import logger
 
+# Columns added to existing tables after their first release; create_all does not alter tables
+ADDED_COLUMNS = {
+    "ongoing_votes": {
+        "yes_count": "INTEGER DEFAULT 0",
+        "no_count": "INTEGER DEFAULT 0",
+        "abstain_count": "INTEGER DEFAULT 0",
+    },
+}
+
+
+def add_missing_columns():
+    """Add columns introduced after a table was first created"""
+    inspector = inspect(engine)
+    with engine.begin() as connection:
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {column["name"] for column in inspector.get_columns(table)}
+            for column, definition in columns.items():
+                if column not in existing:
+                    logger.info(f"Adding column {table}.{column}")
+                    connection.execute(
+                        text(f"ALTER TABLE {table} ADD COLUMN {column} {definition}")
+                    )
+
 
 def init_db():
     """Initialize database tables"""
     logger.info("Initializing database tables")
     Base.metadata.create_all(bind=engine)
+    add_missing_columns()
 
     db = SessionLocal()
 
@@ -10,9 +10,10 @@ from typing import Optional
 
 import consts.constants as constants
 import config.config as cfg
-from database.service import DatabaseService
+from database.service import AsyncDatabaseService
 from logger.logger import logger
 from proposals.thread_parser import ThreadParser
+from utils.user_cache import UserCache
 
 
 class VoteReconstructor:
@@ -20,6 +21,7 @@ class VoteReconstructor:
         intents = discord.Intents.default()
         intents.message_content = True
         self.bot = commands.Bot(command_prefix="!", intents=intents)
+        self.bot.user_cache = UserCache(self.bot)
         self.token = bot_token
 
         @self.bot.event
@@ -123,10 +125,13 @@ class VoteReconstructor:
             logger.info(f"Message ID: {proposal_data['message_id']}")
 
             # Save to database
-            db_service = DatabaseService()
-            db_service.save_ongoing_vote(proposal_data)
+            db_service = AsyncDatabaseService()
+            await db_service.save_ongoing_vote(proposal_data)
 
             logger.info(f"Successfully reconstructed vote for thread {thread_id}")
+            logger.info(
+                "The running bot schedules the conclusion on its next deadline sweep"
+            )
             return True
 
         except Exception as e:
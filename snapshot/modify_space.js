@@ -5,6 +5,9 @@
  * The ETH_PRIVATE_KEY is the private key of the account that will modify the space settings.
  * The PRIMARY_RPC is the primary RPC URL used for submitting the space settings.
  * The SECONDARY_RPC is the secondary RPC URL used as a fallback if the primary RPC fails.
+ *
+ * Run directly, the quorum value is read from the first command line argument: node modify_space.js <quorum>
+ * Required as a module, it exports modifySpace(quorumValue), which sidecar.js uses.
  */
 
 const { ethers } = require('ethers');
@@ -31,8 +34,6 @@ const settingsStrategies = JSON.parse(process.env.SETTINGS_STRATEGIES);
 const maxRetries = 3;
 const initialRetryDelay = 5000;
 
-const quorumValue = parseInt(process.argv[2], 10);
-
 async function submitSpaceSettings(providerRpc, quorumValue) {
   try {
     const provider = new ethers.providers.JsonRpcProvider(providerRpc);
@@ -101,7 +102,12 @@ function delay(ms) {
   return new Promise(resolve => setTimeout(resolve, ms));
 }
 
-async function modifySpace() {
+/**
+ * Updates the space settings with a new quorum, retrying with both RPC endpoints
+ * @param {number} quorumValue - The new quorum value
+ * @returns {boolean} Whether the settings were updated
+ */
+async function modifySpace(quorumValue) {
   let attempt = 0;
   let success = false;
   let retryDelay = initialRetryDelay;
@@ -130,6 +136,11 @@ async function modifySpace() {
   if (!success) {
     console.error('Failed to update space settings after multiple attempts with both RPC endpoints');
   }
+  return success;
+}
+
+if (require.main === module) {
+  modifySpace(parseInt(process.argv[2], 10)).catch(console.error);
 }
 
-modifySpace().catch(console.error);
+module.exports = modifySpace;
@@ -0,0 +1,80 @@
+/**
+ * This is a long-lived process serving the Snapshot operations of modify_space.js and snapshot.js,
+ * so the bot does not pay Node startup and module loading on every call.
+ *
+ * It speaks line-delimited JSON over stdin/stdout. Each request is a single line:
+ *   {"id": 1, "op": "modify_space", "params": {"quorum": 123}}
+ *   {"id": 2, "op": "create_proposal", "params": {"title": "...", "body": "...", "choices": ["Adopt", "Reassess", "Abstain"]}}
+ * and is answered with a single line carrying the same id:
+ *   {"id": 1, "ok": true, "result": true}
+ *   {"id": 2, "ok": false, "error": "..."}
+ *
+ * stdout is reserved for responses; anything the Snapshot code logs is written to stderr.
+ * It is started and supervised by utils/snapshot_sidecar.py.
+ */
+const readline = require('readline');
+
+// Keep stdout for protocol lines only
+const writeResponse = process.stdout.write.bind(process.stdout);
+console.log = console.error;
+console.info = console.error;
+
+const modifySpace = require('./modify_space.js');
+const createProposal = require('./snapshot.js');
+
+const operations = {
+  modify_space: params => modifySpace(parseInt(params.quorum, 10)),
+  create_proposal: params => createProposal(params.title, params.body, params.choices),
+};
+
+function respond(response) {
+  writeResponse(JSON.stringify(response) + '\n');
+}
+
+async function handle(line) {
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    console.error('Invalid request:', line);
+    return;
+  }
+
+  const operation = operations[request.op];
+  if (!operation) {
+    respond({ id: request.id, ok: false, error: `Unknown operation: ${request.op}` });
+    return;
+  }
+
+  try {
+    const result = await operation(request.params || {});
+    respond({ id: request.id, ok: true, result: result === undefined ? null : result });
+  } catch (error) {
+    respond({ id: request.id, ok: false, error: error instanceof Error ? error.message : String(error) });
+  }
+}
+
+// Exit once stdin is closed and the operations in flight have been answered
+const inFlight = new Set();
+let closed = false;
+
+const input = readline.createInterface({ input: process.stdin });
+input.on('line', line => {
+  if (!line.trim()) {
+    return;
+  }
+  const operation = handle(line);
+  inFlight.add(operation);
+  operation.finally(() => {
+    inFlight.delete(operation);
+    if (closed && inFlight.size === 0) {
+      process.exit(0);
+    }
+  });
+});
+input.on('close', () => {
+  closed = true;
+  if (inFlight.size === 0) {
+    process.exit(0);
+  }
+});
@@ -0,0 +1,156 @@
+"""
+outbox contains the ConclusionOutbox class, which runs the side effects of concluded votes.
+
+Concluding a vote archives it and inserts one outbox row per side effect (creating the Snapshot proposal,
+posting the result to the vote thread and to the general channel) in a single commit. The outbox then runs
+each step from the outbox table, retrying failures with backoff, so a crash or a failed Snapshot call only
+repeats the step that did not finish. Steps of a proposal run in STEPS order, so result posts can include the
+Snapshot URL. Handlers must be idempotent: a step is repeated if the bot stops between running it and
+removing its row. A handler gets the same payload dict on every attempt in this process; progress it needs to
+survive a restart is written back with update_outbox_payload. At most MAX_CONCURRENT_STEPS steps run at once and
+each attempt is bounded by STEP_TIMEOUT, so a hung Snapshot call is retried instead of holding up other votes.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from database.service import AsyncDatabaseService
+from logger.logger import logger
+from tasks.scheduler import DeadlineTimer
+
+
+class ConclusionOutbox:
+    SNAPSHOT_PROPOSAL = "snapshot_proposal"
+    POST_THREAD_RESULT = "post_thread_result"
+    POST_GENERAL_RESULT = "post_general_result"
+    STEPS = (SNAPSHOT_PROPOSAL, POST_THREAD_RESULT, POST_GENERAL_RESULT)
+
+    MAX_ATTEMPTS = 8
+    RETRY_DELAY = 60
+    MAX_RETRY_DELAY = 60 * 60
+    MAX_CONCURRENT_STEPS = 3
+    STEP_TIMEOUT = 10 * 60
+
+    def __init__(self, db_service: Optional[AsyncDatabaseService] = None):
+        self.db_service = db_service or AsyncDatabaseService()
+        self._handlers: Dict[str, Callable[[str, Dict[str, Any]], Awaitable[None]]] = {}
+        self._entries: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._timer = DeadlineTimer(self._run_step)
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_STEPS)
+        self.completed = 0
+        self.abandoned = 0
+
+    def register(
+        self, step: str, handler: Callable[[str, Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        """
+        Register the coroutine function that runs a step.
+
+        Parameters:
+        step (str): One of STEPS.
+        handler (Callable): Coroutine function invoked with the proposal ID and the entry payload.
+        """
+        self._handlers[step] = handler
+
+    async def load(self) -> None:
+        """Pick up outbox entries from the database that are not being tracked yet"""
+        entries = await self.db_service.get_outbox_entries()
+        new = [
+            entry
+            for entry in entries
+            if (entry["proposal_id"], entry["step"]) not in self._entries
+        ]
+        for entry in new:
+            self._entries[(entry["proposal_id"], entry["step"])] = entry
+        for entry in new:
+            self._schedule(entry)
+        if new:
+            logger.info(f"Loaded {len(new)} outbox entries")
+
+    def pending(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "pending": len(self._entries),
+            "completed": self.completed,
+            "abandoned": self.abandoned,
+        }
+
+    def _blocked(self, proposal_id: str, step: str) -> bool:
+        """Whether an earlier step of the same proposal is still pending"""
+        earlier = self.STEPS[: self.STEPS.index(step)]
+        return any((proposal_id, other) in self._entries for other in earlier)
+
+    def _schedule(self, entry: Dict[str, Any]) -> None:
+        if not self._blocked(entry["proposal_id"], entry["step"]):
+            self._timer.schedule((entry["proposal_id"], entry["step"]), entry["run_at"])
+
+    def _release(self, proposal_id: str) -> None:
+        """Schedule the steps of a proposal that were waiting for an earlier one"""
+        for step in self.STEPS:
+            entry = self._entries.get((proposal_id, step))
+            if entry is not None:
+                self._schedule(entry)
+
+    async def _run_step(self, key: Hashable) -> None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return
+        proposal_id, step = key
+        if self._blocked(proposal_id, step):
+            return
+
+        handler = self._handlers.get(step)
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for {step}")
+            if entry.get("payload") is None:
+                entry["payload"] = {}
+            async with self._semaphore:
+                try:
+                    await asyncio.wait_for(
+                        handler(proposal_id, entry["payload"]),
+                        timeout=self.STEP_TIMEOUT,
+                    )
+                except asyncio.TimeoutError:
+                    raise TimeoutError(f"timed out after {self.STEP_TIMEOUT}s")
+        except Exception as e:
+            attempts = (entry.get("attempts") or 0) + 1
+            logger.error(
+                f"Outbox step {step} of proposal {proposal_id} failed on attempt {attempts}: {e}"
+            )
+            if attempts < self.MAX_ATTEMPTS:
+                entry["attempts"] = attempts
+                entry["run_at"] = int(time.time()) + min(
+                    self.RETRY_DELAY * 2 ** (attempts - 1), self.MAX_RETRY_DELAY
+                )
+                try:
+                    await self.db_service.retry_outbox_entry(
+                        proposal_id, step, entry["run_at"], str(e)
+                    )
+                except Exception as db_error:
+                    # The retry still happens in this process; the row keeps its old schedule for the next start
+                    logger.error(
+                        f"Error recording the retry of outbox step {step} of proposal {proposal_id}: {db_error}"
+                    )
+                self._timer.schedule(key, entry["run_at"])
+                return
+            logger.error(
+                f"Giving up on outbox step {step} of proposal {proposal_id} with payload {entry['payload']}"
+            )
+            self.abandoned += 1
+        else:
+            self.completed += 1
+
+        try:
+            await self.db_service.remove_outbox_entry(proposal_id, step)
+        except Exception as e:
+            # Forget the entry anyway so the later steps run; the next load() picks the row up again
+            # and repeats the step, which handlers tolerate
+            logger.error(
+                f"Error removing outbox step {step} of proposal {proposal_id}: {e}"
+            )
+        self._entries.pop(key, None)
+        self._release(proposal_id)
@@ -0,0 +1,217 @@
+"""
+scheduler contains the DeadlineTimer and JobScheduler classes.
+
+DeadlineTimer keeps a heap of deadlines and runs a single task that sleeps until the earliest one,
+instead of parking one coroutine per pending deadline.
+
+JobScheduler persists delayed jobs in the scheduled_jobs table and uses a DeadlineTimer to run them
+when they become due. Pending jobs are reloaded at startup, so they survive restarts.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from discord.ext import commands
+
+from database.service import AsyncDatabaseService
+from logger.logger import logger
+
+
+class DeadlineTimer:
+    def __init__(
+        self,
+        callback: Callable[[Hashable], Awaitable[None]],
+        clock: Callable[[], float] = time.time,
+    ):
+        """
+        Parameters:
+        callback (Callable): Coroutine function invoked with the key of each deadline once it has passed.
+        clock (Callable): Returns the current unix timestamp.
+        """
+        self._callback = callback
+        self._clock = clock
+        self._fired: Set[asyncio.Task] = set()
+        self._heap: List[Tuple[float, int, Hashable]] = []
+        self._deadlines: Dict[Hashable, float] = {}
+        self._counter = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def schedule(self, key: Hashable, deadline: float) -> None:
+        """Schedule or move the deadline (a unix timestamp) for a key"""
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), key))
+        if self._heap[0][2] == key:
+            self._wakeup.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def cancel(self, key: Hashable) -> None:
+        """Forget the deadline for a key. Stale heap entries are skipped when they surface"""
+        self._deadlines.pop(key, None)
+
+    def wake(self) -> None:
+        """Check the deadlines again now, for example after the clock was moved"""
+        self._wakeup.set()
+
+    def deadline_for(self, key: Hashable) -> Optional[float]:
+        return self._deadlines.get(key)
+
+    def keys(self) -> List[Hashable]:
+        return list(self._deadlines)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._deadlines
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def next_deadline(self) -> Optional[float]:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            deadline, _, key = self._heap[0]
+            if self._deadlines.get(key) == deadline:
+                return
+            heapq.heappop(self._heap)
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            deadline = self.next_deadline()
+            if deadline is None:
+                await self._wakeup.wait()
+                continue
+
+            delay = deadline - self._clock()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            _, _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            # Keep a reference so in-flight callbacks are not garbage collected
+            task = asyncio.create_task(self._fire(key))
+            self._fired.add(task)
+            task.add_done_callback(self._fired.discard)
+
+    async def _fire(self, key: Hashable) -> None:
+        try:
+            await self._callback(key)
+        except Exception as e:
+            logger.error(f"Error running deadline callback for {key}: {e}")
+
+
+class JobScheduler:
+    MAX_ATTEMPTS = 3
+    RETRY_DELAY = 60
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], Awaitable[None]]] = {}
+        self._jobs: Dict[int, Dict[str, Any]] = {}
+        self._timer = DeadlineTimer(self._run_job)
+
+    def register(
+        self, job_type: str, handler: Callable[[Dict[str, Any]], Awaitable[None]]
+    ) -> None:
+        """
+        Register the coroutine function that runs jobs of a type.
+
+        Parameters:
+        job_type (str): The job type.
+        handler (Callable): Coroutine function invoked with the job payload.
+        """
+        self._handlers[job_type] = handler
+
+    async def start(self) -> None:
+        """Load pending jobs from the database and schedule them"""
+        jobs = await AsyncDatabaseService().get_scheduled_jobs()
+        for job in jobs:
+            self._track(job)
+        logger.info(f"Loaded {len(jobs)} pending scheduled jobs")
+
+    async def schedule(
+        self,
+        job_type: str,
+        run_at: float,
+        payload: Dict[str, Any],
+        job_key: Optional[str] = None,
+    ) -> int:
+        """
+        Persist a job and schedule it to run at a given time.
+
+        Parameters:
+        job_type (str): The type of the job, as registered with register().
+        run_at (float): Unix timestamp at which the job should run.
+        payload (Dict[str, Any]): JSON-serializable arguments for the handler.
+        job_key (Optional[str]): Unique key; scheduling the same key again replaces the pending job.
+
+        Returns:
+        int: The ID of the job.
+        """
+        job_id = await AsyncDatabaseService().save_scheduled_job(
+            job_type, int(run_at), payload, job_key
+        )
+        self._track(
+            {
+                "id": job_id,
+                "job_type": job_type,
+                "payload": payload,
+                "run_at": int(run_at),
+                "attempts": 0,
+            }
+        )
+        return job_id
+
+    def pending(self) -> int:
+        return len(self._jobs)
+
+    def _track(self, job: Dict[str, Any]) -> None:
+        self._jobs[job["id"]] = job
+        self._timer.schedule(job["id"], job["run_at"])
+
+    async def _run_job(self, job_id: int) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return
+
+        db_service = AsyncDatabaseService()
+        handler = self._handlers.get(job["job_type"])
+        try:
+            if handler is None:
+                raise ValueError(f"No handler registered for {job['job_type']}")
+            await handler(job["payload"])
+        except Exception as e:
+            attempts = (job.get("attempts") or 0) + 1
+            logger.error(
+                f"Scheduled job {job_id} ({job['job_type']}) failed on attempt {attempts}: {e}"
+            )
+            if attempts < self.MAX_ATTEMPTS:
+                job["attempts"] = attempts
+                job["run_at"] = int(time.time()) + self.RETRY_DELAY * attempts
+                await db_service.reschedule_job(job_id, job["run_at"])
+                self._timer.schedule(job_id, job["run_at"])
+                return
+            logger.error(f"Giving up on scheduled job {job_id}")
+
+        self._jobs.pop(job_id, None)
+        await db_service.remove_scheduled_job(job_id)
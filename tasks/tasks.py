@@ -1,7 +1,11 @@
 """
-tasks contains the TaskManager class, which contains the check_events and check_concluded_proposals_task functions.
+tasks contains the TaskManager class, which contains the check_events, check_concluded_proposals and flush_vote_tallies functions.
+Votes are concluded by a deadline timer keyed on each vote's end_time; check_concluded_proposals is a slow safety sweep behind it.
+Concluding a vote only archives it; the Snapshot proposal and result posts run as ConclusionOutbox steps.
 """
 
+import asyncio
+import functools
 import time
 import discord
 from discord.ext import tasks, commands
@@ -12,235 +16,401 @@ from events.event_operations import EventOperations
 from utils.utils import DiscordUtils
 from consts.constants import (
     GENERAL_CHANNEL,
-    YES_VOTE,
-    NO_VOTE,
-    ABSTAIN_VOTE,
     PROPOSAL_CONCLUSION_EMOJIS,
 )
 import config.config as cfg
-from database.service import DatabaseService
+from database.service import AsyncDatabaseService
 from utils.utils import SnapshotUtils
+from tasks.outbox import ConclusionOutbox
+from tasks.scheduler import DeadlineTimer
+from utils.outbound import Priority
+from utils.snapshot_sidecar import SnapshotSidecarUnavailable
 
 
 class TaskManager:
     check_concluded_proposals_task = None
     check_events_task = None
+    flush_vote_tallies_task = None
+    reconcile_reaction_roles_task = None
+    vote_deadlines = None
+    conclusion_semaphore = None
+    conclusion_failures = {}
+    _concluding = set()
+    _tasks_started = False
+
+    MAX_CONCURRENT_CONCLUSIONS = 3
+    CONCLUSION_TIMEOUT = 10 * 60
+    # Proposal type -> (config counter of its proposal numbers, Snapshot title prefix)
+    PROPOSAL_NUMBERS = {
+        "budget": ("next_budget_id", "Bloom Budget Proposal"),
+        "governance": ("next_governance_id", "Bloom General Proposal"),
+    }
 
     @classmethod
     async def start_tasks(cls, bot: commands.Bot):
-        """Start all scheduled tasks"""
-        try:
-            if not hasattr(cls, "_tasks_started"):
-                cls.check_concluded_proposals_task = tasks.loop(minutes=5)(
-                    cls.check_concluded_proposals
-                )
-                cls.check_events_task = tasks.loop(minutes=50)(cls.check_events)
+        """
+        Start all scheduled tasks.
+        The loops are started first and every other subsystem is started on its own, so one failing
+        to start does not keep the rest from running. Later on_ready events do not start anything again.
+        """
+        if cls._tasks_started:
+            return
+        cls._tasks_started = True
+
+        cls.conclusion_semaphore = asyncio.Semaphore(cls.MAX_CONCURRENT_CONCLUSIONS)
+        cls.vote_deadlines = DeadlineTimer(
+            lambda proposal_id: cls.conclude_due_proposal(bot, proposal_id)
+        )
+        cls.check_concluded_proposals_task = tasks.loop(minutes=10)(
+            cls.check_concluded_proposals
+        )
+        cls.check_events_task = tasks.loop(minutes=50)(cls.check_events)
+        cls.flush_vote_tallies_task = tasks.loop(minutes=1)(cls.flush_vote_tallies)
+
+        @cls.check_concluded_proposals_task.before_loop
+        async def before_check_concluded_proposals():
+            await bot.wait_until_ready()
 
-                @cls.check_concluded_proposals_task.before_loop
-                async def before_check_concluded_proposals():
-                    await bot.wait_until_ready()
+        @cls.check_events_task.before_loop
+        async def before_check_events():
+            await bot.wait_until_ready()
 
-                @cls.check_events_task.before_loop
-                async def before_check_events():
-                    await bot.wait_until_ready()
+        cls.check_concluded_proposals_task.start(bot)
+        cls.check_events_task.start(bot)
+        cls.flush_vote_tallies_task.start(bot)
 
-                cls.check_concluded_proposals_task.start(bot)
-                cls.check_events_task.start(bot)
+        event_operations = EventOperations(bot)
+        bot.job_scheduler.register(
+            EventOperations.ANNOUNCE_NEW_EVENT_JOB,
+            event_operations.announce_new_event,
+        )
+        for step, handler in (
+            (ConclusionOutbox.SNAPSHOT_PROPOSAL, cls.create_snapshot_proposal),
+            (ConclusionOutbox.POST_THREAD_RESULT, cls.post_thread_result),
+            (ConclusionOutbox.POST_GENERAL_RESULT, cls.post_general_result),
+        ):
+            bot.outbox.register(step, functools.partial(handler, bot))
 
-                cls._tasks_started = True
-                logger.info("Tasks started successfully")
+        try:
+            bot.supply_cache.start()
         except Exception as e:
-            logger.error(f"Error starting tasks: {e}")
+            logger.error(f"Error starting the supply cache: {e}")
+
+        # The Snapshot sidecar comes before the outbox, whose first step may need it
+        for name, start in (
+            ("the Snapshot sidecar", bot.snapshot.start),
+            ("the vote tally", bot.vote_tally.load),
+            ("the scheduled job runner", bot.job_scheduler.start),
+            ("the conclusion outbox", bot.outbox.load),
+        ):
+            try:
+                await start()
+            except Exception as e:
+                logger.error(f"Error starting {name}: {e}")
+
+        cls.reconcile_reaction_roles_task = asyncio.create_task(
+            bot.reaction_roles.reconcile()
+        )
+        logger.info("Tasks started")
 
     @classmethod
     async def check_concluded_proposals(cls, bot: commands.Bot):
-        """Check for concluded proposals every 5 minutes"""
-        logger.info("Checking for concluded proposals...")
+        """
+        Safety sweep behind the deadline timer.
+        Re-reads every ongoing vote deadline and (re)schedules any the timer does not know about,
+        such as votes inserted by scripts/recreate_vote.py. Overdue votes are concluded immediately.
+        """
+        logger.info("Syncing ongoing vote deadlines...")
         try:
-            db_service = DatabaseService()
-            ongoing_votes = db_service.get_ongoing_votes()
-
-            for proposal_id, proposal_data in ongoing_votes.items():
-                if time.time() < proposal_data["end_time"]:
-                    continue
+            db_service = AsyncDatabaseService()
+            deadlines = await db_service.get_ongoing_vote_deadlines()
 
-                channel = bot.get_channel(int(proposal_data["channel_id"]))
-                if not channel:
-                    logger.error(
-                        f"Unable to find the channel with id: {proposal_data['channel_id']}"
-                    )
-                    continue
+            for proposal_id, end_time in deadlines.items():
+                if cls.vote_deadlines.deadline_for(proposal_id) != end_time:
+                    cls.schedule_vote_conclusion(proposal_id, end_time)
 
-                thread = channel.get_thread(int(proposal_data["thread_id"]))
-                if not thread:
-                    logger.error(
-                        f"Unable to find the thread with id: {proposal_data['thread_id']} in the channel: {channel.name}"
-                    )
-                    continue
+            for proposal_id in cls.vote_deadlines.keys():
+                if proposal_id not in deadlines:
+                    cls.vote_deadlines.cancel(proposal_id)
 
-                message = await thread.fetch_message(int(proposal_data["message_id"]))
-                if not message:
-                    logger.error(
-                        f"Unable to find the message with id: {proposal_data['message_id']} in the thread: {thread.id}"
-                    )
-                    continue
-
-                # Initialize vote counts
-                proposal_data.update(
-                    {"yes_count": 0, "no_count": 0, "abstain_count": 0}
-                )
-
-                counts = {
-                    YES_VOTE: "yes_count",
-                    NO_VOTE: "no_count",
-                    ABSTAIN_VOTE: "abstain_count",
-                }
-
-                for reaction in message.reactions:
-                    emoji = str(reaction.emoji)
-                    if emoji in counts:
-                        proposal_data[counts[emoji]] = (
-                            reaction.count - 1
-                        )  # Subtract bot's reaction
+            logger.info(f"Tracking {len(cls.vote_deadlines)} ongoing vote deadlines")
+        except Exception as e:
+            logger.error(f"An error occurred while checking ongoing proposals: {e}")
 
-                logger.info(
-                    f"Vote counts for {proposal_data['title']}: Yes={proposal_data['yes_count']}, No={proposal_data['no_count']}, Abstain={proposal_data['abstain_count']}"
-                )
+    @classmethod
+    async def flush_vote_tallies(cls, bot: commands.Bot):
+        """Persist live vote counts that changed since the last flush"""
+        try:
+            await bot.vote_tally.flush()
+        except Exception as e:
+            logger.error(f"An error occurred while flushing vote tallies: {e}")
 
-                # Save updated vote counts
-                db_service.save_ongoing_vote(proposal_data)
+    @classmethod
+    def schedule_vote_conclusion(cls, proposal_id: str, end_time: int) -> None:
+        """
+        Schedule a vote to be concluded at its end time.
+        Invoked when a vote is published. Votes published before the tasks start are picked up by the sweep.
+        """
+        if cls.vote_deadlines is None:
+            return
+        logger.info(f"Scheduling conclusion of proposal {proposal_id} at {end_time}")
+        cls.vote_deadlines.schedule(proposal_id, end_time)
 
-                passed = (
-                    proposal_data["yes_count"] > proposal_data["no_count"]
-                    and proposal_data["yes_count"] >= cfg.YES_COUNT_THRESHOLD
+    @classmethod
+    async def conclude_due_proposal(cls, bot: commands.Bot, proposal_id: str):
+        """
+        Conclude a proposal once its deadline timer fires.
+        Each due proposal runs in its own task; at most MAX_CONCURRENT_CONCLUSIONS run at once and each
+        is bounded by CONCLUSION_TIMEOUT, so one stuck proposal does not hold up the others.
+        Failures are recorded per proposal in conclusion_failures and retried by the next sweep.
+        """
+        if proposal_id in cls._concluding:
+            return
+        cls._concluding.add(proposal_id)
+        try:
+            async with cls.conclusion_semaphore:
+                db_service = AsyncDatabaseService()
+                proposal_data = await db_service.get_ongoing_vote(proposal_id)
+                if not proposal_data:
+                    logger.info(f"Proposal {proposal_id} is no longer ongoing")
+                    return
+                if time.time() < proposal_data["end_time"]:
+                    cls.schedule_vote_conclusion(proposal_id, proposal_data["end_time"])
+                    return
+                started = time.monotonic()
+                await asyncio.wait_for(
+                    cls.conclude_proposal(bot, proposal_id, proposal_data),
+                    timeout=cls.CONCLUSION_TIMEOUT,
                 )
-                result_message = (
-                    f"Vote for **{proposal_data['title']}** has concluded:\n\n"
+                cls.conclusion_failures.pop(proposal_id, None)
+                logger.info(
+                    f"Processed proposal {proposal_id} in {time.monotonic() - started:.1f}s"
                 )
+        except asyncio.TimeoutError:
+            cls.record_conclusion_failure(
+                proposal_id, f"timed out after {cls.CONCLUSION_TIMEOUT}s"
+            )
+        except Exception as e:
+            cls.record_conclusion_failure(proposal_id, str(e))
+        finally:
+            cls._concluding.discard(proposal_id)
 
-                if passed:
-                    draft_title = proposal_data["draft"]["title"]
-                    proposal_type = proposal_data["draft"]["type"]
-
-                    config = db_service.get_config()
-                    receipt = None
-
-                    if proposal_type == "budget":
-                        budget_id = config.get("next_budget_id", "")
-
-                        if not budget_id:
-                            logger.error("Budget ID is not set")
-                            continue
-
-                        title = f"Bloom Budget Proposal #{budget_id}: {draft_title}"
-                    elif proposal_type == "governance":
-                        governance_id = config.get("next_governance_id", "")
-
-                        if not governance_id:
-                            logger.error("Governance ID is not set")
-                            continue
-
-                        title = (
-                            f"Bloom General Proposal #{governance_id}: {draft_title}"
-                        )
-                    else:
-                        logger.error(f"Unknown proposal type: {proposal_type}")
-                        continue
-
-                    try:
-                        quorum_value = await SnapshotUtils.fetch_XP_quorum()
-                        SnapshotUtils.modify_space_settings(str(quorum_value))
-                        logger.info(f"Quorum value set to {quorum_value}")
-
-                        receipt = SnapshotUtils.create_snapshot_proposal(
-                            proposal_data, title
-                        )
-                    except Exception as e:
-                        logger.error(f"Error creating snapshot proposal: {e}")
-                        continue
-
-                    id = None
-                    if receipt:
-                        id = receipt.get("id")
-
-                    proposal_url = SnapshotUtils.get_proposal_url(id, cfg.IS_DEV)
+    @classmethod
+    def record_conclusion_failure(cls, proposal_id: str, error: str) -> None:
+        """Record a failed conclusion attempt of a proposal"""
+        failure = cls.conclusion_failures.setdefault(proposal_id, {"attempts": 0})
+        failure["attempts"] += 1
+        failure["error"] = error
+        failure["failed_at"] = time.time()
+        logger.error(
+            f"An error occurred while concluding proposal {proposal_id} (attempt {failure['attempts']}): {error}"
+        )
 
-                    if proposal_url:
-                        result_message += f"The vote passes! {random.choice(PROPOSAL_CONCLUSION_EMOJIS)}\n\nSnapshot proposal has been created: **{proposal_url}**"
-                        if proposal_type == "budget":
-                            db_service.set_config(
-                                "next_budget_id", str(int(budget_id) + 1)
-                            )
-                        elif proposal_type == "governance":
-                            db_service.set_config(
-                                "next_governance_id", str(int(governance_id) + 1)
-                            )
-                    else:
-                        result_message += f"The vote passes! {random.choice(PROPOSAL_CONCLUSION_EMOJIS)}"
-                else:
-                    result_message += "The vote fails. :disappointed:"
+    @classmethod
+    async def conclude_proposal(
+        cls, bot: commands.Bot, proposal_id: str, proposal_data: dict
+    ):
+        """Count the votes of an ended proposal, archive it and queue its Snapshot proposal and result posts"""
+        db_service = AsyncDatabaseService()
+
+        channel = bot.get_channel(int(proposal_data["channel_id"]))
+        if not channel:
+            logger.error(
+                f"Unable to find the channel with id: {proposal_data['channel_id']}"
+            )
+            return
+
+        thread = channel.get_thread(int(proposal_data["thread_id"]))
+        if not thread:
+            logger.error(
+                f"Unable to find the thread with id: {proposal_data['thread_id']} in the channel: {channel.name}"
+            )
+            return
+
+        proposal_data.update(
+            await bot.vote_tally.counts_for(proposal_id, proposal_data)
+        )
 
-                result_message += f"\nAdopt: {proposal_data['yes_count']}\nReassess: {proposal_data['no_count']}\nAbstain: {proposal_data['abstain_count']}"
+        logger.info(
+            f"Vote counts for {proposal_data['title']}: Yes={proposal_data['yes_count']}, No={proposal_data['no_count']}, Abstain={proposal_data['abstain_count']}"
+        )
 
-                logger.info(
-                    f"Yes vote count: {proposal_data['yes_count']} No vote count: {proposal_data['no_count']} Abstain vote count: {proposal_data['abstain_count']}"
-                )
+        passed = (
+            proposal_data["yes_count"] > proposal_data["no_count"]
+            and proposal_data["yes_count"] >= cfg.YES_COUNT_THRESHOLD
+        )
+        steps = [
+            ConclusionOutbox.POST_THREAD_RESULT,
+            ConclusionOutbox.POST_GENERAL_RESULT,
+        ]
+        if passed:
+            proposal_type = proposal_data["draft"]["type"]
+            if proposal_type not in cls.PROPOSAL_NUMBERS:
+                logger.error(f"Unknown proposal type: {proposal_type}")
+                return
+            steps.insert(0, ConclusionOutbox.SNAPSHOT_PROPOSAL)
+
+        # Archive the vote and queue its side effects in one commit; the outbox runs them
+        await db_service.conclude_vote(
+            proposal_data,
+            passed,
+            steps,
+            {"emoji": random.choice(PROPOSAL_CONCLUSION_EMOJIS)},
+        )
+        bot.vote_tally.unregister(proposal_id)
+        logger.info(f"Successfully concluded proposal {proposal_id}")
+        await bot.outbox.load()
 
-                try:
-                    await thread.send(result_message)
-                except discord.HTTPException as e:
-                    logger.error(
-                        f"An error occurred while posting the result message: {e}"
-                    )
+    @classmethod
+    async def create_snapshot_proposal(
+        cls, bot: commands.Bot, proposal_id: str, payload: dict
+    ):
+        """
+        Outbox step: number a passed vote, create its Snapshot proposal and record its URL.
+        Skipped if the concluded vote already has a Snapshot URL.
+
+        The proposal number is allocated when the step first runs, right before Snapshot is called, and kept
+        in the outbox payload for retries. A number is only left unused if Snapshot keeps failing until the
+        step is abandoned; the abandoned entry is logged with its payload.
+
+        The step is marked as submitted in its outbox payload before Snapshot is called. A retry of a
+        submitted step first looks the proposal up by its title, which includes the unique proposal number,
+        so a proposal Snapshot accepted before the attempt failed is recorded instead of created twice.
+        """
+        db_service = AsyncDatabaseService()
+        vote = await db_service.get_concluded_vote(proposal_id)
+        if not vote or vote["snapshot_url"]:
+            return
+
+        number_key, title_prefix = cls.PROPOSAL_NUMBERS[vote["draft"]["type"]]
+        payload["proposal_number"] = await db_service.allocate_outbox_number(
+            proposal_id, ConclusionOutbox.SNAPSHOT_PROPOSAL, number_key
+        )
+        title = (
+            f"{title_prefix} #{payload['proposal_number']}: {vote['draft']['title']}"
+        )
 
-                guild = channel.guild
+        snapshot_id = None
+        if payload.get("snapshot_submitted"):
+            snapshot_id = payload.get(
+                "snapshot_id"
+            ) or await SnapshotUtils.find_proposal_id(title)
+            if snapshot_id:
                 logger.info(
-                    f"Looking for general channel '{GENERAL_CHANNEL}' in guild: {guild.name}"
-                )
-                general_channel = await DiscordUtils.get_channel_by_name(
-                    guild, GENERAL_CHANNEL
+                    f"Snapshot proposal of {proposal_id} was already created: {snapshot_id}"
                 )
 
-                if general_channel:
-                    try:
-                        await general_channel.send(result_message)
-                    except discord.HTTPException as e:
-                        logger.error(
-                            f"An error occurred while posting the result message to general channel: {e}"
-                        )
-                else:
-                    logger.error(
-                        f"Unable to find the general channel '{GENERAL_CHANNEL}' in guild: {guild.name}"
-                    )
-
-                try:
-                    db_service.save_concluded_vote(
-                        proposal_data=proposal_data,
-                        yes_count=proposal_data.get("yes_count", 0),
-                        no_count=proposal_data.get("no_count", 0),
-                        abstain_count=proposal_data.get("abstain_count", 0),
-                        passed=passed,
-                        snapshot_url=proposal_url if passed else None,
-                    )
+        if not snapshot_id:
+            payload["snapshot_submitted"] = True
+            await db_service.update_outbox_payload(
+                proposal_id, ConclusionOutbox.SNAPSHOT_PROPOSAL, payload
+            )
+            snapshot_id = await cls.submit_snapshot_proposal(bot, vote, title)
+            payload["snapshot_id"] = snapshot_id
+            await db_service.update_outbox_payload(
+                proposal_id, ConclusionOutbox.SNAPSHOT_PROPOSAL, payload
+            )
+
+        proposal_url = SnapshotUtils.get_proposal_url(snapshot_id, cfg.IS_DEV)
+        await db_service.set_concluded_snapshot_url(proposal_id, proposal_url)
+
+    @staticmethod
+    async def submit_snapshot_proposal(
+        bot: commands.Bot, vote: dict, title: str
+    ) -> str:
+        """Set the quorum of the Snapshot space and create the proposal. Returns the ID of the proposal"""
+        quorum_value = await bot.supply_cache.get_quorum()
+        body = vote["draft"].get("sections", {}).get("content", "")
+        try:
+            if await bot.snapshot.modify_space(quorum_value):
+                logger.info(f"Quorum value set to {quorum_value}")
+            else:
+                logger.error(f"Failed to set quorum value to {quorum_value}")
+
+            receipt = await bot.snapshot.create_proposal(
+                title, body, ["Adopt", "Reassess", "Abstain"]
+            )
+        except SnapshotSidecarUnavailable as e:
+            # Nothing reached Snapshot yet, so the one-shot scripts cannot duplicate anything
+            logger.error(f"{e}; running the Snapshot scripts directly")
+            await SnapshotUtils.modify_space_settings(str(quorum_value))
+            receipt = await SnapshotUtils.create_snapshot_proposal(vote, title)
+
+        if not receipt or not receipt.get("id"):
+            raise ValueError(f"Snapshot proposal was not created: {receipt}")
+        return receipt["id"]
+
+    @staticmethod
+    def format_result_message(vote: dict, emoji: str) -> str:
+        """Format the result announcement of a concluded vote"""
+        result_message = f"Vote for **{vote['title']}** has concluded:\n\n"
+        if vote["passed"]:
+            result_message += f"The vote passes! {emoji}"
+            if vote["snapshot_url"]:
+                result_message += f"\n\nSnapshot proposal has been created: **{vote['snapshot_url']}**"
+        else:
+            result_message += "The vote fails. :disappointed:"
+
+        result_message += f"\nAdopt: {vote['yes_count']}\nReassess: {vote['no_count']}\nAbstain: {vote['abstain_count']}"
+        return result_message
 
-                    db_service.remove_ongoing_vote(proposal_id)
-                    logger.info(f"Successfully concluded proposal {proposal_id}")
-                except Exception as e:
-                    logger.error(f"Error saving/removing concluded vote: {e}")
-                    continue
+    @classmethod
+    async def post_thread_result(
+        cls, bot: commands.Bot, proposal_id: str, payload: dict
+    ):
+        """Outbox step: post the result of a concluded vote to its thread"""
+        vote = await AsyncDatabaseService().get_concluded_vote(proposal_id)
+        if not vote:
+            return
+
+        thread_id = int(vote["thread_id"])
+        thread = bot.get_channel(thread_id) or bot.get_partial_messageable(thread_id)
+        await bot.outbound.send(
+            thread,
+            cls.format_result_message(vote, payload.get("emoji", "")),
+            Priority.VOTE_RESULT,
+        )
 
-        except Exception as e:
-            logger.error(f"An error occurred while checking ongoing proposals: {e}")
+    @classmethod
+    async def post_general_result(
+        cls, bot: commands.Bot, proposal_id: str, payload: dict
+    ):
+        """Outbox step: post the result of a concluded vote to the general channel"""
+        vote = await AsyncDatabaseService().get_concluded_vote(proposal_id)
+        if not vote:
+            return
+
+        channel = bot.get_channel(int(vote["channel_id"]))
+        if not channel:
+            raise ValueError(
+                f"Unable to find the channel with id: {vote['channel_id']}"
+            )
+
+        guild = channel.guild
+        logger.info(
+            f"Looking for general channel '{GENERAL_CHANNEL}' in guild: {guild.name}"
+        )
+        general_channel = await DiscordUtils.get_channel_by_name(guild, GENERAL_CHANNEL)
+        if not general_channel:
+            raise ValueError(
+                f"Unable to find the general channel '{GENERAL_CHANNEL}' in guild: {guild.name}"
+            )
+
+        await bot.outbound.send(
+            general_channel,
+            cls.format_result_message(vote, payload.get("emoji", "")),
+            Priority.VOTE_RESULT,
+        )
 
     @classmethod
     async def check_events(cls, bot: commands.Bot) -> None:
         """Check for upcoming events"""
         logger.info("Checking for upcoming events...")
         try:
-            db_service = DatabaseService()
+            db_service = AsyncDatabaseService()
             if not hasattr(bot, "posted_events"):
                 bot.posted_events = []
-                posted_events = db_service.get_posted_events()
+                posted_events = await db_service.get_posted_events()
                 if posted_events:
                     bot.posted_events.extend(posted_events)
                 logger.info(f"Initialized posted_events: {bot.posted_events}")
@@ -269,7 +439,7 @@ class TaskManager:
                         )
                         continue
 
-                    notified_events = db_service.get_notified_events()
+                    notified_events = await db_service.get_notified_events()
                     new_events = [
                         event
                         for event in upcoming_events
@@ -277,6 +447,12 @@ class TaskManager:
                     ]
 
                     if new_events:
+                        users_by_event = (
+                            await bot.scheduled_event_users.get_users_for_events(
+                                guild.id, [event.id for event in new_events]
+                            )
+                        )
+
                         for event in new_events:
                             last_notified = notified_events.get(str(event.id), 0)
 
@@ -286,19 +462,17 @@ class TaskManager:
                                 )
                                 continue
 
-                            users = event_operations.get_guild_scheduled_event_users(
-                                guild.id, event.id
-                            )
+                            users = users_by_event.get(event.id, [])
 
                             guild_id = event.guild.id
-                            user_mentions = [f"<@{user['user_id']}>" for user in users]
+                            user_mentions = [f"<@{user['id']}>" for user in users]
                             user_list_string = ", ".join(user_mentions)
 
                             formatted_event = event_operations.format_event(
                                 event, guild_id
                             )
 
-                            db_service.save_event(
+                            await db_service.save_event(
                                 event_id=event.id,
                                 guild_id=guild_id,
                                 posted_at=current_time,
@@ -309,7 +483,7 @@ class TaskManager:
                             message = f"🌺 **__Upcoming Event__** 🌺\n{formatted_event}"
                             if user_list_string:
                                 message += f"\n\nInterested users: {user_list_string}"
-                            await channel.send(message)
+                            await bot.outbound.send(channel, message, Priority.REMINDER)
                     else:
                         logger.info(
                             f"No new upcoming events in the next 24 hours for guild {guild}."
@@ -0,0 +1,76 @@
+from consts.constants import (
+    FALLBACK_GENERAL_CHANNEL,
+    GENERAL_CHANNEL,
+    GOVERNANCE_BUDGET_CHANNEL,
+    GOVERNANCE_CHANNEL,
+)
+from utils.channel_index import ChannelIndex
+
+
+class FakeChannel:
+    def __init__(self, guild, channel_id, name):
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+
+
+class FakeGuild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+        self.channels = []
+
+    def add_channel(self, channel_id, name):
+        channel = FakeChannel(self, channel_id, name)
+        self.channels.append(channel)
+        return channel
+
+    def get_channel(self, channel_id):
+        return next((c for c in self.channels if c.id == channel_id), None)
+
+
+def setup_function():
+    ChannelIndex._channels.clear()
+
+
+def test_get_indexes_guild_and_follows_channel_events():
+    guild = FakeGuild(1)
+    home = guild.add_channel(10, GENERAL_CHANNEL)
+    assert ChannelIndex.get(guild, GENERAL_CHANNEL) is home
+
+    created = guild.add_channel(11, "new-channel")
+    ChannelIndex.add(created)
+    assert ChannelIndex.get(guild, "new-channel") is created
+
+    renamed = FakeChannel(guild, 11, "renamed")
+    guild.channels[-1] = renamed
+    ChannelIndex.update(created, renamed)
+    assert ChannelIndex.get(guild, "renamed") is renamed
+    assert ChannelIndex.get(guild, "new-channel") is None
+
+    guild.channels.remove(home)
+    ChannelIndex.remove(home)
+    assert ChannelIndex.get(guild, GENERAL_CHANNEL) is None
+
+
+def test_get_resolves_fallback_names():
+    guild = FakeGuild(2)
+    announcements = guild.add_channel(20, FALLBACK_GENERAL_CHANNEL)
+    assert ChannelIndex.get(guild, GENERAL_CHANNEL) is announcements
+
+
+def test_get_rebuilds_stale_entries():
+    guild = FakeGuild(3)
+    old = guild.add_channel(30, "votes")
+    ChannelIndex.get(guild, "votes")
+
+    # Channel replaced without a delete event reaching the index
+    guild.channels.remove(old)
+    new = guild.add_channel(31, "votes")
+    assert ChannelIndex.get(guild, "votes") is new
+
+
+def test_proposal_forums_do_not_fall_back_to_each_other():
+    guild = FakeGuild(4)
+    budget = guild.add_channel(40, GOVERNANCE_BUDGET_CHANNEL)
+    assert ChannelIndex.get(guild, GOVERNANCE_BUDGET_CHANNEL) is budget
+    assert ChannelIndex.get(guild, GOVERNANCE_CHANNEL) is None
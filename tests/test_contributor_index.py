@@ -0,0 +1,73 @@
+import pytest
+
+from database.models import Contributor
+from events.contributor_index import ContributorIndex
+
+GUILD_ID = 987654321
+
+
+async def make_index():
+    index = ContributorIndex()
+    await index.load_guild(
+        GUILD_ID,
+        [
+            Contributor(
+                uid="1", note="Alice", server_name=str(GUILD_ID), emoji_id="🌟"
+            ),
+            Contributor(
+                uid="2",
+                note="Bob",
+                server_name=str(GUILD_ID),
+                emoji_id="<:bob:1234567890>",
+            ),
+            Contributor(
+                uid="3", note="Carol", server_name=str(GUILD_ID), emoji_id=None
+            ),
+        ],
+    )
+    return index
+
+
+def test_prefilter_skips_plain_text():
+    assert not ContributorIndex.may_contain_emoji("just some plain text")
+    assert ContributorIndex.may_contain_emoji("hello <:bob:1234567890>")
+    assert ContributorIndex.may_contain_emoji("nice 🌟")
+
+
+@pytest.mark.asyncio
+async def test_match_unicode_and_custom_emojis():
+    index = await make_index()
+    assert await index.match(GUILD_ID, "great work 🌟") == {"1"}
+    assert await index.match(GUILD_ID, "<:bob:1234567890> and 🌟") == {"1", "2"}
+    assert await index.match(GUILD_ID, "<:someone_else:42>") == set()
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_update_index():
+    index = await make_index()
+    index.add(GUILD_ID, "1", "🔥")
+    assert await index.match(GUILD_ID, "🌟") == set()
+    assert await index.match(GUILD_ID, "🔥") == {"1"}
+
+    index.remove(GUILD_ID, "2")
+    assert await index.match(GUILD_ID, "<:bob:1234567890>") == set()
+
+
+@pytest.mark.asyncio
+async def test_load_guild_from_database(test_db, monkeypatch):
+    test_db.add(
+        Contributor(uid="7", note="Dave", server_name=str(GUILD_ID), emoji_id="🌺")
+    )
+    test_db.commit()
+    monkeypatch.setattr("database.service.get_db", lambda: test_db)
+
+    index = ContributorIndex()
+    assert await index.match(GUILD_ID, "🌺") == {"7"}
+    assert index.is_loaded(GUILD_ID)
+
+
+@pytest.mark.asyncio
+async def test_lookup_reaction_emoji():
+    index = await make_index()
+    assert await index.lookup(GUILD_ID, "<:bob:1234567890>") == {"2"}
+    assert await index.lookup(GUILD_ID, "👍") == set()
@@ -3,8 +3,16 @@ from datetime import datetime
 from sqlalchemy import create_engine, Text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.types import TypeDecorator
-from database.models import Base, Contributor, Event, OngoingVote, ConcludedVote
-from database.service import DatabaseService
+from database.models import (
+    Base,
+    Config,
+    Contributor,
+    Event,
+    OngoingVote,
+    ConcludedVote,
+    ScheduledJob,
+)
+from database.service import AsyncDatabaseService, DatabaseService
 import time
 import json
 
@@ -41,17 +49,6 @@ def setup_test_env():
     Base.metadata.drop_all(engine)
 
 
-@pytest.fixture
-def test_db():
-    """Create an in-memory database for testing"""
-    engine = create_engine("sqlite:///:memory:")
-    Base.metadata.create_all(engine)
-    Session = sessionmaker(bind=engine)
-    session = Session()
-    yield session
-    session.close()
-
-
 class TestContributors:
     def test_create_contributor(self, test_db):
         """Test creating a new contributor"""
@@ -262,6 +259,48 @@ class TestDatabaseService:
         assert "test123" in votes
         assert votes["test123"]["title"] == "Test Vote"
 
+    def test_get_ongoing_vote_deadlines(self, test_db):
+        """Test retrieving only the deadlines of ongoing votes"""
+        vote = OngoingVote(
+            proposal_id="test123",
+            draft={"title": "Test Proposal"},
+            end_time=1234567890,
+            title="Test Vote",
+            channel_id="123",
+            thread_id="456",
+            message_id="789",
+        )
+        test_db.add(vote)
+        test_db.commit()
+
+        db_service = DatabaseService(session=test_db)
+        assert db_service.get_ongoing_vote_deadlines() == {"test123": 1234567890}
+
+    def test_update_vote_tallies(self, test_db):
+        """Test writing live vote counts to ongoing votes"""
+        vote = OngoingVote(
+            proposal_id="test123",
+            draft={"title": "Test Proposal"},
+            end_time=1234567890,
+            title="Test Vote",
+            channel_id="123",
+            thread_id="456",
+            message_id="789",
+        )
+        test_db.add(vote)
+        test_db.commit()
+
+        db_service = DatabaseService(session=test_db)
+        assert db_service.get_ongoing_vote("test123")["yes_count"] == 0
+
+        db_service.update_vote_tallies(
+            {"test123": {"yes_count": 3, "no_count": 1, "abstain_count": 2}}
+        )
+        votes = db_service.get_ongoing_votes()
+        assert votes["test123"]["yes_count"] == 3
+        assert votes["test123"]["no_count"] == 1
+        assert votes["test123"]["abstain_count"] == 2
+
     def test_get_posted_events(self, test_db):
         """Test retrieving posted events"""
         event = Event(
@@ -402,3 +441,144 @@ class TestDatabaseService:
         assert updated.event_id == 123456789
         assert updated.posted_at == current_time
         assert updated.notified_at == new_time
+
+
+class TestScheduledJobs:
+    def test_save_and_get_scheduled_jobs(self, test_db):
+        """Test that jobs are returned earliest first"""
+        db_service = DatabaseService(session=test_db)
+        db_service.save_scheduled_job("announce", 200, {"event_id": 2})
+        db_service.save_scheduled_job("announce", 100, {"event_id": 1})
+
+        jobs = db_service.get_scheduled_jobs()
+        assert [job["payload"]["event_id"] for job in jobs] == [1, 2]
+
+    def test_job_key_replaces_pending_job(self, test_db):
+        """Test that scheduling the same key twice keeps a single job"""
+        db_service = DatabaseService(session=test_db)
+        first_id = db_service.save_scheduled_job("announce", 100, {}, job_key="a:1")
+        second_id = db_service.save_scheduled_job("announce", 300, {}, job_key="a:1")
+
+        assert first_id == second_id
+        assert test_db.query(ScheduledJob).count() == 1
+        assert test_db.query(ScheduledJob).first().run_at == 300
+
+    def test_reschedule_and_remove_job(self, test_db):
+        """Test retry bookkeeping and removal of jobs"""
+        db_service = DatabaseService(session=test_db)
+        job_id = db_service.save_scheduled_job("announce", 100, {})
+
+        db_service.reschedule_job(job_id, 500)
+        job = test_db.query(ScheduledJob).first()
+        assert job.run_at == 500
+        assert job.attempts == 1
+
+        db_service.remove_scheduled_job(job_id)
+        assert test_db.query(ScheduledJob).count() == 0
+
+
+class TestConfigNumbers:
+    def test_allocate_number(self, test_db):
+        """Test that numbers are handed out in sequence and the counter is advanced"""
+        test_db.add(Config(key="next_budget_id", value="7"))
+        test_db.commit()
+
+        db_service = DatabaseService(session=test_db)
+        assert db_service.allocate_number("next_budget_id") == 7
+        assert db_service.allocate_number("next_budget_id") == 8
+        assert db_service.get_config()["next_budget_id"] == "9"
+
+    def test_allocate_unset_number(self, test_db):
+        """Test that allocating from a missing counter fails"""
+        db_service = DatabaseService(session=test_db)
+        with pytest.raises(ValueError):
+            db_service.allocate_number("next_governance_id")
+
+
+class TestTransactions:
+    VOTE = {
+        "proposal_id": "test123",
+        "draft": {"title": "Test Proposal"},
+        "end_time": 1234567890,
+        "title": "Test Vote",
+        "channel_id": "123",
+        "thread_id": "456",
+        "message_id": "789",
+    }
+
+    def test_operations_commit_together(self, test_db):
+        """Test that operations in a transaction are visible to each other and committed once"""
+        db_service = DatabaseService(session=test_db)
+        commits = []
+        test_db.commit = lambda commit=test_db.commit: commits.append(1) or commit()
+
+        with db_service.transaction() as tx:
+            tx.save_ongoing_vote(self.VOTE)
+            assert tx.get_ongoing_vote("test123")["title"] == "Test Vote"
+            tx.save_concluded_vote(self.VOTE, 1, 0, 0, passed=True)
+            tx.remove_ongoing_vote("test123")
+
+        assert len(commits) == 1
+        assert test_db.query(OngoingVote).count() == 0
+        assert test_db.query(ConcludedVote).count() == 1
+
+    def test_failure_rolls_back_every_operation(self, test_db):
+        """Test that an error inside a transaction discards all of its operations"""
+        db_service = DatabaseService(session=test_db)
+
+        with pytest.raises(RuntimeError):
+            with db_service.transaction() as tx:
+                tx.save_ongoing_vote(self.VOTE)
+                raise RuntimeError("failed")
+
+        assert test_db.query(OngoingVote).count() == 0
+
+    def test_migration_replaces_rows_atomically(self, test_db):
+        """Test that a failed migration keeps the existing rows"""
+        db_service = DatabaseService(session=test_db)
+        db_service.save_event(event_id=123, guild_id=456, posted_at=1)
+
+        with pytest.raises(ValueError):
+            db_service.migrate_events({"not-a-number": {}})
+        assert [event.event_id for event in test_db.query(Event)] == [123]
+
+        assert db_service.migrate_events({"789": {"guild_id": 456}}) == 1
+        assert [event.event_id for event in test_db.query(Event)] == [789]
+
+    @pytest.mark.asyncio
+    async def test_run_in_transaction_is_awaitable(self, test_db):
+        """Test that the async facade runs a unit of work on the database thread pool"""
+        db_service = AsyncDatabaseService(session=test_db)
+
+        def work(tx):
+            tx.save_ongoing_vote(self.VOTE)
+            return tx.get_ongoing_vote_deadlines()
+
+        assert await db_service.run_in_transaction(work) == {"test123": 1234567890}
+
+
+class TestAsyncDatabaseService:
+    @pytest.mark.asyncio
+    async def test_methods_are_awaitable(self, test_db):
+        """Test that the async facade exposes the DatabaseService methods"""
+        db_service = AsyncDatabaseService(session=test_db)
+        await db_service.save_ongoing_vote(
+            {
+                "proposal_id": "test123",
+                "draft": {"title": "Test Proposal"},
+                "end_time": 1234567890,
+                "title": "Test Vote",
+                "channel_id": "123",
+                "thread_id": "456",
+                "message_id": "789",
+            }
+        )
+
+        votes = await db_service.get_ongoing_votes()
+        assert votes["test123"]["title"] == "Test Vote"
+
+    def test_private_attributes_are_not_exposed(self, test_db):
+        """Test that only public methods are wrapped"""
+        db_service = AsyncDatabaseService(session=test_db)
+        with pytest.raises(AttributeError):
+            db_service._get_session
@@ -0,0 +1,57 @@
+import asyncio
+import pytest
+
+from utils.notifications import DMNotifier
+from utils.user_cache import UserCache
+
+
+class FakeUser:
+    display_name = "Alice"
+
+    def __init__(self):
+        self.messages = []
+
+    async def send(self, content):
+        self.messages.append(content)
+
+
+class FakeBot:
+    def __init__(self):
+        self.user = FakeUser()
+        self.fetches = 0
+        self.user_cache = UserCache(self)
+
+    def get_user(self, user_id):
+        return None
+
+    async def fetch_user(self, user_id):
+        self.fetches += 1
+        return self.user
+
+
+@pytest.mark.asyncio
+async def test_bursts_are_folded_into_one_digest():
+    bot = FakeBot()
+    notifier = DMNotifier(bot, window=0.01)
+
+    for _ in range(10):
+        notifier.notify(1, "https://discord.com/channels/1/2/3")
+    notifier.notify(1, "https://discord.com/channels/1/2/4")
+
+    await asyncio.sleep(0.05)
+    await notifier._queue.join()
+
+    assert bot.fetches == 1
+    assert len(bot.user.messages) == 1
+    assert "2 messages" in bot.user.messages[0]
+    assert notifier.stats()["coalesced"] == 10
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_dropped_when_full():
+    notifier = DMNotifier(FakeBot(), window=10, max_pending=2)
+
+    assert notifier.notify(1, "link")
+    assert notifier.notify(2, "link")
+    assert not notifier.notify(3, "link")
+    assert notifier.stats()["dropped"] == 1
@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+
+import discord
+
+from utils.outbound import OutboundQueue, Priority, TokenBucket
+
+
+class FakeResponse:
+    def __init__(self, status):
+        self.status = status
+        self.reason = "error"
+
+
+class FakeChannel:
+    def __init__(self, channel_id, failures=0, error=None):
+        self.id = channel_id
+        self.sent = []
+        self.failures = failures
+        self.error = error
+        self.attempts = 0
+
+    async def send(self, content, **kwargs):
+        self.attempts += 1
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        self.sent.append(content)
+        return content
+
+
+@pytest.mark.asyncio
+async def test_higher_priority_messages_are_sent_first():
+    outbound = OutboundQueue(concurrency=1)
+    channel = FakeChannel(1)
+
+    futures = [
+        outbound.send(channel, "reminder", Priority.REMINDER),
+        outbound.send(channel, "welcome", Priority.WELCOME),
+        outbound.send(channel, "result", Priority.VOTE_RESULT),
+    ]
+    assert outbound.stats()["depth"] == {"VOTE_RESULT": 1, "WELCOME": 1, "REMINDER": 1}
+
+    await asyncio.gather(*futures)
+    assert channel.sent == ["result", "welcome", "reminder"]
+    assert outbound.stats()["sent"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_sends_are_not_repeated():
+    outbound = OutboundQueue()
+    broken = FakeChannel(
+        2, failures=1, error=discord.HTTPException(FakeResponse(503), "error")
+    )
+
+    # A send that failed with a server error may have gone through, so it is not repeated
+    with pytest.raises(discord.HTTPException):
+        await outbound.send(broken, "hello")
+    assert broken.attempts == 1
+    assert outbound.stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_busy_channel_does_not_hold_up_other_channels():
+    outbound = OutboundQueue(concurrency=1)
+    outbound.CHANNEL_BURST = 1
+    outbound.CHANNEL_RATE = 5.0
+    busy = FakeChannel(1)
+    quiet = FakeChannel(2)
+
+    first = outbound.send(busy, "first", Priority.VOTE_RESULT)
+    second = outbound.send(busy, "second", Priority.VOTE_RESULT)
+    other = outbound.send(quiet, "other")
+
+    # The second message waits for a token of its channel without blocking the only worker
+    assert await other == "other"
+    assert busy.sent == ["first"]
+    assert outbound.stats()["depth"]["VOTE_RESULT"] == 1
+
+    assert await asyncio.gather(first, second) == ["first", "second"]
+    assert outbound.stats()["depth"]["VOTE_RESULT"] == 0
+
+
+def test_token_bucket_limits_bursts():
+    bucket = TokenBucket(rate=1.0, capacity=2)
+    assert bucket.take() == 0
+    assert bucket.take() == 0
+    assert bucket.take() > 0
@@ -0,0 +1,192 @@
+import asyncio
+import pytest
+
+from database.models import ConcludedVote, Config, OngoingVote, OutboxEntry
+from database.service import AsyncDatabaseService, DatabaseService
+from tasks.outbox import ConclusionOutbox
+
+PROPOSAL = {
+    "proposal_id": "test123",
+    "draft": {"title": "Test Proposal", "type": "budget"},
+    "end_time": 1234567890,
+    "title": "Test Vote",
+    "channel_id": "123",
+    "thread_id": "456",
+    "message_id": "789",
+    "yes_count": 5,
+    "no_count": 1,
+    "abstain_count": 0,
+}
+
+
+async def settle(outbox):
+    for _ in range(100):
+        if not outbox.pending():
+            return
+        await asyncio.sleep(0.01)
+
+
+def test_conclude_vote_commits_archive_and_outbox(test_db):
+    db_service = DatabaseService(session=test_db)
+    db_service.save_ongoing_vote(PROPOSAL)
+
+    db_service.conclude_vote(PROPOSAL, True, list(ConclusionOutbox.STEPS))
+    # Concluding again does not queue the steps twice
+    db_service.conclude_vote(PROPOSAL, True, list(ConclusionOutbox.STEPS))
+
+    assert test_db.query(OngoingVote).count() == 0
+    assert test_db.query(ConcludedVote).one().yes_count == 5
+    assert {entry.step for entry in test_db.query(OutboxEntry)} == set(
+        ConclusionOutbox.STEPS
+    )
+
+
+def test_proposal_number_is_allocated_once_per_outbox_entry(test_db):
+    test_db.add(Config(key="next_budget_id", value="3"))
+    test_db.commit()
+    db_service = DatabaseService(session=test_db)
+    db_service.conclude_vote(
+        PROPOSAL, True, list(ConclusionOutbox.STEPS), {"emoji": ":tada:"}
+    )
+
+    # Concluding does not take a number; the Snapshot step does when it runs
+    assert db_service.get_config()["next_budget_id"] == "3"
+    for _ in range(2):
+        assert (
+            db_service.allocate_outbox_number(
+                "test123", ConclusionOutbox.SNAPSHOT_PROPOSAL, "next_budget_id"
+            )
+            == 3
+        )
+
+    entry = (
+        test_db.query(OutboxEntry)
+        .filter_by(step=ConclusionOutbox.SNAPSHOT_PROPOSAL)
+        .one()
+    )
+    assert entry.payload == {"emoji": ":tada:", "proposal_number": 3}
+    assert db_service.get_config()["next_budget_id"] == "4"
+
+
+@pytest.mark.asyncio
+async def test_steps_run_in_order_and_failures_are_retried(test_db):
+    DatabaseService(session=test_db).conclude_vote(
+        PROPOSAL, True, list(ConclusionOutbox.STEPS), {"emoji": ":tada:"}
+    )
+    outbox = ConclusionOutbox(AsyncDatabaseService(session=test_db))
+    outbox.RETRY_DELAY = 0
+    calls = []
+    snapshot_failures = [ValueError("Snapshot is down")]
+
+    async def snapshot(proposal_id, payload):
+        calls.append(ConclusionOutbox.SNAPSHOT_PROPOSAL)
+        if snapshot_failures:
+            raise snapshot_failures.pop()
+
+    async def post(step, proposal_id, payload):
+        assert payload["emoji"] == ":tada:"
+        calls.append(step)
+
+    outbox.register(ConclusionOutbox.SNAPSHOT_PROPOSAL, snapshot)
+    for step in ConclusionOutbox.STEPS[1:]:
+        outbox.register(
+            step,
+            lambda proposal_id, payload, step=step: post(step, proposal_id, payload),
+        )
+
+    await outbox.load()
+    await settle(outbox)
+
+    # The posts wait for the Snapshot step, which is retried without repeating anything else
+    assert calls[:2] == [ConclusionOutbox.SNAPSHOT_PROPOSAL] * 2
+    assert sorted(calls[2:]) == sorted(ConclusionOutbox.STEPS[1:])
+    assert test_db.query(OutboxEntry).count() == 0
+    assert outbox.stats() == {"pending": 0, "completed": 3, "abandoned": 0}
+
+
+@pytest.mark.asyncio
+async def test_abandoned_step_releases_later_steps(test_db):
+    DatabaseService(session=test_db).conclude_vote(
+        PROPOSAL, True, list(ConclusionOutbox.STEPS)
+    )
+    outbox = ConclusionOutbox(AsyncDatabaseService(session=test_db))
+    outbox.RETRY_DELAY = 0
+    outbox.MAX_ATTEMPTS = 2
+    posted = []
+
+    async def snapshot(proposal_id, payload):
+        raise ValueError("Snapshot is down")
+
+    async def post(proposal_id, payload):
+        posted.append(proposal_id)
+
+    outbox.register(ConclusionOutbox.SNAPSHOT_PROPOSAL, snapshot)
+    outbox.register(ConclusionOutbox.POST_THREAD_RESULT, post)
+    outbox.register(ConclusionOutbox.POST_GENERAL_RESULT, post)
+
+    await outbox.load()
+    await settle(outbox)
+
+    assert posted == ["test123", "test123"]
+    assert outbox.stats()["abandoned"] == 1
+
+
+@pytest.mark.asyncio
+async def test_step_progress_is_kept_across_retries(test_db):
+    DatabaseService(session=test_db).conclude_vote(
+        PROPOSAL, True, [ConclusionOutbox.SNAPSHOT_PROPOSAL], {"proposal_number": 3}
+    )
+    db_service = AsyncDatabaseService(session=test_db)
+    outbox = ConclusionOutbox(db_service)
+    outbox.RETRY_DELAY = 0
+    seen = []
+
+    async def snapshot(proposal_id, payload):
+        seen.append(dict(payload))
+        if not payload.get("submitted"):
+            payload["submitted"] = True
+            await db_service.update_outbox_payload(
+                proposal_id, ConclusionOutbox.SNAPSHOT_PROPOSAL, payload
+            )
+            (entry,) = await db_service.get_outbox_entries()
+            assert entry["payload"] == {"proposal_number": 3, "submitted": True}
+            raise ValueError("Snapshot timed out")
+
+    outbox.register(ConclusionOutbox.SNAPSHOT_PROPOSAL, snapshot)
+    await outbox.load()
+    await settle(outbox)
+
+    # The retry sees the marker written by the failed attempt
+    assert seen == [
+        {"proposal_number": 3},
+        {"proposal_number": 3, "submitted": True},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_hung_steps_time_out_and_retry_despite_bookkeeping_errors(test_db):
+    DatabaseService(session=test_db).conclude_vote(
+        PROPOSAL, False, [ConclusionOutbox.POST_THREAD_RESULT]
+    )
+    db_service = AsyncDatabaseService(session=test_db)
+    outbox = ConclusionOutbox(db_service)
+    outbox.RETRY_DELAY = 0
+    outbox.STEP_TIMEOUT = 0.05
+    attempts = []
+
+    async def post(proposal_id, payload):
+        attempts.append(proposal_id)
+        if len(attempts) == 1:
+            await asyncio.sleep(10)
+
+    async def retry_outbox_entry(*args):
+        raise ValueError("database is down")
+
+    # The failed retry bookkeeping does not strand the in-memory entry
+    db_service.retry_outbox_entry = retry_outbox_entry
+    outbox.register(ConclusionOutbox.POST_THREAD_RESULT, post)
+    await outbox.load()
+    await settle(outbox)
+
+    assert attempts == ["test123", "test123"]
+    assert outbox.stats() == {"pending": 0, "completed": 1, "abandoned": 0}
@@ -0,0 +1,68 @@
+import pytest
+
+from utils.permissions import PermissionCache
+
+
+class FakeRole:
+    def __init__(self, role_id, name):
+        self.id = role_id
+        self.name = name
+
+
+class FakeGuild:
+    id = 1
+    roles = [FakeRole(10, "everyone"), FakeRole(20, "Core")]
+
+    def __init__(self, member_roles):
+        self.member_roles = member_roles
+        self.fetches = 0
+
+    async def fetch_member(self, member_id):
+        self.fetches += 1
+        return FakeMember(self, member_id, self.member_roles)
+
+
+class FakeMember:
+    def __init__(self, guild, member_id, roles):
+        self.guild = guild
+        self.id = member_id
+        self.roles = roles
+
+
+class FakeUser:
+    def __init__(self, user_id):
+        self.id = user_id
+
+
+class FakeInteraction:
+    def __init__(self, guild, user):
+        self.guild = guild
+        self.user = user
+
+
+def setup_function():
+    PermissionCache._core_role_ids.clear()
+
+
+@pytest.mark.asyncio
+async def test_is_core_checks_the_current_roles_of_the_member():
+    guild = FakeGuild([FakeRole(20, "Core")])
+    interaction = FakeInteraction(guild, FakeUser(5))
+
+    assert await PermissionCache.is_core(interaction)
+
+    # Member roles are not cached, so a removed core role takes effect at once
+    guild.member_roles = []
+    assert not await PermissionCache.is_core(interaction)
+    assert guild.fetches == 2
+
+
+@pytest.mark.asyncio
+async def test_core_role_is_cached_until_roles_change():
+    guild = FakeGuild([])
+    assert PermissionCache.core_role_id(guild) == 20
+
+    guild.roles = [FakeRole(30, "core")]
+    assert PermissionCache.core_role_id(guild) == 20
+    PermissionCache.invalidate_roles(guild.id)
+    assert PermissionCache.core_role_id(guild) == 30
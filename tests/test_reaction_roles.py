@@ -0,0 +1,200 @@
+import asyncio
+import discord
+import pytest
+
+from consts.constants import DISCORD_ROLE_TRIGGERS, RULES_MESSAGE_ID
+from database.service import AsyncDatabaseService, DatabaseService
+from events.reaction_roles import ReactionRoles
+
+TRIGGER = DISCORD_ROLE_TRIGGERS[0]
+
+
+class FakeRole:
+    def __init__(self, role_id, name):
+        self.id = role_id
+        self.name = name
+
+
+class FakeGuild:
+    id = 1
+    roles = [FakeRole(500, TRIGGER["role"])]
+
+
+class FakeHTTP:
+    def __init__(self):
+        self.calls = []
+
+    async def add_role(self, guild_id, user_id, role_id, reason=None):
+        self.calls.append(("add", guild_id, user_id, role_id))
+
+    async def remove_role(self, guild_id, user_id, role_id, reason=None):
+        self.calls.append(("remove", guild_id, user_id, role_id))
+
+
+class FakeBot:
+    def __init__(self, channels=None):
+        self.http = FakeHTTP()
+        self.channels = channels or {}
+
+    def get_guild(self, guild_id):
+        return FakeGuild()
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+class FakeEmoji:
+    def __init__(self, emoji_id):
+        self.id = emoji_id
+
+
+class FakePayload:
+    def __init__(self, event_type, user_id, emoji_id, message_id=RULES_MESSAGE_ID):
+        self.event_type = event_type
+        self.message_id = message_id
+        self.channel_id = 55
+        self.guild_id = 1
+        self.user_id = user_id
+        self.emoji = FakeEmoji(emoji_id)
+        self.member = None
+
+
+@pytest.mark.asyncio
+async def test_rules_reactions_add_and_remove_roles(test_db):
+    bot = FakeBot()
+    reaction_roles = ReactionRoles(bot, AsyncDatabaseService(session=test_db))
+    reaction_roles.APPLY_INTERVAL = 0
+
+    reaction_roles.handle(FakePayload("REACTION_ADD", 7, TRIGGER["emoji_id"]))
+    reaction_roles.handle(FakePayload("REACTION_ADD", 8, TRIGGER["emoji_id"]))
+    reaction_roles.handle(FakePayload("REACTION_REMOVE", 8, TRIGGER["emoji_id"]))
+    # Other messages and emojis are ignored
+    reaction_roles.handle(FakePayload("REACTION_ADD", 9, TRIGGER["emoji_id"], 123))
+    reaction_roles.handle(FakePayload("REACTION_ADD", 9, 42))
+    await asyncio.sleep(0.01)
+
+    # The add and remove for member 8 collapse into the latest change
+    assert bot.http.calls == [("add", 1, 7, 500), ("remove", 1, 8, 500)]
+
+
+def test_role_mapping_is_built_once_per_guild():
+    reaction_roles = ReactionRoles(FakeBot())
+    assert reaction_roles.role_id_for(FakeGuild(), TRIGGER["emoji_id"]) == 500
+    assert reaction_roles.role_id_for(FakeGuild(), 42) is None
+    assert reaction_roles._role_ids == {1: {TRIGGER["emoji_id"]: 500}}
+
+    reaction_roles.invalidate(1)
+    assert reaction_roles._role_ids == {}
+
+
+class FakeResponse:
+    status = 404
+    reason = "Not Found"
+
+
+class FakeMember:
+    def __init__(self, user_id, role_ids=()):
+        self.id = user_id
+        self.bot = False
+        self.role_ids = set(role_ids)
+
+    def get_role(self, role_id):
+        return role_id in self.role_ids
+
+
+class FakeMemberGuild(FakeGuild):
+    def __init__(self, cached, fetchable):
+        self.cached = cached
+        self.fetchable = fetchable
+        self.fetched = []
+
+    def get_member(self, user_id):
+        return self.cached.get(user_id)
+
+    async def fetch_member(self, user_id):
+        self.fetched.append(user_id)
+        if user_id not in self.fetchable:
+            raise discord.NotFound(FakeResponse(), "Unknown Member")
+        return self.fetchable[user_id]
+
+
+class FakeReaction:
+    def __init__(self, emoji_id, users):
+        self.emoji = FakeEmoji(emoji_id)
+        self._users = users
+
+    async def users(self, limit=None):
+        for user in self._users:
+            yield user
+
+
+class FakeMessage:
+    def __init__(self, guild, reactions):
+        self.guild = guild
+        self.reactions = reactions
+
+
+class FakeChannel:
+    def __init__(self, message):
+        self.message = message
+
+    async def fetch_message(self, message_id):
+        return self.message
+
+
+@pytest.mark.asyncio
+async def test_reconcile_only_queues_members_missing_the_role(monkeypatch):
+    monkeypatch.setattr("events.reaction_roles.RULES_CHANNEL_ID", 55)
+    guild = FakeMemberGuild(
+        cached={7: FakeMember(7, [500])},
+        fetchable={8: FakeMember(8), 10: FakeMember(10, [500])},
+    )
+    bot_user = FakeMember(11)
+    bot_user.bot = True
+    message = FakeMessage(
+        guild,
+        [
+            FakeReaction(
+                TRIGGER["emoji_id"],
+                [FakeMember(n) for n in (7, 8, 9, 10)] + [bot_user],
+            ),
+            FakeReaction(42, [FakeMember(12)]),
+        ],
+    )
+    bot = FakeBot({55: FakeChannel(message)})
+    reaction_roles = ReactionRoles(bot)
+    reaction_roles.APPLY_INTERVAL = 0
+
+    await reaction_roles.reconcile()
+    await asyncio.sleep(0.01)
+
+    # 7 is cached with the role, 9 left the guild and 10 already has the role
+    assert sorted(guild.fetched) == [8, 9, 10]
+    assert bot.http.calls == [("add", 1, 8, 500)]
+
+
+@pytest.mark.asyncio
+async def test_rules_channel_is_learned_from_reactions(test_db, monkeypatch):
+    monkeypatch.setattr("events.reaction_roles.RULES_CHANNEL_ID", None)
+    guild = FakeMemberGuild(cached={}, fetchable={8: FakeMember(8)})
+    message = FakeMessage(guild, [FakeReaction(TRIGGER["emoji_id"], [FakeMember(8)])])
+    bot = FakeBot({55: FakeChannel(message)})
+    db_service = AsyncDatabaseService(session=test_db)
+    reaction_roles = ReactionRoles(bot, db_service)
+    reaction_roles.APPLY_INTERVAL = 0
+
+    # Without a known channel nothing is fetched at startup
+    assert await reaction_roles.find_rules_message() is None
+    await reaction_roles.reconcile()
+    assert bot.http.calls == []
+
+    # The first rules reaction stores its channel and runs the reconciliation that was skipped
+    reaction_roles.handle(FakePayload("REACTION_REMOVE", 9, TRIGGER["emoji_id"]))
+    await reaction_roles._learn_task
+    await asyncio.sleep(0.01)
+    assert DatabaseService(session=test_db).get_config() == {"rules_channel_id": "55"}
+    assert ("add", 1, 8, 500) in bot.http.calls
+
+    # Later starts read the stored channel
+    restarted = ReactionRoles(bot, db_service)
+    assert await restarted.find_rules_message() is message
@@ -0,0 +1,85 @@
+import asyncio
+import pytest
+
+from utils.rpc_endpoints import RpcEndpoint, RpcEndpointManager
+
+
+def manager_with(*names):
+    manager = RpcEndpointManager([RpcEndpoint(name, provider=None) for name in names])
+    manager.DEFAULT_HEDGE_DELAY = 0.05
+    manager.MIN_HEDGE_DELAY = 0.01
+    return manager
+
+
+def endpoint_calls(delays, failing=()):
+    calls = []
+
+    async def call(endpoint):
+        calls.append(endpoint.name)
+        await asyncio.sleep(delays[endpoint.name])
+        if endpoint.name in failing:
+            raise ValueError(f"{endpoint.name} failed")
+        return endpoint.name
+
+    return call, calls
+
+
+@pytest.mark.asyncio
+async def test_fast_endpoint_is_not_hedged():
+    manager = manager_with("PRIMARY", "SECONDARY")
+    call, calls = endpoint_calls({"PRIMARY": 0, "SECONDARY": 0})
+
+    assert await manager.request(call) == "PRIMARY"
+    assert calls == ["PRIMARY"]
+    assert manager.hedges == 0
+
+
+@pytest.mark.asyncio
+async def test_slow_endpoint_is_hedged_and_loses():
+    manager = manager_with("PRIMARY", "SECONDARY")
+    call, calls = endpoint_calls({"PRIMARY": 1, "SECONDARY": 0})
+
+    assert await manager.request(call) == "SECONDARY"
+    assert calls == ["PRIMARY", "SECONDARY"]
+    assert manager.hedges == 1
+
+    # The cancelled primary recorded a failure, so the secondary is preferred now
+    assert [endpoint.name for endpoint in manager.ordered()] == [
+        "SECONDARY",
+        "PRIMARY",
+    ]
+    stats = manager.stats()
+    assert stats["hedges"] == 1
+    # The cut-short request is kept out of the primary's latency
+    assert stats["endpoints"]["PRIMARY"]["error_rate"] == 1.0
+    assert stats["endpoints"]["PRIMARY"]["p50"] is None
+
+
+@pytest.mark.asyncio
+async def test_failures_fail_over_and_mark_endpoint_unhealthy():
+    manager = manager_with("PRIMARY", "SECONDARY")
+    call, calls = endpoint_calls({"PRIMARY": 0, "SECONDARY": 0}, failing={"PRIMARY"})
+
+    for _ in range(RpcEndpoint.MIN_SAMPLES):
+        assert await manager.request(call) == "SECONDARY"
+
+    # After its first failure the primary is tried last, so it is not retried while the secondary answers
+    assert calls == ["PRIMARY"] + ["SECONDARY"] * RpcEndpoint.MIN_SAMPLES
+    primary = manager.endpoints[0]
+    assert manager.ordered()[-1] is primary
+
+    for _ in range(RpcEndpoint.MIN_SAMPLES - 1):
+        primary.record(0.01, False)
+    assert primary.error_rate() == 1.0
+    assert not primary.healthy
+
+
+@pytest.mark.asyncio
+async def test_all_endpoints_failing_raises():
+    manager = manager_with("PRIMARY", "SECONDARY")
+    call, _ = endpoint_calls(
+        {"PRIMARY": 0, "SECONDARY": 0}, failing={"PRIMARY", "SECONDARY"}
+    )
+
+    with pytest.raises(ConnectionError):
+        await manager.request(call)
@@ -0,0 +1,67 @@
+import pytest
+
+from events.scheduled_event_users import ScheduledEventUsersClient
+
+
+class FakeHTTP:
+    def __init__(self, interested):
+        self.interested = interested
+        self.calls = []
+
+    async def get_scheduled_event_users(
+        self, guild_id, scheduled_event_id, limit, with_member=False, after=0
+    ):
+        self.calls.append((scheduled_event_id, after))
+        users = self.interested.get(scheduled_event_id)
+        if users is None:
+            raise ValueError("Unknown event")
+        page = [user_id for user_id in users if user_id > after][:limit]
+        return [{"user": {"id": user_id}} for user_id in page]
+
+
+class FakeBot:
+    def __init__(self, interested):
+        self.http = FakeHTTP(interested)
+
+
+@pytest.mark.asyncio
+async def test_every_page_is_followed():
+    bot = FakeBot({1: list(range(1, 251)), 2: list(range(1, 101))})
+    client = ScheduledEventUsersClient(bot)
+
+    users = await client.get_users(10, 1)
+    assert [user["id"] for user in users] == list(range(1, 251))
+    assert bot.http.calls == [(1, 0), (1, 100), (1, 200)]
+
+    # A full last page needs one more request to find the end
+    assert len(await client.get_users(10, 2)) == 100
+    assert bot.http.calls[3:] == [(2, 0), (2, 100)]
+
+
+@pytest.mark.asyncio
+async def test_results_are_cached_until_the_ttl_expires(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr("events.scheduled_event_users.time.monotonic", lambda: now[0])
+    bot = FakeBot({1: [1, 2, 3]})
+    client = ScheduledEventUsersClient(bot, ttl=60)
+
+    assert len(await client.get_users(10, 1)) == 3
+    now[0] += 59
+    assert len(await client.get_users(10, 1)) == 3
+    assert len(bot.http.calls) == 1
+
+    bot.http.interested[1].append(4)
+    now[0] += 2
+    assert len(await client.get_users(10, 1)) == 4
+    assert len(bot.http.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_events_map_to_an_empty_list():
+    bot = FakeBot({1: [1, 2]})
+    client = ScheduledEventUsersClient(bot)
+
+    users_by_event = await client.get_users_for_events(10, [1, 2])
+
+    assert [user["id"] for user in users_by_event[1]] == [1, 2]
+    assert users_by_event[2] == []
@@ -0,0 +1,83 @@
+import asyncio
+import pytest
+
+from tasks.scheduler import DeadlineTimer
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+async def advance(timer, clock, seconds):
+    """Move the clock and let the timer and its callbacks run"""
+    clock.now += seconds
+    timer.wake()
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_deadlines_fire_in_order():
+    fired = []
+
+    async def callback(key):
+        fired.append(key)
+
+    clock = FakeClock()
+    timer = DeadlineTimer(callback, clock=clock)
+    timer.schedule("late", clock.now + 20)
+    timer.schedule("early", clock.now + 5)
+    timer.schedule("overdue", clock.now - 1)
+
+    await advance(timer, clock, 0)
+    assert fired == ["overdue"]
+    await advance(timer, clock, 5)
+    assert fired == ["overdue", "early"]
+    await advance(timer, clock, 15)
+    assert fired == ["overdue", "early", "late"]
+    assert len(timer) == 0
+
+
+@pytest.mark.asyncio
+async def test_cancel_and_reschedule():
+    fired = []
+
+    async def callback(key):
+        fired.append(key)
+
+    clock = FakeClock()
+    timer = DeadlineTimer(callback, clock=clock)
+    timer.schedule("cancelled", clock.now + 5)
+    timer.schedule("moved", clock.now + 100)
+    timer.cancel("cancelled")
+    timer.schedule("moved", clock.now + 10)
+
+    await advance(timer, clock, 10)
+    assert fired == ["moved"]
+    assert len(timer) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_flight_callbacks_are_kept_until_done():
+    release = asyncio.Event()
+    finished = []
+
+    async def callback(key):
+        await release.wait()
+        finished.append(key)
+
+    clock = FakeClock()
+    timer = DeadlineTimer(callback, clock=clock)
+    timer.schedule("slow", clock.now)
+
+    await advance(timer, clock, 0)
+    assert len(timer._fired) == 1
+
+    release.set()
+    await advance(timer, clock, 0)
+    assert finished == ["slow"]
+    assert not timer._fired
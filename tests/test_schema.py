@@ -1,5 +1,4 @@
 from sqlalchemy import inspect
-from tests.test_database import test_db
 
 
 def test_table_exists(test_db):
@@ -10,6 +9,8 @@ def test_table_exists(test_db):
     assert "events" in tables
     assert "contributors" in tables
     assert "concluded_votes" in tables
+    assert "scheduled_jobs" in tables
+    assert "outbox" in tables
 
 
 def test_columns_exist(test_db):
@@ -22,6 +23,9 @@ def test_columns_exist(test_db):
     assert "proposal_id" in ongoing_votes_columns
     assert "draft" in ongoing_votes_columns
     assert "end_time" in ongoing_votes_columns
+    assert "yes_count" in ongoing_votes_columns
+    assert "no_count" in ongoing_votes_columns
+    assert "abstain_count" in ongoing_votes_columns
 
     events_columns = {col["name"] for col in inspector.get_columns("events")}
     assert "event_id" in events_columns
@@ -0,0 +1,76 @@
+import asyncio
+import sys
+import pytest
+
+from utils.snapshot_sidecar import SnapshotSidecar, SnapshotSidecarError
+
+# Stands in for snapshot/sidecar.js: echoes params back, fails "fail", exits on "crash" and
+# prints an oversized line on "flood"
+FAKE_SIDECAR = """
+import json, sys
+for line in sys.stdin:
+    request = json.loads(line)
+    if request["op"] == "crash":
+        sys.exit(3)
+    if request["op"] == "flood":
+        print("x" * request["params"]["size"], flush=True)
+        continue
+    if request["op"] == "fail":
+        response = {"id": request["id"], "ok": False, "error": "boom"}
+    else:
+        response = {"id": request["id"], "ok": True, "result": request["params"]}
+    print("working", file=sys.stderr, flush=True)
+    print(json.dumps(response), flush=True)
+"""
+
+
+@pytest.mark.asyncio
+async def test_requests_are_answered_over_the_protocol():
+    sidecar = SnapshotSidecar([sys.executable, "-c", FAKE_SIDECAR])
+    try:
+        body = "x" * 500_000  # Larger than argv allows on some systems
+        results = await asyncio.gather(
+            sidecar.request("echo", {"n": 1}),
+            sidecar.request("echo", {"n": 2}),
+            sidecar.request("echo", {"body": body}),
+        )
+        assert results == [{"n": 1}, {"n": 2}, {"body": body}]
+
+        with pytest.raises(SnapshotSidecarError, match="boom"):
+            await sidecar.request("fail", {})
+    finally:
+        await sidecar.stop()
+
+
+@pytest.mark.asyncio
+async def test_sidecar_is_restarted_after_it_exits():
+    sidecar = SnapshotSidecar([sys.executable, "-c", FAKE_SIDECAR])
+    sidecar.MIN_RESTART_DELAY = 0.01
+    try:
+        with pytest.raises(SnapshotSidecarError):
+            await sidecar.request("crash", {})
+
+        assert await sidecar.request("echo", {"n": 1}) == {"n": 1}
+        assert sidecar.restarts == 1
+    finally:
+        await sidecar.stop()
+
+
+@pytest.mark.asyncio
+async def test_unreadable_sidecar_is_killed_before_restarting():
+    sidecar = SnapshotSidecar([sys.executable, "-c", FAKE_SIDECAR])
+    sidecar.MIN_RESTART_DELAY = 0.01
+    sidecar.STREAM_LIMIT = 1024
+    try:
+        await sidecar.start()
+        await asyncio.wait_for(sidecar._ready.wait(), timeout=10)
+        first = sidecar._process
+
+        with pytest.raises(SnapshotSidecarError):
+            await sidecar.request("flood", {"size": 10_000}, timeout=10)
+
+        assert await sidecar.request("echo", {"n": 1}) == {"n": 1}
+        assert sidecar._process is not first
+        assert first.returncode is not None
+    finally:
+        await sidecar.stop()
@@ -0,0 +1,46 @@
+import asyncio
+import pytest
+
+from utils.supply_cache import SupplyCache
+
+
+class FakeChain:
+    def __init__(self):
+        self.block = 100
+        self.supply = 1000.0
+        self.reads = 0
+
+    async def fetch(self):
+        self.reads += 1
+        await asyncio.sleep(0)
+        return self.block, self.supply
+
+
+@pytest.mark.asyncio
+async def test_quorum_is_read_from_cache_until_stale():
+    chain = FakeChain()
+    cache = SupplyCache(chain.fetch, max_age=60)
+
+    # Empty cache: concurrent readers share a single forced refresh
+    assert await asyncio.gather(cache.get_quorum(), cache.get_quorum()) == [200, 200]
+    assert chain.reads == 1
+
+    chain.supply = 2000.0
+    assert await cache.get_quorum() == 200
+    assert chain.reads == 1
+
+    cache.max_age = 0
+    assert await cache.get_quorum() == 400
+    assert chain.reads == 2
+    assert cache.stats()["block"] == 100
+
+
+@pytest.mark.asyncio
+async def test_older_blocks_do_not_replace_newer_supply():
+    chain = FakeChain()
+    cache = SupplyCache(chain.fetch)
+    await cache.refresh()
+
+    chain.block, chain.supply = 99, 5.0
+    assert await cache.refresh() == 1000.0
+    assert cache.stats()["block"] == 100
@@ -0,0 +1,114 @@
+import pytest
+from eth_abi import decode, encode
+from web3 import Web3
+
+from utils.token_supply import (
+    AGGREGATE3,
+    DECIMALS,
+    MULTICALL3_ADDRESS,
+    TOTAL_SUPPLY,
+    TokenSupplyReader,
+)
+
+TOKENS = [
+    "0xE29bfb26454117C196Ff5F4E67E99B21a8dB028D",
+    "0x28f51dD5898289DF72cd14CEE8c957fdc16Af9b1",
+]
+SUPPLIES = {TOKENS[0]: (5 * 10**18, 18), TOKENS[1]: (25 * 10**6, 6)}
+BLOCK = 1234
+
+
+def uint(value):
+    return encode(["uint256"], [value])
+
+
+class FakeProvider:
+    def __init__(self, multicall=True, batches=True):
+        self.multicall = multicall
+        self.accepts_batches = batches
+        self.requests = []
+        self.batches = []
+
+    def answer(self, to, data):
+        supply, decimals = SUPPLIES[Web3.to_checksum_address(to)]
+        return supply if data == TOTAL_SUPPLY else decimals
+
+    async def make_request(self, method, params):
+        self.requests.append((method, params))
+        if method == "eth_blockNumber":
+            return {"jsonrpc": "2.0", "id": 1, "result": hex(BLOCK)}
+        if params[0]["to"] != MULTICALL3_ADDRESS:
+            value = self.answer(
+                params[0]["to"], Web3.to_bytes(hexstr=params[0]["data"])
+            )
+            return {"jsonrpc": "2.0", "id": 1, "result": Web3.to_hex(uint(value))}
+        if not self.multicall:
+            return {"jsonrpc": "2.0", "id": 1, "result": "0x"}
+
+        data = Web3.to_bytes(hexstr=params[0]["data"])
+        assert params[0]["to"] == MULTICALL3_ADDRESS and data[:4] == AGGREGATE3
+        (calls,) = decode(["(address,bool,bytes)[]"], data[4:])
+        returns = [
+            (
+                True,
+                uint(
+                    BLOCK
+                    if Web3.to_checksum_address(to) == MULTICALL3_ADDRESS
+                    else self.answer(to, call)
+                ),
+            )
+            for to, _, call in calls
+        ]
+        result = Web3.to_hex(encode(["(bool,bytes)[]"], [returns]))
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    async def make_batch_request(self, requests):
+        self.batches.append(requests)
+        if not self.accepts_batches:
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}
+        responses = [{"jsonrpc": "2.0", "id": 0, "result": hex(BLOCK)}]
+        for method, params in requests[1:]:
+            value = self.answer(
+                params[0]["to"], Web3.to_bytes(hexstr=params[0]["data"])
+            )
+            responses.append(
+                {"jsonrpc": "2.0", "id": 0, "result": Web3.to_hex(uint(value))}
+            )
+        return responses
+
+
+@pytest.mark.asyncio
+async def test_supplies_are_read_in_one_multicall():
+    provider = FakeProvider()
+    reader = TokenSupplyReader(TOKENS)
+
+    assert await reader.read(provider) == (BLOCK, 30.0)
+    assert await reader.read(provider) == (BLOCK, 30.0)
+    assert [method for method, _ in provider.requests] == ["eth_call", "eth_call"]
+    assert provider.batches == []
+
+
+@pytest.mark.asyncio
+async def test_batch_is_used_where_multicall_is_not_deployed():
+    provider = FakeProvider(multicall=False)
+    reader = TokenSupplyReader(TOKENS)
+
+    assert await reader.read(provider) == (BLOCK, 30.0)
+    assert await reader.read(provider) == (BLOCK, 30.0)
+    # Multicall is only probed once per provider
+    assert len(provider.requests) == 1
+    assert len(provider.batches) == 2
+    assert [method for method, _ in provider.batches[0]] == ["eth_blockNumber"] + [
+        "eth_call"
+    ] * 2 * len(TOKENS)
+
+
+@pytest.mark.asyncio
+async def test_calls_are_sent_concurrently_where_batches_are_rejected():
+    provider = FakeProvider(multicall=False, batches=False)
+    reader = TokenSupplyReader(TOKENS)
+
+    assert await reader.read(provider) == (BLOCK, 30.0)
+    assert len(provider.batches) == 1
+    # The multicall probe, then the block number and two calls per token
+    assert len(provider.requests) == 1 + 1 + 2 * len(TOKENS)
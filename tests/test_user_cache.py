@@ -0,0 +1,50 @@
+import asyncio
+import pytest
+
+from utils.user_cache import UserCache
+
+
+class FakeBot:
+    def __init__(self):
+        self.fetches = 0
+
+    def get_user(self, user_id):
+        return None
+
+    async def fetch_user(self, user_id):
+        self.fetches += 1
+        await asyncio.sleep(0.01)
+        return f"user-{user_id}"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_fetches_are_collapsed():
+    bot = FakeBot()
+    cache = UserCache(bot)
+
+    users = await asyncio.gather(*(cache.get_user(1) for _ in range(5)))
+
+    assert users == ["user-1"] * 5
+    assert bot.fetches == 1
+    assert cache.stats()["collapsed"] == 4
+
+    assert await cache.get_user(1) == "user-1"
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_and_ttl_expiry():
+    bot = FakeBot()
+    cache = UserCache(bot, maxsize=2)
+
+    for user_id in (1, 2, 3):
+        await cache.get_user(user_id)
+    assert cache.stats()["size"] == 2
+
+    await cache.get_user(1)
+    assert bot.fetches == 4
+
+    cache.ttl = 0
+    await cache.get_user(5)
+    await cache.get_user(5)
+    assert bot.fetches == 6
@@ -0,0 +1,106 @@
+import pytest
+
+from consts.constants import NO_VOTE, YES_VOTE
+from proposals.vote_tally import VoteTally
+
+
+class FakeUser:
+    id = 1
+
+
+class FakeReaction:
+    def __init__(self, emoji, count, me=False):
+        self.emoji = emoji
+        self.count = count
+        self.me = me
+
+
+class FakeMessage:
+    def __init__(self, reactions):
+        self.reactions = reactions
+
+
+class FakeChannel:
+    def __init__(self, message):
+        self.message = message
+
+    async def fetch_message(self, message_id):
+        return self.message
+
+
+class FakeBot:
+    user = FakeUser()
+
+    def __init__(self, message=None):
+        self.message = message
+
+    def get_partial_messageable(self, channel_id):
+        return FakeChannel(self.message)
+
+
+class FakePayload:
+    def __init__(self, message_id, user_id, emoji):
+        self.message_id = message_id
+        self.user_id = user_id
+        self.emoji = emoji
+
+
+@pytest.mark.asyncio
+async def test_apply_counts_reactions_on_vote_messages():
+    tally = VoteTally(FakeBot())
+    tally.EDIT_DEBOUNCE = 60
+    tally.register("proposal", 100, 200, "Title")
+
+    tally.apply(FakePayload(100, 2, YES_VOTE), 1)
+    tally.apply(FakePayload(100, 3, YES_VOTE), 1)
+    tally.apply(FakePayload(100, 2, NO_VOTE), 1)
+    tally.apply(FakePayload(100, 3, YES_VOTE), -1)
+    # The bot's own reactions, other emojis and other messages are ignored
+    tally.apply(FakePayload(100, 1, YES_VOTE), 1)
+    tally.apply(FakePayload(100, 2, "🎉"), 1)
+    tally.apply(FakePayload(999, 2, YES_VOTE), 1)
+
+    assert tally.get("proposal") == {"yes_count": 1, "no_count": 1, "abstain_count": 0}
+
+    tally.unregister("proposal")
+    assert tally.get("proposal") is None
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_only_changed_votes(monkeypatch):
+    written = []
+
+    class FakeDatabaseService:
+        async def update_vote_tallies(self, tallies):
+            written.append(tallies)
+
+    monkeypatch.setattr(
+        "proposals.vote_tally.AsyncDatabaseService", FakeDatabaseService
+    )
+
+    tally = VoteTally(FakeBot())
+    tally.register("a", 100, 200, "A", {"yes_count": 2})
+    tally.register("b", 101, 200, "B")
+    tally.apply(FakePayload(100, 2, YES_VOTE), 1)
+
+    await tally.flush()
+    await tally.flush()
+    tally.unregister("a")
+
+    assert written == [{"a": {"yes_count": 3, "no_count": 0, "abstain_count": 0}}]
+
+
+@pytest.mark.asyncio
+async def test_counts_for_reconciles_with_the_vote_message():
+    # Reactions that arrived while the gateway was disconnected never reached apply()
+    bot = FakeBot(
+        FakeMessage([FakeReaction(YES_VOTE, 4, me=True), FakeReaction(NO_VOTE, 1)])
+    )
+    tally = VoteTally(bot)
+    tally.EDIT_DEBOUNCE = 60
+    tally.register("proposal", 100, 200, "Title", {"yes_count": 1})
+
+    counts = await tally.counts_for("proposal", {})
+
+    assert counts == {"yes_count": 3, "no_count": 1, "abstain_count": 0}
+    tally.unregister("proposal")
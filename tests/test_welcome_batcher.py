@@ -0,0 +1,72 @@
+import asyncio
+import pytest
+
+from consts.constants import COLLAB_LAND_CHANNEL, GENERAL_CHANNEL, START_HERE_CHANNEL
+from events.welcome_batcher import MESSAGE_LIMIT, WelcomeBatcher
+from utils.channel_index import ChannelIndex
+from utils.outbound import OutboundQueue
+
+
+class FakeChannel:
+    def __init__(self, guild, channel_id, name):
+        self.guild = guild
+        self.id = channel_id
+        self.name = name
+        self.messages = []
+
+    async def send(self, content):
+        self.messages.append(content)
+
+
+class FakeGuild:
+    id = 1
+    name = "Bloom"
+
+    def __init__(self):
+        self.channels = [
+            FakeChannel(self, 10, GENERAL_CHANNEL),
+            FakeChannel(self, 11, COLLAB_LAND_CHANNEL),
+            FakeChannel(self, 12, START_HERE_CHANNEL),
+        ]
+
+    def get_channel(self, channel_id):
+        return next((c for c in self.channels if c.id == channel_id), None)
+
+
+class FakeBot:
+    def __init__(self):
+        self.outbound = OutboundQueue()
+
+
+class FakeMember:
+    def __init__(self, guild, member_id):
+        self.guild = guild
+        self.mention = f"<@{member_id}>"
+
+
+def setup_function():
+    ChannelIndex._channels.clear()
+
+
+@pytest.mark.asyncio
+async def test_joins_within_window_are_welcomed_together():
+    guild = FakeGuild()
+    batcher = WelcomeBatcher(FakeBot(), window=0.01)
+
+    for member_id in range(3):
+        batcher.add(FakeMember(guild, member_id))
+    await asyncio.sleep(0.05)
+
+    messages = guild.channels[0].messages
+    assert len(messages) == 1
+    assert "<@0>, <@1>, <@2>" in messages[0]
+    assert "<#11>" in messages[0] and "<#12>" in messages[0]
+
+
+def test_format_welcomes_splits_at_message_limit():
+    mentions = [f"<@{100000000000000000 + i}>" for i in range(200)]
+    messages = WelcomeBatcher.format_welcomes("Bloom", mentions, 11, 12)
+
+    assert len(messages) > 1
+    assert all(len(message) <= MESSAGE_LIMIT for message in messages)
+    assert sum(message.count("<@") for message in messages) == 200
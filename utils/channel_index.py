@@ -0,0 +1,88 @@
+"""
+The ChannelIndex class maps channel names to channel IDs per guild, so channels can be looked up by name
+without scanning guild.channels.
+
+A guild is indexed the first time it is looked up and is kept current by the on_guild_channel_create,
+on_guild_channel_update and on_guild_channel_delete listeners in cogs/events.py.
+Names missing from a guild resolve through CONSTANT_FALLBACK_MAPPING in consts/constants.py.
+"""
+
+from typing import Dict, Optional
+
+import discord
+
+from consts.constants import CONSTANT_FALLBACK_MAPPING
+from logger.logger import logger
+
+
+class ChannelIndex:
+    # guild_id -> {channel name: channel_id}
+    _channels: Dict[int, Dict[str, int]] = {}
+
+    @classmethod
+    def index_guild(cls, guild: discord.Guild) -> None:
+        """Build the name index of a guild from its cached channels"""
+        names: Dict[str, int] = {}
+        for channel in guild.channels:
+            # Keep the first channel of a name, like discord.utils.get does
+            names.setdefault(channel.name, channel.id)
+        cls._channels[guild.id] = names
+        logger.info(f"Indexed {len(names)} channel names for guild {guild.id}")
+
+    @classmethod
+    def forget_guild(cls, guild_id: int) -> None:
+        cls._channels.pop(guild_id, None)
+
+    @classmethod
+    def add(cls, channel: discord.abc.GuildChannel) -> None:
+        """Index a created channel"""
+        names = cls._channels.get(channel.guild.id)
+        if names is not None:
+            names.setdefault(channel.name, channel.id)
+
+    @classmethod
+    def remove(cls, channel: discord.abc.GuildChannel) -> None:
+        """Drop a deleted channel, re-indexing the guild if another channel shares its name"""
+        names = cls._channels.get(channel.guild.id)
+        if names is not None and names.get(channel.name) == channel.id:
+            cls.index_guild(channel.guild)
+
+    @classmethod
+    def update(
+        cls, before: discord.abc.GuildChannel, after: discord.abc.GuildChannel
+    ) -> None:
+        """Follow a renamed channel"""
+        if before.name != after.name:
+            cls.remove(before)
+            cls.add(after)
+
+    @classmethod
+    def get(
+        cls, guild: discord.Guild, channel_name: str
+    ) -> Optional[discord.abc.GuildChannel]:
+        """
+        Get a channel of a guild by name, falling back to the name in CONSTANT_FALLBACK_MAPPING.
+
+        Parameters:
+        guild (discord.Guild): The guild to search in
+        channel_name (str): The name of the channel to find
+
+        Returns:
+        Optional[discord.abc.GuildChannel]: The channel, or None if neither name exists in the guild
+        """
+        if guild.id not in cls._channels:
+            cls.index_guild(guild)
+
+        for name in (channel_name, CONSTANT_FALLBACK_MAPPING.get(channel_name)):
+            channel_id = cls._channels[guild.id].get(name)
+            if channel_id is None:
+                continue
+            channel = guild.get_channel(channel_id)
+            if channel is not None:
+                return channel
+            # The cache no longer has the channel; rebuild and look it up once more
+            cls.index_guild(guild)
+            channel_id = cls._channels[guild.id].get(name)
+            if channel_id is not None:
+                return guild.get_channel(channel_id)
+        return None
@@ -0,0 +1,137 @@
+"""
+The DMNotifier class delivers contributor mention DMs in the background.
+
+Mentions are collected per recipient for a short window so repeated mentions of the same message are
+deduplicated and bursts are folded into a single digest DM. Digests are delivered from a bounded queue
+by a fixed number of workers, so message and reaction handlers never wait on DM delivery.
+When the pipeline is full, new notifications are dropped and counted rather than queued without bound.
+"""
+
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+from logger.logger import logger
+
+
+class DMNotifier:
+    MAX_LINKS_PER_DIGEST = 10
+
+    def __init__(
+        self,
+        bot: commands.Bot,
+        window: float = 10.0,
+        max_pending: int = 500,
+        concurrency: int = 3,
+    ):
+        """
+        Parameters:
+        bot (commands.Bot): The bot used to resolve and message users.
+        window (float): Seconds to collect mentions for a recipient before sending.
+        max_pending (int): Maximum number of recipients waiting or queued for delivery.
+        concurrency (int): Number of workers sending DMs concurrently.
+        """
+        self.bot = bot
+        self.window = window
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._pending: Dict[int, List[str]] = {}
+        self._queue: "asyncio.Queue[Tuple[int, List[str]]]" = asyncio.Queue(
+            maxsize=max_pending
+        )
+        self._workers: List[asyncio.Task] = []
+        self.sent = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def notify(self, user_id: int, message_link: str) -> bool:
+        """
+        Queue a mention DM for a user without waiting for it to be delivered.
+
+        Parameters:
+        user_id (int): The ID of the user to notify.
+        message_link (str): The jump URL of the message the user was mentioned in.
+
+        Returns:
+        bool: False if the notification was dropped because the pipeline is full.
+        """
+        links = self._pending.get(user_id)
+        if links is not None:
+            if message_link not in links:
+                links.append(message_link)
+            self.coalesced += 1
+            return True
+
+        if len(self._pending) + self._queue.qsize() >= self.max_pending:
+            self.dropped += 1
+            logger.warning(f"DM queue is full, dropping notification for {user_id}")
+            return False
+
+        self._pending[user_id] = [message_link]
+        self._ensure_workers()
+        asyncio.get_running_loop().call_later(self.window, self._flush, user_id)
+        return True
+
+    def stats(self) -> Dict[str, int]:
+        """Return counters describing the notification pipeline"""
+        return {
+            "pending": len(self._pending),
+            "queued": self._queue.qsize(),
+            "sent": self.sent,
+            "coalesced": self.coalesced,
+            "dropped": self.dropped,
+        }
+
+    def _flush(self, user_id: int) -> None:
+        links = self._pending.pop(user_id, None)
+        if not links:
+            return
+        try:
+            self._queue.put_nowait((user_id, links))
+        except asyncio.QueueFull:
+            self.dropped += 1
+            logger.warning(f"DM queue is full, dropping notification for {user_id}")
+
+    def _ensure_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            user_id, links = await self._queue.get()
+            try:
+                await self._send(user_id, links)
+            except Exception as e:
+                logger.error(f"Error sending DM to {user_id}: {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _send(self, user_id: int, links: List[str]) -> None:
+        user: Optional[discord.User] = None
+        try:
+            user = await self.bot.user_cache.get_user(user_id)
+        except discord.errors.NotFound:
+            logger.warning(f"User not found: {user_id}")
+        if not user:
+            return
+
+        await user.send(self.format_digest(user.display_name, links))
+        self.sent += 1
+
+    @classmethod
+    def format_digest(cls, display_name: str, links: List[str]) -> str:
+        """Format the DM for one or more mentions of a user"""
+        if len(links) == 1:
+            return f"Hello {display_name}! You have been mentioned in this message! {links[0]}"
+
+        shown = links[: cls.MAX_LINKS_PER_DIGEST]
+        digest = (
+            f"Hello {display_name}! You have been mentioned in {len(links)} messages!\n"
+        )
+        digest += "\n".join(shown)
+        if len(links) > len(shown):
+            digest += f"\n...and {len(links) - len(shown)} more"
+        return digest
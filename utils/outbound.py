@@ -0,0 +1,152 @@
+"""
+The OutboundQueue class is the single path for messages the bot posts to channels on its own.
+
+Messages are queued by priority (vote results before welcomes before reminders) and each channel has a token bucket
+so bursts stay under Discord's per-channel limits. A message whose channel is out of tokens is put back on the
+queue once its next token is due, so a busy channel does not hold up the workers. Failed sends are not retried
+here: discord.py already retries 429 and 5xx responses itself, and repeating a send that failed with a server
+error could post the message twice. stats() exposes the queue depth per priority and send counters.
+"""
+
+import asyncio
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Dict, Optional, Tuple
+
+import discord
+
+from logger.logger import logger
+
+
+class Priority(IntEnum):
+    VOTE_RESULT = 0
+    WELCOME = 1
+    REMINDER = 2
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int):
+        """
+        Parameters:
+        rate (float): Tokens added per second.
+        capacity (int): Maximum number of tokens, i.e. the allowed burst.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+
+    def take(self) -> float:
+        """Take a token. Returns 0 on success, otherwise the seconds to wait before trying again"""
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0.0
+        return (1 - self.tokens) / self.rate
+
+
+class OutboundQueue:
+    # Discord allows about 5 messages per 5 seconds per channel
+    CHANNEL_RATE = 1.0
+    CHANNEL_BURST = 5
+
+    def __init__(self, concurrency: int = 4):
+        """
+        Parameters:
+        concurrency (int): Number of messages sent at the same time, across channels.
+        """
+        self.concurrency = concurrency
+        self._queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._counter = itertools.count()
+        self._buckets: Dict[int, TokenBucket] = {}
+        self._workers = []
+        self._depth = {priority: 0 for priority in Priority}
+        self._sent = 0
+        self._failed = 0
+
+    def send(
+        self,
+        channel: discord.abc.Messageable,
+        content: Optional[str] = None,
+        priority: Priority = Priority.REMINDER,
+        **kwargs: Any,
+    ) -> asyncio.Future:
+        """
+        Queue a message for a channel.
+
+        Parameters:
+        channel (Messageable): The channel or thread to post in.
+        content (Optional[str]): The message content.
+        priority (Priority): The priority class of the message.
+        **kwargs: Other arguments for channel.send, such as embed.
+
+        Returns:
+        asyncio.Future: Resolves to the sent message, or raises the error of the last attempt.
+        Callers that do not need the result can ignore it.
+        """
+        future = asyncio.get_running_loop().create_future()
+        # Retrieve a failure even when nobody awaits the future, it is logged by the worker
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        self._put((priority, next(self._counter), channel, content, kwargs, future))
+        self._start_workers()
+        return future
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "depth": {priority.name: depth for priority, depth in self._depth.items()},
+            "sent": self._sent,
+            "failed": self._failed,
+        }
+
+    def _put(self, item: Tuple) -> None:
+        self._queue.put_nowait(item)
+        self._depth[item[0]] += 1
+
+    def _defer(self, item: Tuple, delay: float) -> None:
+        """Put a message back on the queue after a delay. It keeps its place among the messages of its priority"""
+        self._depth[item[0]] += 1
+        asyncio.get_running_loop().call_later(delay, self._queue.put_nowait, item)
+
+    def _start_workers(self) -> None:
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.concurrency:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            self._depth[item[0]] -= 1
+            try:
+                await self._deliver(item)
+            finally:
+                self._queue.task_done()
+
+    async def _deliver(self, item: Tuple) -> None:
+        priority, _, channel, content, kwargs, future = item
+        bucket = self._buckets.setdefault(
+            channel.id, TokenBucket(self.CHANNEL_RATE, self.CHANNEL_BURST)
+        )
+        delay = bucket.take()
+        if delay > 0:
+            self._defer(item, delay)
+            return
+
+        try:
+            message = await channel.send(content, **kwargs)
+        except Exception as e:
+            self._fail(channel, future, e)
+        else:
+            self._sent += 1
+            if not future.done():
+                future.set_result(message)
+
+    def _fail(
+        self, channel: discord.abc.Messageable, future: asyncio.Future, error: Exception
+    ) -> None:
+        self._failed += 1
+        logger.error(f"Error sending message to channel {channel.id}: {error}")
+        if not future.done():
+            future.set_exception(error)
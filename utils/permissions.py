@@ -0,0 +1,64 @@
+"""
+The PermissionCache class answers whether a guild member has the 'core' role without a REST call.
+
+It caches the ID of each guild's core role, invalidated by the on_guild_role_* listeners in cogs/events.py.
+Interactions in a guild already carry the invoking member with their current roles, so those are checked
+directly; the REST fetch is only a fallback for interactions that do not.
+"""
+
+from typing import Dict, Optional, Set
+
+import discord
+
+from logger.logger import logger
+
+CORE_ROLE_NAME = "core"
+
+
+class PermissionCache:
+    # guild_id -> ID of the core role, or None if the guild has none
+    _core_role_ids: Dict[int, Optional[int]] = {}
+
+    @classmethod
+    def core_role_id(cls, guild: discord.Guild) -> Optional[int]:
+        """Return the ID of the 'core' role of a guild"""
+        if guild.id not in cls._core_role_ids:
+            cls._core_role_ids[guild.id] = next(
+                (
+                    role.id
+                    for role in guild.roles
+                    if role.name.lower() == CORE_ROLE_NAME
+                ),
+                None,
+            )
+        return cls._core_role_ids[guild.id]
+
+    @staticmethod
+    async def member_role_ids(interaction: discord.Interaction) -> Set[int]:
+        """
+        Return the role IDs of the member who invoked an interaction.
+
+        Parameters:
+        interaction (Interaction): The interaction of the command invocation.
+
+        Returns:
+        Set[int]: The role IDs of the member.
+        """
+        member = interaction.user
+        if not isinstance(member, discord.Member):
+            logger.info(f"Fetching roles of member {interaction.user.id}")
+            member = await interaction.guild.fetch_member(interaction.user.id)
+        return {role.id for role in member.roles}
+
+    @classmethod
+    async def is_core(cls, interaction: discord.Interaction) -> bool:
+        """Check if the member who invoked an interaction has the 'core' role"""
+        core_role_id = cls.core_role_id(interaction.guild)
+        if core_role_id is None:
+            return False
+        return core_role_id in await cls.member_role_ids(interaction)
+
+    @classmethod
+    def invalidate_roles(cls, guild_id: int) -> None:
+        """Forget the core role of a guild after its roles changed"""
+        cls._core_role_ids.pop(guild_id, None)
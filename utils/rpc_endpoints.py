@@ -0,0 +1,204 @@
+"""
+The RpcEndpointManager class spreads on-chain reads over the configured RPC endpoints.
+
+Each endpoint keeps a rolling window of request latencies and outcomes. Reads go to the healthy endpoint with
+the lowest median latency; when it has not answered within its own p95 latency, the same read is hedged to the
+next endpoint and whichever answers first wins. Failed reads fail over to the next endpoint immediately.
+stats() exposes the health and latency of every endpoint and the number of hedged reads.
+"""
+
+import asyncio
+import statistics
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
+
+from aiohttp import ClientTimeout
+from web3 import AsyncHTTPProvider
+from web3.providers import AsyncBaseProvider
+
+from logger.logger import logger
+
+T = TypeVar("T")
+
+
+class RpcEndpoint:
+    WINDOW = 50
+    # An endpoint failing more than this share of its recent requests is unhealthy
+    MAX_ERROR_RATE = 0.5
+    MIN_SAMPLES = 3
+
+    def __init__(self, name: str, provider: AsyncBaseProvider):
+        """
+        Parameters:
+        name (str): Name used in logs and stats, e.g. "PRIMARY".
+        provider (AsyncBaseProvider): The provider sending requests to the endpoint.
+        """
+        self.name = name
+        self.provider = provider
+        # (latency in seconds, succeeded)
+        self._samples: Deque[Tuple[float, bool]] = deque(maxlen=self.WINDOW)
+
+    def record(self, latency: float, ok: bool) -> None:
+        self._samples.append((latency, ok))
+
+    def latency(self, percentile: int = 50) -> Optional[float]:
+        """The given percentile of recent successful request latencies, or None without samples"""
+        latencies = sorted(latency for latency, ok in self._samples if ok)
+        if not latencies:
+            return None
+        if len(latencies) == 1:
+            return latencies[0]
+        return statistics.quantiles(latencies, n=100, method="inclusive")[
+            percentile - 1
+        ]
+
+    def error_rate(self) -> float:
+        if not self._samples:
+            return 0.0
+        return sum(1 for _, ok in self._samples if not ok) / len(self._samples)
+
+    @property
+    def healthy(self) -> bool:
+        return (
+            len(self._samples) < self.MIN_SAMPLES
+            or self.error_rate() <= self.MAX_ERROR_RATE
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "healthy": self.healthy,
+            "requests": len(self._samples),
+            "error_rate": self.error_rate(),
+            "p50": self.latency(50),
+            "p95": self.latency(95),
+        }
+
+
+class RpcEndpointManager:
+    # Hedge delay used before an endpoint has any latency samples
+    DEFAULT_HEDGE_DELAY = 2.0
+    MIN_HEDGE_DELAY = 0.2
+
+    def __init__(self, endpoints: List[RpcEndpoint]):
+        """
+        Parameters:
+        endpoints (List[RpcEndpoint]): The endpoints, in configured order of preference.
+        """
+        self.endpoints = endpoints
+        self.hedges = 0
+
+    @classmethod
+    def from_urls(
+        cls, urls: Dict[str, Optional[str]], timeout: float = 10
+    ) -> "RpcEndpointManager":
+        """Create a manager with one keep-alive HTTP provider per configured URL, skipping unset ones"""
+        return cls(
+            [
+                RpcEndpoint(
+                    name,
+                    AsyncHTTPProvider(
+                        url, request_kwargs={"timeout": ClientTimeout(total=timeout)}
+                    ),
+                )
+                for name, url in urls.items()
+                if url
+            ]
+        )
+
+    def ordered(self) -> List[RpcEndpoint]:
+        """
+        Healthy endpoints by median latency, then unhealthy ones. Endpoints without samples are tried first,
+        endpoints whose recent requests all failed or lost a hedge last within their group.
+        """
+
+        def key(endpoint: RpcEndpoint) -> Tuple[bool, float]:
+            latency = endpoint.latency(50)
+            if latency is None:
+                latency = float("inf") if endpoint.stats()["requests"] else 0.0
+            return not endpoint.healthy, latency
+
+        return sorted(self.endpoints, key=key)
+
+    def hedge_delay(self, endpoint: RpcEndpoint) -> float:
+        """Seconds to wait for an endpoint before hedging its request to the next one"""
+        p95 = endpoint.latency(95)
+        if p95 is None:
+            return self.DEFAULT_HEDGE_DELAY
+        return max(p95, self.MIN_HEDGE_DELAY)
+
+    async def request(self, call: Callable[[RpcEndpoint], Awaitable[T]]) -> T:
+        """
+        Run a read against the best endpoint, hedging and failing over to the others.
+
+        Parameters:
+        call (Callable[[RpcEndpoint], Awaitable[T]]): Performs the read against the given endpoint.
+
+        Returns:
+        T: The result of the first endpoint to answer successfully.
+
+        Raises:
+        ConnectionError: If every endpoint failed.
+        """
+        remaining = self.ordered()
+        running: Dict[asyncio.Task, RpcEndpoint] = {}
+        last_error: Optional[BaseException] = None
+        try:
+            while remaining or running:
+                # Start the next endpoint on the first pass, after a failure or when hedging
+                delay = None
+                if remaining:
+                    endpoint = remaining.pop(0)
+                    running[asyncio.create_task(self._timed(endpoint, call))] = endpoint
+                    if remaining:
+                        delay = self.hedge_delay(endpoint)
+
+                done, _ = await asyncio.wait(
+                    running, timeout=delay, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    self.hedges += 1
+                    logger.info(
+                        f"{endpoint.name} RPC is slower than {delay:.2f}s; hedging to {remaining[0].name}"
+                    )
+                    continue
+
+                for task in done:
+                    failed = running.pop(task)
+                    if task.exception() is None:
+                        return task.result()
+                    last_error = task.exception()
+                    logger.error(f"{failed.name} RPC request failed: {last_error}")
+        finally:
+            for task in running:
+                task.cancel()
+            # Let the losers record how long they ran
+            await asyncio.gather(*running, return_exceptions=True)
+
+        raise ConnectionError(f"All RPC endpoints failed: {last_error}")
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "hedges": self.hedges,
+            "endpoints": {
+                endpoint.name: endpoint.stats() for endpoint in self.endpoints
+            },
+        }
+
+    @staticmethod
+    async def _timed(
+        endpoint: RpcEndpoint, call: Callable[[RpcEndpoint], Awaitable[T]]
+    ) -> T:
+        started = time.monotonic()
+        try:
+            result = await call(endpoint)
+        except asyncio.CancelledError:
+            # Lost a hedge: it did not answer within its p95, which counts against its health. Its
+            # cut-short latency is not a real answer time, so it stays out of the latency percentiles
+            endpoint.record(time.monotonic() - started, False)
+            raise
+        except Exception:
+            endpoint.record(time.monotonic() - started, False)
+            raise
+        endpoint.record(time.monotonic() - started, True)
+        return result
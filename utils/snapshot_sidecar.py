@@ -0,0 +1,193 @@
+"""
+The SnapshotSidecar class runs snapshot/sidecar.js as a long-lived Node process and sends it Snapshot operations
+over a line-delimited JSON protocol on stdin/stdout, instead of spawning node for every call.
+
+A supervisor task restarts the process with backoff whenever it exits or its output cannot be read, killing it
+first in the latter case; requests in flight at that moment fail with SnapshotSidecarError. The process' stderr
+is forwarded to the logger.
+"""
+
+import asyncio
+import itertools
+import json
+import time
+from typing import Any, Dict, List, Optional
+
+from logger.logger import logger
+
+
+class SnapshotSidecarError(Exception):
+    pass
+
+
+class SnapshotSidecarUnavailable(SnapshotSidecarError):
+    """Raised when a request could not be handed to the sidecar at all"""
+
+
+class SnapshotSidecar:
+    REQUEST_TIMEOUT = 5 * 60
+    START_TIMEOUT = 30
+    MIN_RESTART_DELAY = 1.0
+    MAX_RESTART_DELAY = 30.0
+    # A process that ran at least this long resets the restart backoff
+    HEALTHY_UPTIME = 60
+    STREAM_LIMIT = 2**20
+
+    def __init__(
+        self,
+        command: List[str],
+        env: Optional[Dict[str, str]] = None,
+        cwd: Optional[str] = None,
+    ):
+        """
+        Parameters:
+        command (List[str]): The command starting the sidecar, e.g. ["node", "./snapshot/sidecar.js"].
+        env (Optional[Dict[str, str]]): Environment of the process.
+        cwd (Optional[str]): Working directory of the process.
+        """
+        self.command = command
+        self.env = env
+        self.cwd = cwd
+        self.restarts = 0
+        self._process: Optional[asyncio.subprocess.Process] = None
+        self._ready = asyncio.Event()
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._supervisor: Optional[asyncio.Task] = None
+        self._stopping = False
+
+    async def start(self) -> None:
+        """Start the sidecar and its supervisor, if they are not running yet"""
+        if self._supervisor is None or self._supervisor.done():
+            self._stopping = False
+            self._supervisor = asyncio.create_task(self._supervise())
+
+    async def stop(self) -> None:
+        """Stop the sidecar without restarting it"""
+        self._stopping = True
+        if self._process and self._process.returncode is None:
+            self._process.stdin.close()
+            try:
+                await asyncio.wait_for(self._process.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self._process.kill()
+        if self._supervisor:
+            self._supervisor.cancel()
+
+    async def request(
+        self, op: str, params: Dict[str, Any], timeout: Optional[float] = None
+    ) -> Any:
+        """
+        Send an operation to the sidecar and wait for its result.
+
+        Parameters:
+        op (str): The operation, "modify_space" or "create_proposal".
+        params (Dict[str, Any]): JSON-serializable parameters of the operation.
+        timeout (Optional[float]): Seconds to wait for the result, REQUEST_TIMEOUT by default.
+
+        Returns:
+        Any: The result of the operation.
+
+        Raises:
+        SnapshotSidecarError: If the operation failed, timed out or the sidecar exited.
+        """
+        await self.start()
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=self.START_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise SnapshotSidecarUnavailable("Snapshot sidecar is not running")
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        line = json.dumps({"id": request_id, "op": op, "params": params}) + "\n"
+        try:
+            self._process.stdin.write(line.encode())
+            await self._process.stdin.drain()
+            return await asyncio.wait_for(
+                future, timeout=timeout or self.REQUEST_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            raise SnapshotSidecarError(f"Snapshot sidecar timed out running {op}")
+        except (BrokenPipeError, ConnectionResetError) as e:
+            raise SnapshotSidecarUnavailable(f"Snapshot sidecar is not reachable: {e}")
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def modify_space(self, quorum_value: int) -> bool:
+        """Set the quorum of the Snapshot space. Returns whether the settings were updated"""
+        return await self.request("modify_space", {"quorum": quorum_value})
+
+    async def create_proposal(
+        self, title: str, body: str, choices: List[str]
+    ) -> Optional[Dict[str, Any]]:
+        """Create a Snapshot proposal. Returns the receipt, or None if it was not created"""
+        return await self.request(
+            "create_proposal", {"title": title, "body": body, "choices": choices}
+        )
+
+    async def _supervise(self) -> None:
+        delay = self.MIN_RESTART_DELAY
+        while not self._stopping:
+            started = time.monotonic()
+            try:
+                self._process = await asyncio.create_subprocess_exec(
+                    *self.command,
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                    env=self.env,
+                    cwd=self.cwd,
+                    limit=self.STREAM_LIMIT,
+                )
+                logger.info(f"Started Snapshot sidecar (pid {self._process.pid})")
+                self._ready.set()
+                await asyncio.gather(
+                    self._read_responses(self._process.stdout),
+                    self._forward_stderr(self._process.stderr),
+                )
+                returncode = await self._process.wait()
+                logger.error(f"Snapshot sidecar exited with code {returncode}")
+            except Exception as e:
+                logger.error(f"Error running Snapshot sidecar: {e}")
+            finally:
+                self._ready.clear()
+                # Reading can fail while the process still runs, e.g. on a line longer than STREAM_LIMIT
+                process = self._process
+                if process is not None and process.returncode is None:
+                    process.kill()
+                    await process.wait()
+                for future in self._pending.values():
+                    if not future.done():
+                        future.set_exception(
+                            SnapshotSidecarError("Snapshot sidecar exited")
+                        )
+
+            if self._stopping:
+                break
+            if time.monotonic() - started >= self.HEALTHY_UPTIME:
+                delay = self.MIN_RESTART_DELAY
+            logger.info(f"Restarting Snapshot sidecar in {delay:.0f}s")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.MAX_RESTART_DELAY)
+            self.restarts += 1
+
+    async def _read_responses(self, stdout: asyncio.StreamReader) -> None:
+        async for line in stdout:
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                logger.error(f"Invalid response from Snapshot sidecar: {line!r}")
+                continue
+
+            future = self._pending.get(response.get("id"))
+            if future is None or future.done():
+                continue
+            if response.get("ok"):
+                future.set_result(response.get("result"))
+            else:
+                future.set_exception(SnapshotSidecarError(response.get("error")))
+
+    async def _forward_stderr(self, stderr: asyncio.StreamReader) -> None:
+        async for line in stderr:
+            logger.info(f"snapshot: {line.decode(errors='replace').rstrip()}")
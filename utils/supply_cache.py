@@ -0,0 +1,105 @@
+"""
+The SupplyCache class keeps the latest XP total supply, together with the block number it was read at,
+so the quorum of a passed proposal is computed without an on-chain read on the conclusion path.
+
+A background task refreshes the supply on an interval. Readers get the cached value unless it is older than
+max_age, in which case a refresh is forced first.
+"""
+
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+
+from logger.logger import logger
+
+
+class SupplyCache:
+    def __init__(
+        self,
+        fetch_supply: Callable[[], Awaitable[Tuple[int, float]]],
+        refresh_interval: float = 10 * 60,
+        max_age: float = 60 * 60,
+    ):
+        """
+        Parameters:
+        fetch_supply (Callable): Coroutine function returning the block number and the total supply at that block.
+        refresh_interval (float): Seconds between background refreshes.
+        max_age (float): Seconds after which a cached supply is too stale to use without refreshing.
+        """
+        self.fetch_supply = fetch_supply
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        # block number -> total supply; only the latest block is kept
+        self._supply: Dict[int, float] = {}
+        self._block: Optional[int] = None
+        self._fetched_at: Optional[float] = None
+        self._refreshing: Optional[asyncio.Task] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start refreshing the supply in the background"""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def age(self) -> Optional[float]:
+        """Seconds since the cached supply was read, or None if nothing is cached"""
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    async def refresh(self) -> float:
+        """Read the supply now. Concurrent callers share one read"""
+        if self._refreshing is None or self._refreshing.done():
+            self._refreshing = asyncio.create_task(self._refresh())
+        return await asyncio.shield(self._refreshing)
+
+    async def get_supply(self) -> float:
+        """Return the cached total supply, refreshing it first if it is missing or older than max_age"""
+        age = self.age()
+        if age is None or age > self.max_age:
+            logger.info("Cached XP supply is missing or stale; refreshing it")
+            return await self.refresh()
+        return self._supply[self._block]
+
+    async def get_quorum(self, percentage: int = 20) -> int:
+        """
+        Return the quorum value for Snapshot proposals from the cached supply.
+
+        Parameters:
+        percentage (int): The percentage of the total supply to set as the quorum value (default 20).
+
+        Returns:
+        int: The quorum value.
+        """
+        total_supply = await self.get_supply()
+        quorum = int((total_supply * percentage) // 100)
+        logger.info(
+            f"{percentage}% of the total supply at block {self._block} is {quorum}."
+        )
+        return quorum
+
+    def stats(self) -> Dict[str, Optional[float]]:
+        return {
+            "block": self._block,
+            "supply": self._supply.get(self._block),
+            "age": self.age(),
+        }
+
+    async def _refresh(self) -> float:
+        block, supply = await self.fetch_supply()
+        if self._block is None or block >= self._block:
+            self._supply = {block: supply}
+            self._block = block
+        self._fetched_at = time.monotonic()
+        logger.info(
+            f"XP total supply at block {self._block}: {self._supply[self._block]}"
+        )
+        return self._supply[self._block]
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.error(f"Error refreshing XP total supply: {e}")
+            await asyncio.sleep(self.refresh_interval)
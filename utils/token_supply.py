@@ -0,0 +1,119 @@
+"""
+The TokenSupplyReader class reads the totalSupply() and decimals() of every XP token in a single round trip.
+
+All calls, plus the block number they ran at, are aggregated into one Multicall3 aggregate3 eth_call. On chains
+or endpoints where Multicall3 is not deployed, the same calls are sent as one JSON-RPC batch instead, or
+concurrently where batches are rejected. Reads are asynchronous and never block the event loop.
+Reads go through the providers of the RPC endpoints, which are reused so their HTTP sessions stay alive
+between reads, and the call data is encoded once up front.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Sequence, Tuple
+
+from eth_abi import decode, encode
+from web3 import Web3
+from web3.providers import AsyncBaseProvider
+
+from logger.logger import logger
+
+# Multicall3 is deployed at the same address on Ethereum, Arbitrum, Sepolia and most other chains
+MULTICALL3_ADDRESS = Web3.to_checksum_address(
+    "0xcA11bde05977b3631167028862bE2a173976CA11"
+)
+
+
+def _selector(signature: str) -> bytes:
+    return bytes(Web3.keccak(text=signature)[:4])
+
+
+TOTAL_SUPPLY = _selector("totalSupply()")
+DECIMALS = _selector("decimals()")
+GET_BLOCK_NUMBER = _selector("getBlockNumber()")
+AGGREGATE3 = _selector("aggregate3((address,bool,bytes)[])")
+
+
+class MulticallUnavailable(Exception):
+    pass
+
+
+class TokenSupplyReader:
+    def __init__(self, token_addresses: List[str]):
+        """
+        Parameters:
+        token_addresses (List[str]): Addresses of the tokens whose supplies are summed.
+        """
+        self.tokens = [
+            Web3.to_checksum_address(address.strip())
+            for address in token_addresses
+            if address.strip()
+        ]
+        # (target, allowFailure, callData): the block number first, then totalSupply and decimals per token
+        self._calls = [(MULTICALL3_ADDRESS, False, GET_BLOCK_NUMBER)] + [
+            (token, False, selector)
+            for token in self.tokens
+            for selector in (TOTAL_SUPPLY, DECIMALS)
+        ]
+        self._multicall_data = Web3.to_hex(
+            AGGREGATE3 + encode(["(address,bool,bytes)[]"], [self._calls])
+        )
+        self._multicall_available: Dict[int, bool] = {}
+
+    async def read(self, provider: AsyncBaseProvider) -> Tuple[int, float]:
+        """
+        Read the total supply of all tokens from one provider.
+
+        Returns:
+        Tuple[int, float]: The block number and the summed supply, scaled by each token's decimals.
+        """
+        if self._multicall_available.get(id(provider), True):
+            try:
+                return await self._read_multicall(provider)
+            except MulticallUnavailable:
+                logger.info(f"Multicall3 is not available on {provider}; using batches")
+                self._multicall_available[id(provider)] = False
+        return await self._read_batch(provider)
+
+    @staticmethod
+    def total_supply(values: Sequence[int]) -> float:
+        """Sum supplies from alternating totalSupply and decimals values"""
+        return sum(
+            supply / 10**decimals
+            for supply, decimals in zip(values[0::2], values[1::2])
+        )
+
+    async def _read_multicall(self, provider: AsyncBaseProvider) -> Tuple[int, float]:
+        response = await provider.make_request(
+            "eth_call",
+            [{"to": MULTICALL3_ADDRESS, "data": self._multicall_data}, "latest"],
+        )
+        result = self._result(response)
+        if result in (None, "0x"):
+            # No contract at the Multicall3 address
+            raise MulticallUnavailable()
+
+        (returns,) = decode(["(bool,bytes)[]"], Web3.to_bytes(hexstr=result))
+        values = [decode(["uint256"], data)[0] for _, data in returns]
+        return values[0], self.total_supply(values[1:])
+
+    async def _read_batch(self, provider: AsyncBaseProvider) -> Tuple[int, float]:
+        requests = [("eth_blockNumber", [])] + [
+            ("eth_call", [{"to": target, "data": Web3.to_hex(data)}, "latest"])
+            for target, _, data in self._calls[1:]
+        ]
+        responses = await provider.make_batch_request(requests)
+        if not isinstance(responses, list):
+            # The endpoint rejects batches: send the calls concurrently instead
+            logger.info(f"Batch request rejected by {provider}: {responses}")
+            responses = await asyncio.gather(
+                *(provider.make_request(method, params) for method, params in requests)
+            )
+
+        values = [int(self._result(response), 16) for response in responses]
+        return values[0], self.total_supply(values[1:])
+
+    @staticmethod
+    def _result(response: Dict[str, Any]) -> Any:
+        if "error" in response:
+            raise ValueError(f"RPC error: {response['error']}")
+        return response.get("result")
@@ -0,0 +1,102 @@
+"""
+The UserCache class resolves Discord users with as few REST calls as possible.
+
+Lookups check the gateway cache (bot.get_user) first, then a size-bounded LRU of previously fetched users
+whose entries expire after a TTL. Concurrent lookups of the same uncached ID share one in-flight
+bot.fetch_user request. Hit and miss counters are exposed through stats().
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import discord
+from discord.ext import commands
+
+
+class UserCache:
+    def __init__(self, bot: commands.Bot, maxsize: int = 1000, ttl: float = 3600):
+        """
+        Parameters:
+        bot (commands.Bot): The bot used to resolve users.
+        maxsize (int): Maximum number of fetched users to keep.
+        ttl (float): Seconds a fetched user is served from the cache.
+        """
+        self.bot = bot
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._users: "OrderedDict[int, Tuple[float, discord.User]]" = OrderedDict()
+        self._inflight: Dict[int, asyncio.Task] = {}
+        self.gateway_hits = 0
+        self.hits = 0
+        self.misses = 0
+        self.collapsed = 0
+
+    async def get_user(self, user_id: int) -> discord.User:
+        """
+        Resolve a user by ID.
+
+        Parameters:
+        user_id (int): The ID of the user.
+
+        Returns:
+        discord.User: The user.
+
+        Raises:
+        discord.NotFound: If the user does not exist.
+        """
+        user = self.bot.get_user(user_id)
+        if user:
+            self.gateway_hits += 1
+            return user
+
+        user = self._get_cached(user_id)
+        if user:
+            self.hits += 1
+            return user
+
+        task = self._inflight.get(user_id)
+        if task:
+            self.collapsed += 1
+        else:
+            self.misses += 1
+            task = asyncio.create_task(self._fetch(user_id))
+            self._inflight[user_id] = task
+        return await asyncio.shield(task)
+
+    def invalidate(self, user_id: int) -> None:
+        self._users.pop(user_id, None)
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters"""
+        return {
+            "size": len(self._users),
+            "gateway_hits": self.gateway_hits,
+            "hits": self.hits,
+            "misses": self.misses,
+            "collapsed": self.collapsed,
+        }
+
+    def _get_cached(self, user_id: int) -> Optional[discord.User]:
+        entry = self._users.get(user_id)
+        if entry is None:
+            return None
+        expires_at, user = entry
+        if expires_at <= time.monotonic():
+            del self._users[user_id]
+            return None
+        self._users.move_to_end(user_id)
+        return user
+
+    async def _fetch(self, user_id: int) -> discord.User:
+        try:
+            user = await self.bot.fetch_user(user_id)
+        finally:
+            self._inflight.pop(user_id, None)
+
+        self._users[user_id] = (time.monotonic() + self.ttl, user)
+        self._users.move_to_end(user_id)
+        while len(self._users) > self.maxsize:
+            self._users.popitem(last=False)
+        return user
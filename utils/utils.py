@@ -2,39 +2,45 @@
 utils contains utility functions that are used across multiple modules in the bot.
 
 The module contains the following functions:
+- run_snapshot_script: Run a Node script from snapshot/ as a non-blocking subprocess with a timeout.
 - modify_space_settings: Modify the settings of the Snapshot space.
 - create_snapshot_proposal: Create a Snapshot proposal.
 - fetch_XP_total_supply: Fetch the total supply of XP tokens.
+- fetch_XP_supply_at_block: Fetch the total supply of XP tokens and the block it was read at.
 - fetch_XP_quorum: Fetch the quorum value for Snapshot proposals.
 - get_proposal_url: Fetch the URL of the Snapshot proposal or space.
 - get_channel_by_name: Soft match a channel name from consts/constants.py to a channel in the guild.
 - get_forum_channel_by_name: Retrieve a ForumChannel in a guild based on its name, with support for a fallback channel name.
 - get_guild_member_check_role: Check if the guild member who invoked the command has the 'core' role.
 - update_json_file: Update emotes/contributors.json with the new contributor and emoji ID mapping.
-- send_dm_once: Sends a direct message to a contributor if they are mentioned in a message.
+- send_dm_once: Queues a direct message to a contributor if they are mentioned in a message.
 - load_posted_events: Load the event IDs that have already been posted to Discord from the JSON file.
 - load_contributors_and_emoji_dicts: Load the contributors and emoji dictionaries from the JSON file.
 """
 
+import aiohttp
+import asyncio
 import discord
 import json
 import subprocess
 import os
-from typing import Any, Dict, Optional
-from web3 import Web3
+import time
+from typing import Any, Dict, List, Optional, Tuple
 
 import config.config as cfg
 from logger.logger import logger
 from discord.ext import commands
-
-env = os.environ.copy()
+from utils.channel_index import ChannelIndex
+from utils.permissions import PermissionCache
+from utils.rpc_endpoints import RpcEndpointManager
+from utils.token_supply import TokenSupplyReader
 
 
 class DiscordUtils:
     @staticmethod
     async def get_channel_by_name(guild, channel_name: str):
         """
-        Get a channel by name from a guild.
+        Get a channel by name from a guild, falling back to the name in CONSTANT_FALLBACK_MAPPING.
 
         Parameters:
         guild (discord.Guild): The guild to search in
@@ -46,7 +52,7 @@ class DiscordUtils:
         Raises:
         ValueError: If channel is not found
         """
-        channel = discord.utils.get(guild.channels, name=channel_name)
+        channel = ChannelIndex.get(guild, channel_name)
         if not channel:
             raise ValueError(
                 f"Channel '{channel_name}' not found in guild {guild.name}"
@@ -56,49 +62,144 @@ class DiscordUtils:
     @staticmethod
     async def get_guild_member_check_role(interaction: discord.Interaction) -> bool:
         """Check if the guild member who invoked the command has the 'core' role"""
-        member = await interaction.guild.fetch_member(interaction.user.id)
-        if any(role.name.lower() == "core" for role in member.roles):
+        if await PermissionCache.is_core(interaction):
             return True
-        await interaction.followup.send(
-            "You do not have permission to use this command."
-        )
+        message = "You do not have permission to use this command."
+        if interaction.response.is_done():
+            await interaction.followup.send(message)
+        else:
+            await interaction.response.send_message(message)
         return False
 
     @staticmethod
-    async def send_dm_once(
-        bot: discord.Client, user: discord.User, message_link: str
-    ) -> None:
-        """Sends a direct message to a contributor if they are mentioned in a message"""
-        try:
-            dm_message = f"Hello {user.display_name}! You have been mentioned in this message! {message_link}"
-            await user.send(dm_message)
-        except Exception as e:
-            logger.error(e)
+    def send_dm_once(bot: discord.Client, user_id: int, message_link: str) -> None:
+        """
+        Queue a direct message to a contributor mentioned in a message.
+        Delivery happens in the background, and repeated mentions of the same user are folded into one DM.
+        """
+        bot.dm_notifier.notify(user_id, message_link)
 
 
 class SnapshotUtils:
+    SCRIPT_TIMEOUT = 3 * 60
+    # script name -> runs, failures, timeouts and last_duration of run_snapshot_script calls
+    script_stats: Dict[str, Dict[str, float]] = {}
+
     @staticmethod
-    def fetch_XP_quorum(percentage: int = 20) -> int:
+    def snapshot_env() -> Dict[str, str]:
+        """Environment for the Node scripts in snapshot/, including the Snapshot space settings"""
+        env = os.environ.copy()
+        env.update(
+            {
+                "SNAPSHOT_HUB": cfg.SNAPSHOT_HUB,
+                "SNAPSHOT_SPACE": cfg.SNAPSHOT_SPACE,
+                "NETWORK_ID": cfg.NETWORK_ID,
+                "SETTINGS_NAME": cfg.SETTINGS_NAME,
+                "SETTINGS_ABOUT": cfg.SETTINGS_ABOUT,
+                "SETTINGS_AVATAR": cfg.SETTINGS_AVATAR,
+                "SETTINGS_SYMBOL": cfg.SETTINGS_SYMBOL,
+                "SETTINGS_MEMBERS": ",".join(cfg.SETTINGS_MEMBERS),
+                "SETTINGS_ADMINS": ",".join(cfg.SETTINGS_ADMINS),
+                "SETTINGS_STRATEGIES": cfg.SETTINGS_STRATEGIES,
+            }
+        )
+        # Unset RPC URLs are left to the scripts' .env file; a None value would make the subprocess fail to start
+        for key, value in (
+            ("PRIMARY_RPC_URL", cfg.PRIMARY_RPC_URL),
+            ("SECONDARY_RPC_URL", cfg.SECONDARY_RPC_URL),
+        ):
+            if value:
+                env[key] = value
+        return env
+
+    @staticmethod
+    async def run_snapshot_script(
+        args: List[str], result_prefix: Optional[str] = None
+    ) -> Optional[Any]:
         """
-        Fetch the quorum value for Snapshot proposals.
+        Run one of the Node scripts in snapshot/ as an asyncio subprocess.
+        Stdout is parsed as it streams, so a result line is read as soon as it is printed, and stderr is
+        forwarded to the logger. The script is killed when it runs longer than SCRIPT_TIMEOUT or the
+        calling task is cancelled. Exit status and duration are logged and counted in script_stats.
 
         Parameters:
-        percentage (int): The percentage of the total supply to set as the quorum value (default 20).
+        args (List[str]): The script path followed by its arguments.
+        result_prefix (Optional[str]): Prefix of the stdout line carrying a JSON result.
 
         Returns:
-        int: The quorum value for Snapshot proposals.
+        Optional[Any]: The parsed result, or None if no result line was printed.
+
+        Raises:
+        subprocess.CalledProcessError: If the script exits with a non-zero status.
+        subprocess.TimeoutExpired: If the script does not finish within SCRIPT_TIMEOUT.
         """
-        total_supply = Utils.fetch_XP_total_supply()
-        if total_supply is None:
-            logger.error("Failed to fetch total supply.")
-            return None
+        script = os.path.basename(args[0])
+        stats = SnapshotUtils.script_stats.setdefault(
+            script, {"runs": 0, "failures": 0, "timeouts": 0, "last_duration": 0.0}
+        )
+        stats["runs"] += 1
+        command = ["node", *args]
+        result = None
+        started = time.monotonic()
+
+        async def read_stdout(stream: asyncio.StreamReader) -> None:
+            nonlocal result
+            async for raw_line in stream:
+                line = raw_line.decode(errors="replace").rstrip()
+                if result_prefix and line.startswith(result_prefix):
+                    try:
+                        result = json.loads(line[len(result_prefix) :])
+                        logger.info(f"{script} returned {result}")
+                    except json.JSONDecodeError:
+                        logger.error(f"Failed to parse {script} result: {line}")
+                else:
+                    logger.info(f"{script}: {line}")
+
+        async def read_stderr(stream: asyncio.StreamReader) -> None:
+            async for raw_line in stream:
+                logger.error(f"{script}: {raw_line.decode(errors='replace').rstrip()}")
+
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            env=SnapshotUtils.snapshot_env(),
+            limit=2**20,
+        )
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    read_stdout(process.stdout),
+                    read_stderr(process.stderr),
+                    process.wait(),
+                ),
+                timeout=SnapshotUtils.SCRIPT_TIMEOUT,
+            )
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            logger.error(
+                f"{script} did not finish within {SnapshotUtils.SCRIPT_TIMEOUT}s; killing it"
+            )
+            if result is not None:
+                # The result was printed before the script hung; it is still valid
+                return result
+            raise subprocess.TimeoutExpired(command, SnapshotUtils.SCRIPT_TIMEOUT)
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            stats["last_duration"] = time.monotonic() - started
+            logger.info(
+                f"{script} exited with status {process.returncode} after {stats['last_duration']:.1f}s"
+            )
 
-        quorum = int((total_supply * percentage) // 100)
-        logger.info(f"{percentage}% of the total supply is {quorum}.")
-        return quorum
+        if process.returncode != 0:
+            stats["failures"] += 1
+            raise subprocess.CalledProcessError(process.returncode, command)
+        return result
 
     @staticmethod
-    def modify_space_settings(quorum_value):
+    async def modify_space_settings(quorum_value):
         """
         Modify the settings of the Snapshot space.
 
@@ -108,27 +209,17 @@ class SnapshotUtils:
         Raises:
         subprocess.CalledProcessError: If the subprocess call to modify the space settings fails.
         """
-        command = ["node", "./snapshot/modify_space.js", str(quorum_value)]
-        env["SNAPSHOT_HUB"] = cfg.SNAPSHOT_HUB
-        env["SNAPSHOT_SPACE"] = cfg.SNAPSHOT_SPACE
-        env["NETWORK_ID"] = cfg.NETWORK_ID
-        env["SETTINGS_NAME"] = cfg.SETTINGS_NAME
-        env["SETTINGS_ABOUT"] = cfg.SETTINGS_ABOUT
-        env["SETTINGS_AVATAR"] = cfg.SETTINGS_AVATAR
-        env["SETTINGS_SYMBOL"] = cfg.SETTINGS_SYMBOL
-        env["SETTINGS_MEMBERS"] = ",".join(cfg.SETTINGS_MEMBERS)
-        env["SETTINGS_ADMINS"] = ",".join(cfg.SETTINGS_ADMINS)
-        env["SETTINGS_STRATEGIES"] = cfg.SETTINGS_STRATEGIES
-
         try:
-            subprocess.run(command, check=True, env=env)
+            await SnapshotUtils.run_snapshot_script(
+                ["./snapshot/modify_space.js", str(quorum_value)]
+            )
             logger.info("Snapshot space settings modified successfully.")
-        except subprocess.CalledProcessError as e:
+        except subprocess.SubprocessError as e:
             logger.error(f"Error modifying snapshot space settings: {e}")
             raise
 
     @staticmethod
-    def create_snapshot_proposal(
+    async def create_snapshot_proposal(
         proposal_data: Dict[str, Any], title: str
     ) -> Optional[object]:
         """Create a Snapshot proposal with structured sections"""
@@ -138,53 +229,80 @@ class SnapshotUtils:
             content = sections.get("content", "")
             resultPrefix = "RESULT: "
 
-            proposal_command = [
-                "node",
-                "./snapshot/wrapper.js",
-                title,
-                json.dumps({"messages": [content]}),
-                resultPrefix,
-                "Adopt",
-                "Reassess",
-                "Abstain",
-            ]
-
-            env = os.environ.copy()
-            env.update(
-                {
-                    "SNAPSHOT_HUB": cfg.SNAPSHOT_HUB,
-                    "SNAPSHOT_SPACE": cfg.SNAPSHOT_SPACE,
-                    "NETWORK_ID": cfg.NETWORK_ID,
-                    "PRIMARY_RPC_URL": cfg.PRIMARY_RPC_URL,
-                    "SECONDARY_RPC_URL": cfg.SECONDARY_RPC_URL,
-                }
-            )
-
-            receipt = None
-            result = subprocess.run(
-                proposal_command, check=True, env=env, capture_output=True, text=True
+            receipt = await SnapshotUtils.run_snapshot_script(
+                [
+                    "./snapshot/wrapper.js",
+                    title,
+                    json.dumps({"messages": [content]}),
+                    resultPrefix,
+                    "Adopt",
+                    "Reassess",
+                    "Abstain",
+                ],
+                result_prefix=resultPrefix,
             )
 
-            for line in result.stdout.splitlines():
-                if line.startswith(resultPrefix):  # Identify result line
-                    try:
-                        receipt = json.loads(line[len(resultPrefix) :])
-                        print("Parsed receipt:", receipt)
-                    except json.JSONDecodeError:
-                        print("Failed to parse JSON:", line)
-                        logger.info("Snapshot proposal created successfully.")
-
             if receipt == None:
                 logger.info("No receipt was returned")
+            else:
+                logger.info("Snapshot proposal created successfully.")
 
             return receipt
-        except subprocess.CalledProcessError as e:
+        except subprocess.SubprocessError as e:
             logger.error(f"Error creating snapshot proposal: {e}")
             raise
         except Exception as e:
             logger.error(f"Unexpected error creating snapshot proposal: {e}")
             raise
 
+    @staticmethod
+    async def find_proposal_id(title: str) -> Optional[str]:
+        """
+        Look up a proposal of the Snapshot space by its exact title on the Snapshot hub.
+
+        Parameters:
+        title (str): The title of the proposal
+
+        Returns:
+        Optional[str]: The ID of the newest proposal with the title, or None if there is none
+
+        Raises:
+        aiohttp.ClientError: If the hub cannot be queried
+        ValueError: If the hub returns errors
+        """
+        query = """
+            query Proposals($space: String!, $title: String!) {
+                proposals(
+                    first: 20
+                    orderBy: "created"
+                    orderDirection: desc
+                    where: {space: $space, title_contains: $title}
+                ) {
+                    id
+                    title
+                }
+            }
+        """
+        async with aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as session:
+            async with session.post(
+                f"{cfg.SNAPSHOT_HUB.rstrip('/')}/graphql",
+                json={
+                    "query": query,
+                    "variables": {"space": cfg.SNAPSHOT_SPACE, "title": title},
+                },
+            ) as response:
+                response.raise_for_status()
+                data = await response.json()
+
+        if data.get("errors"):
+            raise ValueError(f"Snapshot hub returned errors: {data['errors']}")
+        for proposal in data["data"]["proposals"]:
+            if proposal["title"] == title:
+                return proposal["id"]
+        return None
+
     @staticmethod
     def get_proposal_url(id: Optional[str], use_testnet: bool) -> str:
         """
@@ -235,7 +353,7 @@ class SnapshotUtils:
                 logger.error(f"Error fetching Discord quorum: {e}")
                 return 5
         else:
-            total_supply = Utils.fetch_XP_total_supply()
+            total_supply = await Utils.fetch_XP_total_supply()
             if total_supply is None:
                 logger.error("Failed to fetch total supply.")
                 return None
@@ -246,66 +364,56 @@ class SnapshotUtils:
 
 
 class Utils:
+    _rpc_endpoints: Optional[RpcEndpointManager] = None
+    _supply_reader: Optional[TokenSupplyReader] = None
+
     @staticmethod
-    def fetch_XP_total_supply() -> float:
+    async def fetch_XP_total_supply() -> float:
         """Fetch total XP supply with fallback and better error handling"""
         try:
-            logger.info(f"Attempting to connect to PRIMARY_RPC: {cfg.PRIMARY_RPC_URL}")
-            w3 = Web3(
-                Web3.HTTPProvider(cfg.PRIMARY_RPC_URL, request_kwargs={"timeout": 10})
-            )
-            if not w3.is_connected():
-                logger.error("Failed to connect to PRIMARY_RPC")
-                logger.info(
-                    f"Attempting to connect to SECONDARY_RPC: {cfg.SECONDARY_RPC_URL}"
-                )
-                w3 = Web3(
-                    Web3.HTTPProvider(
-                        cfg.SECONDARY_RPC_URL, request_kwargs={"timeout": 10}
-                    )
-                )
-                if not w3.is_connected():
-                    logger.error("Failed to connect to SECONDARY_RPC")
-                    return 0
-
-            total_supply = 0
-            # Basic ERC20 totalSupply ABI
-            abi = [
-                {
-                    "constant": True,
-                    "inputs": [],
-                    "name": "totalSupply",
-                    "outputs": [{"name": "", "type": "uint256"}],
-                    "payable": False,
-                    "stateMutability": "view",
-                    "type": "function",
-                }
-            ]
-
-            for address in cfg.SETTINGS_TOKEN_ADDRESSES:
-                try:
-                    contract = w3.eth.contract(
-                        address=Web3.to_checksum_address(address.strip()), abi=abi
-                    )
-                    supply = contract.functions.totalSupply().call()
-                    total_supply += supply
-                    logger.info(
-                        f"Successfully fetched supply for token {address}: {supply}"
-                    )
-                except Exception as e:
-                    logger.error(f"Error fetching supply for token {address}: {e}")
-                    continue
-
-            return float(total_supply) / (10**18)
-
+            return (await Utils.fetch_XP_supply_at_block())[1]
         except Exception as e:
             logger.error(f"Error fetching XP total supply: {e}")
             return 0
 
+    @staticmethod
+    async def fetch_XP_supply_at_block() -> Tuple[int, float]:
+        """
+        Fetch the total XP supply at the latest block from the fastest healthy RPC endpoint,
+        hedging to the other endpoint when it is slow.
+        Every token is read in one Multicall3 call at the same block, so the sum is consistent.
+
+        Returns:
+        Tuple[int, float]: The block number and the total supply at that block.
+
+        Raises:
+        ConnectionError: If neither RPC endpoint returned the supplies.
+        """
+        reader = Utils.supply_reader()
+        return await Utils.rpc_endpoints().request(
+            lambda endpoint: reader.read(endpoint.provider)
+        )
+
+    @staticmethod
+    def rpc_endpoints() -> RpcEndpointManager:
+        """Return the shared RpcEndpointManager for PRIMARY_RPC_URL and SECONDARY_RPC_URL"""
+        if Utils._rpc_endpoints is None:
+            Utils._rpc_endpoints = RpcEndpointManager.from_urls(
+                {"PRIMARY": cfg.PRIMARY_RPC_URL, "SECONDARY": cfg.SECONDARY_RPC_URL}
+            )
+        return Utils._rpc_endpoints
+
+    @staticmethod
+    def supply_reader() -> TokenSupplyReader:
+        """Return the shared TokenSupplyReader for the configured XP tokens"""
+        if Utils._supply_reader is None:
+            Utils._supply_reader = TokenSupplyReader(cfg.SETTINGS_TOKEN_ADDRESSES)
+        return Utils._supply_reader
+
     @staticmethod
     def get_channel_by_name(guild, channel_name: str):
         """
-        Get a channel by name from a guild.
+        Get a channel by name from a guild, falling back to the name in CONSTANT_FALLBACK_MAPPING.
 
         Parameters:
         guild (discord.Guild): The guild to search in
@@ -317,7 +425,7 @@ class Utils:
         Raises:
         ValueError: If channel is not found
         """
-        channel = discord.utils.get(guild.channels, name=channel_name)
+        channel = ChannelIndex.get(guild, channel_name)
         if not channel:
             raise ValueError(
                 f"Channel '{channel_name}' not found in guild {guild.name}"